@@ -0,0 +1,72 @@
+"""
+Benchmark CLI startup: importing the CLI with and without the generated API client.
+
+Each scenario runs in a fresh interpreter. "eager sonarr_api" loads every API
+class and model of the generated package, which every command paid for before
+the package and the plugin registry became lazy. Generated models build their
+validators on first use; set SONARR_API_EAGER_BUILD=1 to compare with building
+them all at import. Run from the repository root:
+
+    python -m benchmarks.import_time --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import CLI": "import src.main",
+    "import CLI + sonarr plugin": (
+        "import src.main\n"
+        "from src.plugins.registry import get_registry\n"
+        "get_registry().get('sonarr')"
+    ),
+    "import CLI + sonarr plugin + warm models": (
+        "import src.main\n"
+        "from src.plugins.base import warm_models\n"
+        "from src.plugins.registry import get_registry\n"
+        "class _Client:\n"
+        "    supports_bulk = True\n"
+        "warm_models(get_registry().get('sonarr').get_all_resource_definitions(_Client()))"
+    ),
+    "import CLI + eager sonarr_api": (
+        "import src.main\n"
+        "import sonarr_api\n"
+        "for name in sonarr_api.__all__:\n"
+        "    getattr(sonarr_api, name)"
+    ),
+}
+
+# Appended to each scenario to report its import time and loaded generated modules
+_REPORT = (
+    "\nimport json, sys, time\n"
+    "print(json.dumps({'seconds': time.perf_counter() - _start, "
+    "'modules': sum(1 for m in sys.modules if m.split('.')[0] == 'sonarr_api')}))"
+)
+
+
+def run_scenario(code: str) -> dict:
+    """Run a scenario in a fresh interpreter and return its timing report."""
+    program = "import time\n_start = time.perf_counter()\n" + code + _REPORT
+    output = subprocess.run(
+        [sys.executable, "-c", program], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per scenario")
+    args = parser.parse_args()
+
+    print(f"{'Scenario':<44}{'Median':>10}{'sonarr_api modules':>20}")
+    for name, code in SCENARIOS.items():
+        reports = [run_scenario(code) for _ in range(args.repeat)]
+        median = statistics.median(report["seconds"] for report in reports)
+        print(f"{name:<44}{median * 1000:>8.0f}ms{reports[-1]['modules']:>20}")
+
+
+if __name__ == "__main__":
+    main()
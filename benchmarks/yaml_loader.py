@@ -0,0 +1,119 @@
+"""
+Benchmark config parsing with the pure-Python and libyaml-based loaders.
+
+Generates a large config (a shared custom format library included by several
+instances, like a guide-derived setup) and times `load_yaml_config` with each
+loader. Run from the repository root:
+
+    python -m benchmarks.yaml_loader --formats 2000 --instances 5
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from src.utils.yaml_loader import CIncludeLoader, PyIncludeLoader, load_yaml_config
+
+
+def generate_config(directory: Path, formats: int, instances: int) -> Path:
+    """
+    Write a config with a shared custom format library.
+
+    Args:
+        directory: Directory to write the files to
+        formats: Number of custom formats in the library
+        instances: Number of instances including the library
+
+    Returns:
+        Path of the root config file
+    """
+    definitions = [
+        {
+            "name": f"Format {index}",
+            "include_custom_format_when_renaming": index % 2 == 0,
+            "specifications": [
+                {
+                    "name": f"Release title {index}",
+                    "implementation": "ReleaseTitleSpecification",
+                    "negate": False,
+                    "required": True,
+                    "fields": {"value": rf"\b(group{index}|alias{index}|tag{index})\b"},
+                },
+                {
+                    "name": "Not 4K",
+                    "implementation": "ResolutionSpecification",
+                    "negate": True,
+                    "required": True,
+                    "fields": {"value": 8},
+                },
+            ],
+        }
+        for index in range(formats)
+    ]
+    library = directory / "custom_formats.yaml"
+    library.write_text(yaml.safe_dump(definitions, sort_keys=False), encoding="utf-8")
+
+    lines = ["sonarr:"]
+    for index in range(instances):
+        lines += [
+            f"  - name: instance{index}",
+            f"    base_url: http://sonarr{index}:8989",
+            "    api_key: benchmark",
+            "    custom_formats:",
+            "      definitions: !include custom_formats.yaml",
+        ]
+    root = directory / "config.yaml"
+    root.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return root
+
+
+def time_loader(config_path: Path, loader_class: type, repeat: int) -> list[float]:
+    """Load the config `repeat` times and return each duration in seconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load_yaml_config(config_path, loader_class=loader_class)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--formats", type=int, default=2000, help="Custom formats in the library")
+    parser.add_argument("--instances", type=int, default=5, help="Instances including it")
+    parser.add_argument("--repeat", type=int, default=5, help="Loads per loader")
+    args = parser.parse_args()
+
+    loaders = [("pure Python", PyIncludeLoader)]
+    if CIncludeLoader is not None:
+        loaders.append(("libyaml", CIncludeLoader))
+    else:
+        print("PyYAML was built without libyaml; only the pure-Python loader is available")
+
+    with tempfile.TemporaryDirectory() as directory:
+        config_path = generate_config(Path(directory), args.formats, args.instances)
+        size = sum(path.stat().st_size for path in Path(directory).iterdir())
+        print(
+            f"Config: {args.formats} custom formats, {args.instances} instances, "
+            f"{size / 1024:.0f} KB"
+        )
+
+        results = {}
+        for name, loader_class in loaders:
+            results[name] = statistics.median(time_loader(config_path, loader_class, args.repeat))
+            print(f"  {name:<12} {results[name] * 1000:8.1f} ms (median of {args.repeat})")
+
+        # Both loaders must produce the same data
+        if CIncludeLoader is not None:
+            assert load_yaml_config(config_path, loader_class=PyIncludeLoader) == load_yaml_config(
+                config_path, loader_class=CIncludeLoader
+            )
+            print(f"  speedup      {results['pure Python'] / results['libyaml']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""On-disk cache of validated configs, so unchanged configs skip YAML parsing and validation."""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import pydantic
+
+from src.core import config_schema, deadline
+from src.core.config_schema import ConfigarrConfig
+from src.core.profiling import phase
+from src.plugins.sonarr import schema as sonarr_schema
+from src.shared import schemas as shared_schemas
+from src.utils import env, yaml_loader
+from src.utils.logger import get_logger
+from src.utils.yaml_loader import load_yaml_config
+
+logger = get_logger("config_cache")
+
+# Bump when the layout of cache entries changes
+CACHE_FORMAT = 1
+
+# Modules defining how configs are parsed (includes, env interpolation) and validated,
+# including the defaults baked into validated configs; editing them invalidates every entry
+_SCHEMA_MODULES = (config_schema, sonarr_schema, shared_schemas, deadline, yaml_loader, env)
+
+
+@dataclass
+class CacheEntry:
+    """
+    A validated config together with everything it was built from.
+
+    Attributes:
+        runtime: Fingerprint of the Python and pydantic versions and the schema and loader modules
+        files: SHA-256 of the root config file and of every included file, by path
+        env: SHA-256 of the value of every referenced env var (None if unset), by name
+        included_files: Files included by the root config
+        config: The validated config
+    """
+
+    runtime: str
+    files: dict[str, str]
+    env: dict[str, Optional[str]]
+    included_files: list[Path]
+    config: ConfigarrConfig
+
+
+def load_config(
+    config_path: Path | str,
+    cache_dir: Optional[Path | str] = None,
+    included_files: Optional[list[Path]] = None,
+) -> ConfigarrConfig:
+    """
+    Load and validate a config file, reusing the cached result if nothing changed.
+
+    An entry is reused only if the root file, every file it includes and the
+    values of the env vars they reference are byte-for-byte unchanged, and the
+    config schema, loader, pydantic and Python versions are the same. Entries
+    are pickles readable only by their owner, since they hold interpolated
+    secrets. As loading a pickle can run code, entries are only read from a
+    cache directory owned by the current user and not writable by anyone else.
+
+    Args:
+        config_path: Path to the YAML config file
+        cache_dir: Directory of the cache (None disables caching)
+        included_files: List to which the path of every included file is appended
+
+    Returns:
+        Validated config
+
+    Raises:
+        FileNotFoundError: If the config file (or an included file) doesn't exist
+        yaml.YAMLError: If YAML parsing fails
+        ValueError: If referenced env vars don't exist
+        ValidationError: If the config is invalid
+    """
+    config_path = Path(config_path)
+    cache_file = _cache_file(config_path, cache_dir) if cache_dir else None
+
+    if cache_file is not None:
+        entry = _read_entry(cache_file)
+        if entry is not None and _is_fresh(entry):
+            logger.debug(f"Loaded validated config from cache {cache_file}")
+            if included_files is not None:
+                included_files.extend(entry.included_files)
+            return entry.config
+
+    included: list[Path] = []
+    env_vars: set[str] = set()
+    raw_config = load_yaml_config(config_path, included, env_vars=env_vars)
+    with phase("validate"):
+        config = ConfigarrConfig(**raw_config)
+    if included_files is not None:
+        included_files.extend(included)
+
+    if cache_file is not None:
+        try:
+            entry = _build_entry(config_path, included, env_vars, config)
+        except OSError as e:
+            logger.debug(f"Not caching config: {e}")
+        else:
+            _write_entry(cache_file, entry)
+    return config
+
+
+def log_config_error(error: Exception) -> None:
+    """Log why a config (or a file it includes) could not be loaded."""
+    if isinstance(error, pydantic.ValidationError):
+        logger.error("✗ Config validation failed:")
+        for item in error.errors():
+            loc = " -> ".join(str(part) for part in item["loc"])
+            logger.error(f"    {loc}: {item['msg']}")
+    elif isinstance(error, FileNotFoundError):
+        logger.error(f"✗ File not found: {error.filename}" if error.filename else f"✗ {error}")
+    else:
+        logger.error(f"✗ Failed to load config: {error}")
+
+
+def _runtime_fingerprint() -> str:
+    """Fingerprint everything besides the inputs that a cached entry depends on."""
+    parts = [str(CACHE_FORMAT), sys.version, pydantic.VERSION]
+    for module in _SCHEMA_MODULES:
+        stat = os.stat(module.__file__)
+        parts.append(f"{module.__name__}:{stat.st_mtime_ns}:{stat.st_size}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _cache_file(config_path: Path, cache_dir: Path | str) -> Path:
+    """Get the cache entry path of a config file."""
+    key = hashlib.sha256(str(config_path.resolve()).encode("utf-8")).hexdigest()[:32]
+    return Path(cache_dir) / "config_cache" / f"{key}.pickle"
+
+
+def _hash_value(value: Optional[str]) -> Optional[str]:
+    """Hash an env var value (None if unset), so no secret is stored in the clear."""
+    return hashlib.sha256(value.encode("utf-8")).hexdigest() if value is not None else None
+
+
+def _build_entry(
+    config_path: Path, included: list[Path], env_vars: set[str], config: ConfigarrConfig
+) -> CacheEntry:
+    """Record the inputs a config was built from."""
+    files = {
+        str(Path(path).resolve()): hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        for path in [config_path, *included]
+    }
+    return CacheEntry(
+        runtime=_runtime_fingerprint(),
+        files=files,
+        env={name: _hash_value(os.getenv(name)) for name in sorted(env_vars)},
+        included_files=[Path(path).resolve() for path in included],
+        config=config,
+    )
+
+
+def _is_fresh(entry: CacheEntry) -> bool:
+    """Check whether the inputs of a cache entry are unchanged."""
+    if entry.runtime != _runtime_fingerprint():
+        return False
+    for name, value_hash in entry.env.items():
+        if _hash_value(os.getenv(name)) != value_hash:
+            return False
+    for path, file_hash in entry.files.items():
+        try:
+            if hashlib.sha256(Path(path).read_bytes()).hexdigest() != file_hash:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _is_private(directory: Path) -> bool:
+    """Check that a directory is owned by the current user and writable by no one else."""
+    try:
+        stat = os.stat(directory)
+    except OSError:
+        return False
+    owned = not hasattr(os, "getuid") or stat.st_uid == os.getuid()
+    return owned and not stat.st_mode & 0o022
+
+
+def _read_entry(cache_file: Path) -> Optional[CacheEntry]:
+    """Read a cache entry (None if missing, unreadable or in an unsafe directory)."""
+    if not cache_file.exists():
+        return None
+    if not _is_private(cache_file.parent):
+        logger.warning(
+            f"Ignoring config cache in {cache_file.parent}: the directory must be owned by "
+            f"the current user and not writable by others"
+        )
+        return None
+    try:
+        with open(cache_file, "rb") as f:
+            entry = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable config cache {cache_file}: {e}")
+        return None
+    return entry if isinstance(entry, CacheEntry) else None
+
+
+def _write_entry(cache_file: Path, entry: CacheEntry) -> None:
+    """Write a cache entry atomically, readable only by the current user."""
+    try:
+        cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not _is_private(cache_file.parent):
+            logger.debug(f"Not caching config in shared directory {cache_file.parent}")
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        logger.debug(f"Could not write config cache {cache_file}: {e}")
@@ -0,0 +1,132 @@
+"""Request timeouts and deadlines bounding how long a run may take."""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+# Seconds to wait for a connection to be established / for the server to answer
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 60.0
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when work is started after its deadline has passed."""
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """
+    Point in time by which some work must be finished.
+
+    Attributes:
+        expires_at: Expiry on the `time.monotonic()` clock
+        label: What the deadline bounds (e.g., "run", "instance 'main'")
+    """
+
+    expires_at: float
+    label: str
+
+    def remaining(self) -> float:
+        """Seconds left until the deadline (0 once it has passed)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return time.monotonic() >= self.expires_at
+
+    def check(self) -> None:
+        """
+        Raise if the deadline has passed.
+
+        Raises:
+            DeadlineExceeded: If the deadline has passed
+        """
+        if self.expired:
+            raise DeadlineExceeded(f"{self.label} deadline exceeded")
+
+
+# Deadline of the work running in the current context (copied into worker threads)
+_current_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    "deadline", default=None
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Get the deadline of the current context, or None if unbounded."""
+    return _current_deadline.get()
+
+
+def check_deadline() -> None:
+    """
+    Raise if the current context's deadline has passed.
+
+    Raises:
+        DeadlineExceeded: If the deadline has passed
+    """
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.check()
+
+
+@contextmanager
+def deadline(seconds: Optional[float], label: str) -> Iterator[Optional[Deadline]]:
+    """
+    Bound the work done inside the block to `seconds`.
+
+    Deadlines nest: an inner deadline never extends an outer one, so a
+    per-instance deadline is cut short by the deadline of the whole run.
+
+    Args:
+        seconds: Time budget, or None to only inherit the enclosing deadline
+        label: What the deadline bounds, used in error messages
+
+    Yields:
+        The deadline in effect inside the block (None if unbounded)
+    """
+    outer = _current_deadline.get()
+    if seconds is None:
+        yield outer
+        return
+
+    inner = Deadline(time.monotonic() + seconds, label)
+    if outer is not None and outer.expires_at <= inner.expires_at:
+        inner = outer
+
+    token = _current_deadline.set(inner)
+    try:
+        yield inner
+    finally:
+        _current_deadline.reset(token)
+
+
+def request_timeout(
+    timeout: Optional[float | tuple[float, float]],
+) -> Optional[float | tuple[float, float]]:
+    """
+    Clamp a request timeout to the time left until the current deadline.
+
+    Args:
+        timeout: Total timeout, (connect, read) pair, or None for no timeout
+
+    Returns:
+        Timeout in the same form, no longer than the remaining time
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return timeout
+
+    deadline.check()
+    # Never 0: the generated REST client treats a falsy timeout as "no timeout"
+    remaining = max(deadline.remaining(), 0.001)
+    if timeout is None:
+        return remaining
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return (min(connect, remaining), min(read, remaining))
+    return min(timeout, remaining)
@@ -1,7 +1,7 @@
 """Diff utilities for comparing desired and current state."""
 
-from dataclasses import dataclass
-from typing import Any, Generic, TypeVar
+from dataclasses import dataclass, field
+from typing import Any, Generic, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -15,11 +15,13 @@ class ChangeSet(Generic[T]):
         to_create: Items that need to be created
         to_update: Tuples of (current_item, desired_item) that need updates
         to_delete: Items that need to be deleted
+        changed_fields: Match key -> names of the fields that differ, for updates
     """
 
     to_create: list[T]
     to_update: list[tuple[dict[str, Any], T]]  # (current, desired)
     to_delete: list[dict[str, Any]]
+    changed_fields: dict[str, list[str]] = field(default_factory=dict)
 
     def __bool__(self) -> bool:
         """Return True if there are any changes."""
@@ -45,40 +47,66 @@ def compute_diff(
     current: list[dict[str, Any]],
     desired: list[Any],
     match_key_fn: callable,
-    needs_update_fn: callable,
+    needs_update_fn: Optional[callable] = None,
     delete_unmanaged: bool = False,
+    digest_fn: Optional[callable] = None,
+    diff_fields_fn: Optional[callable] = None,
+    comparable_fn: Optional[callable] = None,
 ) -> ChangeSet:
     """
     Compare current server state with desired YAML state and compute changes.
 
+    When `digest_fn` is given, each item is digested once and matched pairs with
+    equal digests are skipped without a field-by-field comparison, so diffing is
+    linear in the total size of the items.
+
     Args:
         current: List of current resources from server (as dicts)
         desired: List of desired resources from YAML
         match_key_fn: Function to extract match key from an item
         needs_update_fn: Function(current_dict, desired_dict) -> bool
         delete_unmanaged: Whether to delete items not in desired state
+        digest_fn: Optional function(item) -> canonical digest of the comparable fields
+        diff_fields_fn: Optional function(current_dict, desired_dict) -> differing field
+            names; used instead of needs_update_fn and recorded in the ChangeSet
+        comparable_fn: Optional function(desired_item) -> dict used for matching and
+            comparison, for desired items that wrap their comparable form (default:
+            the item itself)
 
     Returns:
         ChangeSet with items to create, update, and delete
     """
+    comparable_fn = comparable_fn or (lambda item: item)
+
     # Build lookup maps by match key
     current_map = {match_key_fn(item): item for item in current}
-    desired_map = {match_key_fn(item): item for item in desired}
+    desired_map = {match_key_fn(comparable_fn(item)): item for item in desired}
 
     to_create = []
     to_update = []
     to_delete = []
+    changed_fields = {}
 
     # Find items to create or update
     for key, desired_item in desired_map.items():
         if key not in current_map:
             # Doesn't exist on server -> create
             to_create.append(desired_item)
-        else:
-            # Exists on server -> check if update needed
-            current_item = current_map[key]
-            if needs_update_fn(current_item, desired_item):
+            continue
+
+        # Exists on server -> check if update needed
+        current_item = current_map[key]
+        desired_comparable = comparable_fn(desired_item)
+        if digest_fn and digest_fn(current_item) == digest_fn(desired_comparable):
+            continue
+
+        if diff_fields_fn:
+            fields = diff_fields_fn(current_item, desired_comparable)
+            if fields:
                 to_update.append((current_item, desired_item))
+                changed_fields[key] = fields
+        elif needs_update_fn(current_item, desired_comparable):
+            to_update.append((current_item, desired_item))
 
     # Find items to delete (if enabled)
     if delete_unmanaged:
@@ -86,4 +114,9 @@ def compute_diff(
             if key not in desired_map:
                 to_delete.append(current_item)
 
-    return ChangeSet(to_create=to_create, to_update=to_update, to_delete=to_delete)
+    return ChangeSet(
+        to_create=to_create,
+        to_update=to_update,
+        to_delete=to_delete,
+        changed_fields=changed_fields,
+    )
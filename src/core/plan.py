@@ -0,0 +1,663 @@
+"""Serializable sync plans: computed once by `plan`, applied later by `apply` without re-diffing."""
+
+import importlib
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from src.core.config_cache import load_config
+from src.core.deadline import deadline
+from src.core.diff import ChangeSet
+from src.core.pool import get_pool_registry
+from src.core.preflight import DEFAULT_PREFLIGHT_TIMEOUT
+from src.core.profiling import phase
+from src.core.reconciler import DesiredItem, Reconciler
+from src.core.scheduler import DependencyScheduler
+from src.core.snapshot import InstanceSnapshot
+from src.core.state import DEFAULT_STATE_DIR, StateStore
+from src.core.sync import (
+    InstanceConnection,
+    InstanceResult,
+    collect_instances,
+    connect_instance,
+    deadline_exceeded,
+    get_instance_deadline,
+    log_summary,
+    preflight_instances,
+    sync_instances,
+)
+from src.plugins.base import warm_models
+from src.plugins.registry import get_registry
+from src.shared.schemas import ConnectionConfig
+from src.utils.env import env_var_reference, get_env_var, instance_env_var
+from src.utils.logger import buffered_logs, get_logger
+from src.utils.yaml_loader import load_yaml_config
+
+logger = get_logger("plan")
+
+PLAN_VERSION = 1
+
+
+@dataclass
+class PlannedChange:
+    """
+    A single planned create, update or delete.
+
+    Attributes:
+        action: "create", "update" or "delete"
+        name: Match key of the resource (e.g., its name)
+        id: Server ID of the resource (updates and deletes)
+        model: API payload of the desired resource (creates and updates)
+        fields: Names of the fields that differ (updates)
+    """
+
+    action: str
+    name: str
+    id: Optional[int] = None
+    model: Optional[dict[str, Any]] = None
+    fields: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ResourcePlan:
+    """
+    Planned changes for one resource type of an instance.
+
+    Attributes:
+        name: Resource type name (e.g., "custom_formats")
+        fingerprint: Fingerprint of the server's resources the plan was computed against
+        desired_hash: Canonical hash of the section's YAML configuration
+        model_type: Import path of the API model class of the payloads
+        depends_on: Resource types this one depends on
+        concurrency: Maximum number of parallel API writes
+        deferred: True if a dependency has planned creates/deletes, so this section's
+            mapped IDs are not final and it must be planned again after applying
+        changes: Planned changes, in application order
+    """
+
+    name: str
+    fingerprint: str
+    desired_hash: str
+    model_type: Optional[str] = None
+    depends_on: list[str] = field(default_factory=list)
+    concurrency: int = 1
+    deferred: bool = False
+    changes: list[PlannedChange] = field(default_factory=list)
+
+    @property
+    def alters_ids(self) -> bool:
+        """Whether applying this plan creates or deletes resources (changing their IDs)."""
+        return any(change.action in ("create", "delete") for change in self.changes)
+
+    def record(self, changeset: ChangeSet[DesiredItem], mapper) -> None:
+        """
+        Store a computed ChangeSet in the plan.
+
+        Args:
+            changeset: Changes computed by the reconciler
+            mapper: ResourceMapper of the resource type
+        """
+        models = [item.model for item in changeset.to_create]
+        models.extend(item.model for _, item in changeset.to_update)
+        if models:
+            model_class = type(models[0])
+            self.model_type = f"{model_class.__module__}.{model_class.__qualname__}"
+
+        for item in changeset.to_create:
+            self.changes.append(
+                PlannedChange(
+                    action="create",
+                    name=mapper.get_match_key(item.comparable),
+                    model=item.model.to_dict(),
+                )
+            )
+        for current_dict, item in changeset.to_update:
+            name = mapper.get_match_key(item.comparable)
+            self.changes.append(
+                PlannedChange(
+                    action="update",
+                    name=name,
+                    id=current_dict["id"],
+                    model=item.model.to_dict(),
+                    fields=list(changeset.changed_fields.get(name, [])),
+                )
+            )
+        for current_dict in changeset.to_delete:
+            self.changes.append(
+                PlannedChange(
+                    action="delete", name=mapper.get_match_key(current_dict), id=current_dict["id"]
+                )
+            )
+
+    def to_changeset(self, mapper, current_models: list) -> ChangeSet[DesiredItem]:
+        """
+        Rebuild the ChangeSet of this plan.
+
+        Args:
+            mapper: ResourceMapper of the resource type
+            current_models: Current resources on the server (API models or raw JSON
+                dicts, matching the fingerprint)
+
+        Returns:
+            ChangeSet ready for `Reconciler.apply()`
+
+        Raises:
+            ValueError: If a planned resource no longer exists on the server
+        """
+        model_class = _import_class(self.model_type) if self.model_type else None
+        current = {
+            current_dict["id"]: current_dict
+            for current_dict in map(mapper.from_api_item, current_models)
+        }
+
+        def desired(change: PlannedChange) -> DesiredItem:
+            model = model_class.from_dict(change.model)
+            return DesiredItem(None, model, mapper.from_api_model(model))
+
+        def existing(change: PlannedChange) -> dict[str, Any]:
+            if change.id not in current:
+                raise ValueError(f"{change.name} (ID: {change.id}) no longer exists on the server")
+            return current[change.id]
+
+        changeset = ChangeSet(to_create=[], to_update=[], to_delete=[])
+        for change in self.changes:
+            if change.action == "create":
+                changeset.to_create.append(desired(change))
+            elif change.action == "update":
+                changeset.to_update.append((existing(change), desired(change)))
+                changeset.changed_fields[change.name] = change.fields
+            elif change.action == "delete":
+                changeset.to_delete.append(existing(change))
+            else:
+                raise ValueError(f"Unknown planned action: {change.action}")
+        return changeset
+
+
+@dataclass
+class InstancePlan:
+    """
+    Planned changes for one instance.
+
+    API keys are never written to the plan; `api_key_env` names the environment
+    variable the config reads the key from (see `find_api_key_env_vars`).
+
+    Attributes:
+        plugin: Plugin name (e.g., "sonarr")
+        instance: Instance name
+        base_url: Server URL
+        api_key_env: Environment variable holding the API key
+        connection: Connection settings of the instance (None for the defaults)
+        resources: Per resource type plans (only types with changes)
+    """
+
+    plugin: str
+    instance: str
+    base_url: Optional[str] = None
+    api_key_env: Optional[str] = None
+    connection: Optional[ConnectionConfig] = None
+    resources: list[ResourcePlan] = field(default_factory=list)
+
+    def resource(self, name: str) -> Optional[ResourcePlan]:
+        """Get the plan of a resource type, or None if it has no planned changes."""
+        return next((resource for resource in self.resources if resource.name == name), None)
+
+    def set_target(self, base_url: str, connection: Optional[ConnectionConfig] = None) -> None:
+        """Record the server the plan is computed against and how to connect to it."""
+        self.base_url = base_url
+        self.connection = connection
+
+    def add_resource(
+        self,
+        resource_def,
+        fingerprint: str,
+        desired_hash: str,
+        concurrency: int,
+        changeset: Optional[ChangeSet[DesiredItem]],
+    ) -> None:
+        """
+        Add the changes computed for a resource type.
+
+        Args:
+            resource_def: ResourceDefinition of the resource type
+            fingerprint: Fingerprint of the server's resources the changes were computed against
+            desired_hash: Canonical hash of the section's YAML configuration
+            concurrency: Maximum number of parallel API writes
+            changeset: Changes computed by the reconciler (None if the section is not configured)
+        """
+        # IDs mapped from a dependency are not final while that dependency has pending
+        # creates/deletes; such sections must be planned again once it is applied
+        deferred = any(
+            (dep_plan := self.resource(dep)) is not None and dep_plan.alters_ids
+            for dep in resource_def.depends_on
+        )
+        if not changeset and not deferred:
+            return
+
+        resource_plan = ResourcePlan(
+            name=resource_def.name,
+            fingerprint=fingerprint,
+            desired_hash=desired_hash,
+            depends_on=list(resource_def.depends_on),
+            concurrency=concurrency,
+            deferred=deferred,
+        )
+        if changeset:
+            resource_plan.record(changeset, resource_def.mapper)
+        if deferred:
+            logger.warning(
+                f"  {resource_def.name} depends on pending changes; run plan again after applying"
+            )
+        self.resources.append(resource_plan)
+
+
+@dataclass
+class Plan:
+    """
+    A complete plan for a config file, as written by `configarr plan`.
+
+    Attributes:
+        config_path: Config file the plan was computed from
+        created_at: Unix timestamp of the plan
+        instances: Per-instance plans
+        version: Plan file format version
+    """
+
+    config_path: str
+    created_at: float = field(default_factory=time.time)
+    instances: list[InstancePlan] = field(default_factory=list)
+    version: int = PLAN_VERSION
+
+    def __bool__(self) -> bool:
+        """Return True if any instance has planned changes."""
+        return any(
+            resource.changes or resource.deferred
+            for instance in self.instances
+            for resource in instance.resources
+        )
+
+    def save(self, path: Path | str) -> None:
+        """Write the plan as JSON."""
+        Path(path).write_text(
+            json.dumps(asdict(self), indent=2, default=_to_json), encoding="utf-8"
+        )
+
+    @classmethod
+    def load(cls, path: Path | str) -> "Plan":
+        """
+        Read a plan written by `save()`.
+
+        Raises:
+            FileNotFoundError: If the plan file does not exist
+            ValueError: If the file is not a plan of a supported version
+        """
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if not isinstance(data, dict) or data.get("version") != PLAN_VERSION:
+            raise ValueError(f"Unsupported plan file format (expected version {PLAN_VERSION})")
+
+        instances = []
+        for instance in data["instances"]:
+            resources = []
+            for resource in instance.pop("resources"):
+                changes = [PlannedChange(**change) for change in resource.pop("changes")]
+                resources.append(ResourcePlan(**resource, changes=changes))
+            connection = instance.pop("connection", None)
+            instances.append(
+                InstancePlan(
+                    **instance,
+                    connection=ConnectionConfig(**connection) if connection else None,
+                    resources=resources,
+                )
+            )
+        data["instances"] = instances
+        return cls(**data)
+
+
+def find_api_key_env_vars(config_path: Path) -> dict[tuple[str, str], str]:
+    """
+    Get the env var each instance of a config reads its API key from.
+
+    Keys configured as an env var reference (e.g., "${SONARR_KEY}") are read from
+    that variable, and keys that are not configured from the variable named by
+    the `<PLUGIN>_<INSTANCE>_API_KEY` convention. A key written in the config
+    itself cannot be stored in a plan, so it is also read from the convention's
+    variable when the plan is applied (with a warning).
+
+    Args:
+        config_path: Path to the (valid) YAML config file
+
+    Returns:
+        Env var name by (plugin name, instance name)
+    """
+    raw_config = load_yaml_config(config_path, interpolate=False)
+    env_vars = {}
+    for plugin_name in get_registry().list_names():
+        for instance in raw_config.get(plugin_name) or []:
+            name = instance["name"]
+            api_key = instance.get("api_key")
+            env_var = env_var_reference(api_key)
+            if env_var is None:
+                env_var = instance_env_var(plugin_name.upper(), name, "API_KEY")
+                if api_key:
+                    logger.warning(
+                        f"API key of {plugin_name}/{name} is written in the config; "
+                        f"apply will read it from {env_var}"
+                    )
+            env_vars[(plugin_name, name)] = env_var
+    return env_vars
+
+
+def _to_json(value: Any) -> Any:
+    """Serialize values `json` does not handle (settings models, paths, ...)."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return str(value)
+
+
+def _import_class(path: str) -> type:
+    """Import a class from its "module.ClassName" path."""
+    module_name, _, class_name = path.rpartition(".")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def plan_config(
+    config_path: Path,
+    output: Path,
+    jobs: int = 1,
+    full: bool = False,
+    state_dir: Optional[Path] = DEFAULT_STATE_DIR,
+    preflight_timeout: float = DEFAULT_PREFLIGHT_TIMEOUT,
+    instance_deadline: Optional[float] = None,
+) -> int:
+    """
+    Compute the changes for every instance and write them to a plan file.
+
+    Args:
+        config_path: Path to the YAML config file
+        output: Path of the plan file to write
+        jobs: Maximum number of instances to plan concurrently
+        full: Plan every section, even those unchanged since the last sync
+        state_dir: Directory of the incremental sync state and config cache (None disables them)
+        preflight_timeout: Seconds to wait for each preflight probe request
+        instance_deadline: Default time limit in seconds of each instance
+
+    Returns:
+        0 on success, 1 if any instance failed (no plan is written then)
+
+    Raises:
+        FileNotFoundError: If the config file (or an included file) doesn't exist
+        ValidationError: If the config is invalid
+    """
+    logger.info(f"Loading config file: {config_path}")
+    config = load_config(config_path, state_dir)
+    api_key_env_vars = find_api_key_env_vars(config_path)
+
+    def new_plan(plugin_name: str, instance_name: str) -> InstancePlan:
+        return InstancePlan(
+            plugin_name, instance_name, api_key_env=api_key_env_vars[(plugin_name, instance_name)]
+        )
+
+    state = StateStore(state_dir) if state_dir else None
+    try:
+        results = sync_instances(
+            collect_instances(config),
+            True,
+            True,
+            jobs,
+            state=state,
+            full=full,
+            new_plan=new_plan,
+            preflight_timeout=preflight_timeout,
+            instance_deadline=instance_deadline,
+        )
+    finally:
+        if state:
+            state.close()
+    log_summary(results)
+
+    if not all(result.success for result in results):
+        logger.error("\n✗ Some instances failed to plan; no plan written")
+        return 1
+
+    plan = Plan(
+        config_path=str(config_path),
+        instances=[result.plan for result in results if result.plan.resources],
+    )
+    plan.save(output)
+    if plan:
+        logger.info(f"\n✓ Plan written to {output}")
+    else:
+        logger.info(f"\n✓ No changes needed; empty plan written to {output}")
+    return 0
+
+
+def connect_planned(plugin, instance_plan: InstancePlan, timeout: float) -> InstanceConnection:
+    """
+    Create and probe a client for an instance of a plan.
+
+    The plan stores no API keys, so the key is read from the env var recorded
+    in the plan; the client uses the connection settings the instance had when
+    planned.
+
+    Raises:
+        ValueError: If the API key is not in the environment
+        Exception: If the server is unreachable or rejects the API key
+    """
+    env_var = instance_plan.api_key_env or instance_env_var(
+        plugin.name.upper(), instance_plan.instance, "API_KEY"
+    )
+    api_key = get_env_var(env_var, required=True)
+
+    pool_size = max(
+        len(instance_plan.resources), sum(rp.concurrency for rp in instance_plan.resources)
+    )
+    return connect_instance(
+        plugin, instance_plan.base_url, api_key, pool_size, timeout, instance_plan.connection
+    )
+
+
+def apply_instance(
+    plugin,
+    instance_plan: InstancePlan,
+    connection: InstanceConnection,
+    state: Optional[StateStore] = None,
+) -> bool:
+    """
+    Apply the planned changes of a single instance.
+
+    Only the list endpoints of resource types with planned changes are fetched,
+    to check that their fingerprints still match the plan; a resource type that
+    changed on the server since the plan was made is not applied.
+
+    Returns:
+        True on success, False on error
+    """
+    instance_name = instance_plan.instance
+
+    logger.info(f"\n{'='*60}")
+    logger.info(f"Applying plan to {plugin.display_name} instance: {instance_name}")
+    logger.info(f"{'='*60}\n")
+
+    client = connection.client
+    resource_plans = {rp.name: rp for rp in instance_plan.resources}
+
+    with client:
+        definitions = {
+            rd.name: rd
+            for rd in plugin.get_all_resource_definitions(client)
+            if rd.name in resource_plans
+        }
+        with phase("warm_models"):
+            warm_models(definitions.values())
+        snapshot = InstanceSnapshot()
+        for name in resource_plans:
+            if not resource_plans[name].deferred:
+                snapshot.register_definition(definitions[name])
+                definitions[name] = snapshot.bind(definitions[name])
+        snapshot.prefetch()
+
+        def apply_resource(name: str) -> bool:
+            resource_plan = resource_plans[name]
+            resource_def = definitions[name]
+            with buffered_logs():
+                if deadline_exceeded(name):
+                    return False
+
+                if resource_plan.deferred:
+                    logger.warning(
+                        f"Skipping {name}: planned against pending dependency changes; "
+                        "run plan again"
+                    )
+                    return True
+
+                try:
+                    if snapshot.fingerprint(name) != resource_plan.fingerprint:
+                        logger.error(
+                            f"✗ {name} changed on the server since the plan was made; "
+                            "run plan again"
+                        )
+                        return False
+                    changeset = resource_plan.to_changeset(resource_def.mapper, snapshot.get(name))
+                except Exception as e:
+                    logger.error(f"  ✗ Failed to prepare {name}: {e}")
+                    return False
+
+                logger.info(f"{name}: {changeset.summary()}")
+                reconciler = Reconciler(
+                    resource_name=name,
+                    mapper=resource_def.mapper,
+                    list_fn=resource_def.list_fn,
+                    create_fn=resource_def.create_fn,
+                    update_fn=resource_def.update_fn,
+                    delete_fn=resource_def.delete_fn,
+                    max_workers=resource_plan.concurrency,
+                    bulk_update_fn=resource_def.bulk_update_fn,
+                    bulk_delete_fn=resource_def.bulk_delete_fn,
+                    bulk_chunk_size=resource_def.bulk_chunk_size,
+                )
+                reconciler.apply(changeset)
+
+                # Record the section so the next sync can skip it if nothing changes
+                if state and not reconciler.errors:
+                    try:
+                        state.record(
+                            plugin.name,
+                            instance_name,
+                            name,
+                            resource_plan.desired_hash,
+                            snapshot.fingerprint(name),
+                        )
+                    except Exception as e:
+                        logger.debug(f"Could not record sync state for {name}: {e}")
+                return True
+
+        graph = {rp.name: rp.depends_on for rp in instance_plan.resources}
+        results = DependencyScheduler().run(graph, apply_resource)
+        if not all(results.values()):
+            return False
+
+    logger.info(f"\n✓ Successfully applied plan to {plugin.display_name} instance: {instance_name}")
+    return True
+
+
+def apply_plan(
+    plan_path: Path,
+    state_dir: Optional[Path] = DEFAULT_STATE_DIR,
+    preflight_timeout: float = DEFAULT_PREFLIGHT_TIMEOUT,
+    instance_deadline: Optional[float] = None,
+) -> int:
+    """
+    Apply a plan file written by `plan_config`.
+
+    Args:
+        plan_path: Path to the plan file
+        state_dir: Directory of the incremental sync state (None disables it)
+        preflight_timeout: Seconds to wait for each preflight probe request
+        instance_deadline: Default time limit in seconds of each instance
+
+    Returns:
+        0 on success, 1 if any instance failed
+
+    Raises:
+        FileNotFoundError: If the plan file does not exist
+        ValueError: If the file is not a plan of a supported version
+    """
+    logger.info(f"Loading plan file: {plan_path}")
+    plan = Plan.load(plan_path)
+    if not plan:
+        logger.info("✓ Plan contains no changes")
+        return 0
+
+    results = _apply_instances(plan, state_dir, preflight_timeout, instance_deadline)
+    log_summary(results)
+    get_pool_registry().log_stats()
+
+    if all(result.success for result in results):
+        logger.info("\n✓ Plan applied successfully")
+        return 0
+    else:
+        logger.error("\n✗ Some instances failed to apply")
+        return 1
+
+
+def _apply_instances(
+    plan: Plan,
+    state_dir: Optional[Path],
+    preflight_timeout: float,
+    instance_deadline: Optional[float],
+) -> list[InstanceResult]:
+    """
+    Apply the plan of every instance, one at a time, after probing them all.
+
+    Returns:
+        One InstanceResult per instance plan, in plan order
+    """
+    registry = get_registry()
+    plugins = [registry.get(instance_plan.plugin) for instance_plan in plan.instances]
+    with phase("preflight"):
+        connections = preflight_instances(
+            [
+                (
+                    plugin,
+                    instance_plan.instance,
+                    partial(connect_planned, plugin, instance_plan, preflight_timeout),
+                )
+                for plugin, instance_plan in zip(plugins, plan.instances)
+            ]
+        )
+
+    results = []
+    state = StateStore(state_dir) if state_dir else None
+    try:
+        for plugin, instance_plan, connection in zip(plugins, plan.instances, connections):
+            start = time.perf_counter()
+            if isinstance(connection, Exception):
+                success = False
+            else:
+                try:
+                    with deadline(
+                        get_instance_deadline(instance_plan, instance_deadline),
+                        f"instance '{instance_plan.instance}'",
+                    ):
+                        success = apply_instance(plugin, instance_plan, connection, state=state)
+                except Exception as e:
+                    logger.error(
+                        f"✗ Unexpected error applying plan to '{instance_plan.instance}': {e}"
+                    )
+                    success = False
+            results.append(
+                InstanceResult(
+                    plugin_name=plugin.display_name,
+                    instance_name=instance_plan.instance,
+                    success=success,
+                    duration=time.perf_counter() - start,
+                )
+            )
+    finally:
+        if state:
+            state.close()
+    return results
@@ -0,0 +1,140 @@
+"""Process-wide registry of HTTP connection pools, shared by all API clients of a run."""
+
+import threading
+from dataclasses import dataclass
+from typing import Callable, Hashable
+from urllib.parse import urlsplit
+
+import urllib3
+
+from src.utils.logger import get_logger
+
+logger = get_logger("pool")
+
+DEFAULT_POOL_SIZE = 4
+
+
+@dataclass
+class PoolStats:
+    """
+    Usage statistics of the connection pool of one host.
+
+    Attributes:
+        key: Origin of the host (e.g., "http://localhost:8989")
+        maxsize: Maximum number of idle connections kept open
+        connections: Number of connections opened so far
+        requests: Number of requests sent so far
+    """
+
+    key: str
+    maxsize: int
+    connections: int
+    requests: int
+
+
+def origin(url: str) -> str:
+    """
+    Get the origin (scheme, host and port) of a URL, used as the pool key.
+
+    Args:
+        url: Any URL on the host (e.g., "http://localhost:8989/api")
+
+    Returns:
+        Normalized origin, e.g. "http://localhost:8989"
+    """
+    parts = urlsplit(url)
+    scheme = (parts.scheme or "http").lower()
+    port = parts.port or (443 if scheme == "https" else 80)
+    return f"{scheme}://{(parts.hostname or '').lower()}:{port}"
+
+
+class ConnectionPoolRegistry:
+    """
+    Hands out one urllib3 pool manager per host, so every client of a run reuses
+    the same keep-alive connections (and TLS sessions) instead of opening its own.
+
+    Pool sizes are reserved per host before the pool is first used, typically
+    from the configured write concurrency, so concurrent requests do not open
+    (and then discard) connections beyond the pool's capacity.
+    """
+
+    def __init__(self):
+        self._managers: dict[tuple[str, Hashable], urllib3.PoolManager] = {}
+        self._sizes: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, url: str, size: int) -> None:
+        """
+        Ask for a host's pool to hold at least `size` connections.
+
+        Only affects pools created afterwards, so reserve before a host's first
+        request.
+
+        Args:
+            url: Any URL on the host
+            size: Number of connections expected to be in use at once
+        """
+        key = origin(url)
+        with self._lock:
+            if size > self._sizes.get(key, 0):
+                self._sizes[key] = size
+
+    def get(
+        self, url: str, factory: Callable[[int], urllib3.PoolManager], settings: Hashable = None
+    ) -> urllib3.PoolManager:
+        """
+        Get the shared pool manager of a host, creating it on first use.
+
+        Args:
+            url: Any URL on the host
+            factory: Callable building a pool manager with the given maxsize
+            settings: Connection settings (TLS, proxy) that must match for a pool to
+                be shared; clients with different settings get separate pools
+
+        Returns:
+            Pool manager shared by all callers with the same host and settings
+        """
+        key = origin(url)
+        with self._lock:
+            manager = self._managers.get((key, settings))
+            if manager is None:
+                size = self._sizes.setdefault(key, DEFAULT_POOL_SIZE)
+                manager = factory(size)
+                self._managers[(key, settings)] = manager
+                logger.debug(f"Created connection pool for {key} (maxsize {size})")
+            return manager
+
+    def stats(self) -> list[PoolStats]:
+        """Get usage statistics of every pool."""
+        with self._lock:
+            managers = list(self._managers.items())
+
+        stats = []
+        for (key, _), manager in managers:
+            pools = [manager.pools[pool_key] for pool_key in manager.pools.keys()]
+            stats.append(
+                PoolStats(
+                    key=key,
+                    maxsize=manager.connection_pool_kw.get("maxsize", 1),
+                    connections=sum(pool.num_connections for pool in pools),
+                    requests=sum(pool.num_requests for pool in pools),
+                )
+            )
+        return stats
+
+    def log_stats(self) -> None:
+        """Log the usage of every pool at DEBUG level."""
+        for stat in self.stats():
+            logger.debug(
+                f"Connection pool {stat.key}: {stat.connections} connection(s) opened for "
+                f"{stat.requests} request(s) (maxsize {stat.maxsize})"
+            )
+
+
+# Global registry instance
+_registry = ConnectionPoolRegistry()
+
+
+def get_pool_registry() -> ConnectionPoolRegistry:
+    """Get the global connection pool registry."""
+    return _registry
@@ -0,0 +1,122 @@
+"""Preflight checks probing every instance before a run starts."""
+
+import contextvars
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+from src.core.resilience import without_retries
+from src.utils.logger import get_logger
+
+logger = get_logger("preflight")
+
+T = TypeVar("T")
+
+# Seconds to wait for each probe request (connect and read)
+DEFAULT_PREFLIGHT_TIMEOUT = 5.0
+
+
+@dataclass
+class ServerInfo:
+    """
+    What a preflight probe learned about a server.
+
+    Attributes:
+        app_name: Application name reported by the server (e.g., "Sonarr")
+        version: Server version (e.g., "4.0.9.2244")
+        latency: Seconds the probe took
+        status: Full system status as returned by the server
+    """
+
+    app_name: Optional[str]
+    version: Optional[str]
+    latency: float
+    status: dict[str, Any]
+
+
+def major_version(version: Optional[str]) -> Optional[int]:
+    """Get the major number of a server version (e.g., 4 for "4.0.9.2244"), or None if unknown."""
+    try:
+        return int((version or "").split(".")[0])
+    except ValueError:
+        return None
+
+
+def probe(client, timeout: float = DEFAULT_PREFLIGHT_TIMEOUT) -> ServerInfo:
+    """
+    Check that a server is reachable and accepts the client's credentials.
+
+    Args:
+        client: API client implementing `probe(timeout)`
+        timeout: Seconds to wait for each probe request
+
+    Returns:
+        ServerInfo of the server
+
+    Raises:
+        Exception: Whatever the client raised (connection errors, 401, ...)
+    """
+    start = time.perf_counter()
+    # Fail fast: a host that does not answer a probe is left out of the run
+    with client, without_retries():
+        status = client.probe(timeout) or {}
+    return ServerInfo(
+        app_name=status.get("appName"),
+        version=status.get("version"),
+        latency=time.perf_counter() - start,
+        status=status,
+    )
+
+
+def run_preflight(probes: list[Callable[[], T]]) -> list[T | Exception]:
+    """
+    Run probes concurrently, so a slow or dead host only costs its own timeout.
+
+    Args:
+        probes: Callables probing one instance each
+
+    Returns:
+        Each probe's result, or the exception it raised, in input order
+    """
+    if not probes:
+        return []
+
+    def run(probe_fn: Callable[[], T]) -> T | Exception:
+        try:
+            return probe_fn()
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=len(probes), thread_name_prefix="preflight") as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, run, probe_fn) for probe_fn in probes
+        ]
+        return [future.result() for future in futures]
+
+
+def describe_error(error: Exception) -> str:
+    """
+    Summarize why a probe failed in one line.
+
+    Args:
+        error: Exception raised by a probe
+
+    Returns:
+        Short, human-readable reason
+    """
+    status = getattr(error, "status", None)
+    if status == 401:
+        return "Authentication failed - check your API key"
+    if status is not None:
+        return f"Server answered HTTP {status} ({getattr(error, 'reason', '')})"
+
+    message = str(error)
+    if "Connection refused" in message:
+        return "Connection refused - is the server running?"
+    if "timed out" in message.lower() or "timeout" in message.lower():
+        return "Request timeout - server not responding"
+    if isinstance(error, json.JSONDecodeError):
+        return "Unexpected (non-JSON) response - is the base URL correct?"
+    return message.splitlines()[0][:200] if message else type(error).__name__
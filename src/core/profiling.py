@@ -0,0 +1,280 @@
+"""Lightweight timing of sync phases and HTTP calls, reported with `--profile`."""
+
+import contextvars
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterator, Optional
+from urllib.parse import urlsplit
+
+from src.core.tracing import current_tracer
+from src.utils.logger import get_logger
+
+logger = get_logger("profile")
+
+# Numeric path segments (resource IDs) are grouped into one endpoint
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+@dataclass
+class PhaseTiming:
+    """
+    Time spent in one occurrence of a phase.
+
+    Attributes:
+        phase: Phase name (e.g., "diff")
+        seconds: Duration
+        labels: Where the phase ran (e.g., {"instance": "main", "resource": "tags"})
+    """
+
+    phase: str
+    seconds: float
+    labels: dict[str, str]
+
+
+@dataclass
+class HttpCall:
+    """
+    A single HTTP request as seen by the transport.
+
+    Attributes:
+        method: HTTP method
+        endpoint: URL path with resource IDs replaced by "{id}"
+        status: Response status (0 if no response was received)
+        seconds: Time until the full response was received
+        request_bytes: Size of the request body
+        response_bytes: Size of the response body
+    """
+
+    method: str
+    endpoint: str
+    status: int
+    seconds: float
+    request_bytes: int
+    response_bytes: int
+
+
+class Profiler:
+    """
+    Collects phase timings and HTTP calls of a run.
+
+    Timings are cumulative: phases of instances and resources running
+    concurrently are all counted, so their sum can exceed the wall time.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: list[PhaseTiming] = []
+        self.http_calls: list[HttpCall] = []
+        self._lock = threading.Lock()
+
+    def add_phase(self, timing: PhaseTiming) -> None:
+        """Record a finished phase."""
+        with self._lock:
+            self.phases.append(timing)
+
+    def add_http_call(self, call: HttpCall) -> None:
+        """Record a finished HTTP call."""
+        with self._lock:
+            self.http_calls.append(call)
+
+    def report(self) -> dict[str, Any]:
+        """
+        Build the machine-readable report.
+
+        Returns:
+            Dict with the wall time, per-phase and per-endpoint aggregates, and
+            every recorded phase and HTTP call
+        """
+        with self._lock:
+            phases = list(self.phases)
+            calls = list(self.http_calls)
+
+        phase_stats: dict[str, dict[str, Any]] = {}
+        for timing in phases:
+            _accumulate(phase_stats, timing.phase, timing.seconds)
+
+        endpoint_stats: dict[str, dict[str, Any]] = {}
+        for call in calls:
+            stats = _accumulate(endpoint_stats, f"{call.method} {call.endpoint}", call.seconds)
+            stats["bytes"] = stats.get("bytes", 0) + call.request_bytes + call.response_bytes
+            if call.status == 0 or call.status >= 400:
+                stats["errors"] = stats.get("errors", 0) + 1
+
+        return {
+            "wall_seconds": time.perf_counter() - self.started,
+            "phases": phase_stats,
+            "http": {
+                "calls": len(calls),
+                "seconds": sum(call.seconds for call in calls),
+                "request_bytes": sum(call.request_bytes for call in calls),
+                "response_bytes": sum(call.response_bytes for call in calls),
+                "endpoints": endpoint_stats,
+            },
+            "phase_timings": [asdict(timing) for timing in phases],
+            "http_calls": [asdict(call) for call in calls],
+        }
+
+    def write(self, path: Path | str) -> None:
+        """Write the report as JSON."""
+        Path(path).write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
+
+    def log_summary(self) -> None:
+        """Log a human-readable summary table of the report."""
+        report = self.report()
+        http = report["http"]
+
+        logger.info(f"\n{'='*60}")
+        logger.info(
+            f"Profile (wall time {report['wall_seconds']:.2f}s; phase times are cumulative)"
+        )
+        logger.info(f"{'='*60}")
+        logger.info(f"{'Phase':<24}{'Count':>7}{'Total':>10}{'Mean':>10}{'Max':>10}")
+        for name, stats in sorted(report["phases"].items(), key=lambda kv: -kv[1]["seconds"]):
+            logger.info(_format_row(name, stats))
+
+        logger.info(
+            f"\nHTTP: {http['calls']} call(s), {http['seconds']:.2f}s, "
+            f"{_format_bytes(http['request_bytes'])} sent, "
+            f"{_format_bytes(http['response_bytes'])} received"
+        )
+        endpoints = sorted(http["endpoints"].items(), key=lambda kv: -kv[1]["seconds"])
+        if endpoints:
+            logger.info(f"{'Endpoint':<40}{'Count':>7}{'Total':>10}{'Mean':>10}{'Max':>10}")
+        for name, stats in endpoints[:15]:
+            logger.info(_format_row(name, stats, width=40))
+
+
+def _accumulate(stats: dict[str, dict[str, Any]], key: str, seconds: float) -> dict[str, Any]:
+    """Add a duration to the count/total/max aggregate of a key."""
+    entry = stats.setdefault(key, {"count": 0, "seconds": 0.0, "max_seconds": 0.0})
+    entry["count"] += 1
+    entry["seconds"] += seconds
+    entry["max_seconds"] = max(entry["max_seconds"], seconds)
+    entry["mean_seconds"] = entry["seconds"] / entry["count"]
+    return entry
+
+
+def _format_row(name: str, stats: dict[str, Any], width: int = 24) -> str:
+    """Format an aggregate as a row of the summary table."""
+    if len(name) > width - 1:
+        name = name[: width - 2] + "…"
+    return (
+        f"{name:<{width}}{stats['count']:>7}"
+        f"{stats['seconds'] * 1000:>8.0f}ms{stats['mean_seconds'] * 1000:>8.1f}ms"
+        f"{stats['max_seconds'] * 1000:>8.0f}ms"
+    )
+
+
+def _format_bytes(size: int) -> str:
+    """Format a byte count for humans."""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+# Profiler of the current run (None unless --profile is given)
+_current_profiler: contextvars.ContextVar[Optional[Profiler]] = contextvars.ContextVar(
+    "profiler", default=None
+)
+
+
+def current_profiler() -> Optional[Profiler]:
+    """Get the profiler of the current context, or None if profiling is off."""
+    return _current_profiler.get()
+
+
+def recording() -> bool:
+    """Whether phases and HTTP calls are being recorded (profiling or tracing)."""
+    return _current_profiler.get() is not None or current_tracer() is not None
+
+
+@contextmanager
+def profiling(enabled: bool = True) -> Iterator[Optional[Profiler]]:
+    """
+    Profile the work done inside the block.
+
+    Args:
+        enabled: Whether to profile at all (yields None if not)
+
+    Yields:
+        The active profiler (None if disabled)
+    """
+    if not enabled:
+        yield None
+        return
+    token = _current_profiler.set(Profiler())
+    try:
+        yield _current_profiler.get()
+    finally:
+        _current_profiler.reset(token)
+
+
+# Labels of the enclosing phases, inherited by nested ones
+_current_labels: contextvars.ContextVar[dict[str, str]] = contextvars.ContextVar(
+    "phase_labels", default={}
+)
+
+
+@contextmanager
+def phase(name: str, **labels: str) -> Iterator[None]:
+    """
+    Time a phase of the run (no-op unless profiling or tracing).
+
+    Nested phases inherit the labels of the enclosing ones, so e.g. a "diff"
+    phase inside an instance's phase is attributed to that instance. When
+    tracing, each phase is also recorded as a span.
+
+    Args:
+        name: Phase name (e.g., "fetch", "diff")
+        **labels: Where the phase runs (e.g., instance="main", resource="tags")
+    """
+    profiler = _current_profiler.get()
+    tracer = current_tracer()
+    if profiler is None and tracer is None:
+        yield
+        return
+    labels = {**_current_labels.get(), **labels}
+    token = _current_labels.set(labels)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        if profiler is not None:
+            profiler.add_phase(PhaseTiming(name, end - start, labels))
+        if tracer is not None:
+            tracer.add_span(name, "phase", start, end, labels)
+        _current_labels.reset(token)
+
+
+def record_http_call(
+    method: str, url: str, status: int, start: float, request_bytes: int, response_bytes: int
+) -> None:
+    """
+    Record an HTTP call that started at `start` (`time.perf_counter()`) and just ended.
+
+    No-op unless profiling or tracing.
+    """
+    end = time.perf_counter()
+    endpoint = _ID_SEGMENT.sub("/{id}", urlsplit(url).path)
+    call = HttpCall(method.upper(), endpoint, status, end - start, request_bytes, response_bytes)
+
+    profiler = _current_profiler.get()
+    if profiler is not None:
+        profiler.add_http_call(call)
+    tracer = current_tracer()
+    if tracer is not None:
+        tracer.add_span(
+            f"{call.method} {call.endpoint}",
+            "http",
+            start,
+            end,
+            {"status": status, "request_bytes": request_bytes, "response_bytes": response_bytes},
+        )
@@ -1,10 +1,16 @@
 """Generic reconciliation engine for syncing resources."""
 
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from typing import Any, Callable, Generic, Optional, TypeVar
 
+from src.core.deadline import DeadlineExceeded, check_deadline, current_deadline
 from src.core.diff import ChangeSet, compute_diff
+from src.core.profiling import phase
 from src.shared.mappers.base import ResourceMapper
-from src.utils.logger import get_logger
+from src.utils.logger import captured_logs, flush_records, get_logger
 
 TApiModel = TypeVar("TApiModel")
 TYamlDef = TypeVar("TYamlDef")
@@ -12,6 +18,22 @@ TYamlDef = TypeVar("TYamlDef")
 logger = get_logger("reconciler")
 
 
+@dataclass(slots=True)
+class DesiredItem(Generic[TApiModel, TYamlDef]):
+    """
+    A desired resource, converted once and reused for diffing and applying.
+
+    Attributes:
+        yaml_def: Definition from the YAML config
+        model: API model built from the definition
+        comparable: Comparable dict of the model (as produced by the mapper)
+    """
+
+    yaml_def: TYamlDef
+    model: TApiModel
+    comparable: dict[str, Any]
+
+
 class Reconciler(Generic[TApiModel, TYamlDef]):
     """
     Generic reconciler for syncing a resource type between YAML config and server.
@@ -19,8 +41,11 @@ class Reconciler(Generic[TApiModel, TYamlDef]):
     Handles:
     - Fetching current state from server
     - Computing diff with desired state
-    - Applying changes (create/update/delete)
+    - Applying changes (create/update/delete), optionally through a worker pool
+      and batched into bulk API calls where the resource supports them
     - Dry-run mode
+    - Deadlines: once the current deadline (see src.core.deadline) passes,
+      no further phase is started and outstanding write operations are skipped
     """
 
     def __init__(
@@ -31,6 +56,10 @@ class Reconciler(Generic[TApiModel, TYamlDef]):
         create_fn: Callable[[TApiModel], TApiModel],
         update_fn: Callable[[int, TApiModel], TApiModel],
         delete_fn: Callable[[int], None],
+        max_workers: int = 1,
+        bulk_update_fn: Optional[Callable[[list[TApiModel]], Any]] = None,
+        bulk_delete_fn: Optional[Callable[[list[int]], None]] = None,
+        bulk_chunk_size: int = 100,
     ):
         """
         Initialize the reconciler.
@@ -38,10 +67,14 @@ class Reconciler(Generic[TApiModel, TYamlDef]):
         Args:
             resource_name: Human-readable name (e.g., "Custom Format")
             mapper: ResourceMapper instance
-            list_fn: Function to fetch all resources from server
+            list_fn: Function to fetch all resources from server (API models or raw JSON dicts)
             create_fn: Function to create a resource
             update_fn: Function to update a resource (takes ID + model)
             delete_fn: Function to delete a resource by ID
+            max_workers: Maximum number of create/update/delete calls in flight at once
+            bulk_update_fn: Optional function updating many resources in one call
+            bulk_delete_fn: Optional function deleting many resources (by ID) in one call
+            bulk_chunk_size: Maximum number of items sent in a single bulk call
         """
         self.resource_name = resource_name
         self.mapper = mapper
@@ -49,6 +82,12 @@ class Reconciler(Generic[TApiModel, TYamlDef]):
         self.create_fn = create_fn
         self.update_fn = update_fn
         self.delete_fn = delete_fn
+        self.max_workers = max(1, max_workers)
+        self.bulk_update_fn = bulk_update_fn
+        self.bulk_delete_fn = bulk_delete_fn
+        self.bulk_chunk_size = max(1, bulk_chunk_size)
+        # Error messages from the last apply (empty if every call succeeded)
+        self.errors: list[str] = []
 
     def reconcile(
         self,
@@ -68,36 +107,44 @@ class Reconciler(Generic[TApiModel, TYamlDef]):
 
         Returns:
             ChangeSet of applied/planned changes
+
+        Raises:
+            DeadlineExceeded: If the current deadline passed before fetching or applying
         """
         context = context or {}
 
         logger.info(f"Reconciling {self.resource_name}...")
 
         # Fetch current state
-        current_models = self.list_fn()
-        current = [self.mapper.from_api_model(model) for model in current_models]
+        check_deadline()
+        with phase("fetch", resource=self.resource_name):
+            current_models = self.list_fn()
+        with phase("map_current", resource=self.resource_name):
+            current = [self.mapper.from_api_item(item) for item in current_models]
 
         logger.debug(f"Found {len(current)} existing {self.resource_name}(s) on server")
         logger.debug(f"Desired state has {len(desired)} {self.resource_name}(s)")
 
-        # Convert desired YAML defs to comparable dicts
-        desired_dicts = []
-        for yaml_def in desired:
-            # We need to convert to dict for comparison
-            # But we keep the original yaml_def for creating API models
-            api_model = self.mapper.to_api_model(yaml_def, **context)
-            desired_dict = self.mapper.from_api_model(api_model)
-            desired_dict["_yaml_def"] = yaml_def  # Attach for later use
-            desired_dicts.append(desired_dict)
+        # Build each desired API model once; it is reused when applying changes
+        desired_items = []
+        with phase("build_desired", resource=self.resource_name):
+            for yaml_def in desired:
+                api_model = self.mapper.to_api_model(yaml_def, **context)
+                desired_items.append(
+                    DesiredItem(yaml_def, api_model, self.mapper.from_api_model(api_model))
+                )
 
         # Compute diff
-        changeset = compute_diff(
-            current=current,
-            desired=desired_dicts,
-            match_key_fn=self.mapper.get_match_key,
-            needs_update_fn=lambda cur, des: self.mapper.needs_update(cur, des),
-            delete_unmanaged=delete_unmanaged,
-        )
+        with phase("diff", resource=self.resource_name):
+            changeset = compute_diff(
+                current=current,
+                desired=desired_items,
+                match_key_fn=self.mapper.get_match_key,
+                delete_unmanaged=delete_unmanaged,
+                digest_fn=self.mapper.digest,
+                diff_fields_fn=self.mapper.diff_fields,
+                comparable_fn=lambda item: item.comparable,
+            )
 
         # Log summary
         if changeset:
@@ -109,65 +156,200 @@ class Reconciler(Generic[TApiModel, TYamlDef]):
             self._log_dry_run_changes(changeset)
             return changeset
 
-        # Apply changes
-        self._apply_changes(changeset, context)
+        # Apply changes (the diff may have been computed against a deadline that passed since)
+        check_deadline()
+        with phase("apply", resource=self.resource_name):
+            self.apply(changeset)
 
         return changeset
 
-    def _apply_changes(self, changeset: ChangeSet, context: dict[str, Any]) -> None:
-        """Apply the computed changes to the server."""
-        errors = []
+    def apply(self, changeset: ChangeSet[DesiredItem]) -> None:
+        """
+        Apply a computed ChangeSet to the server.
 
-        # Create new resources
-        for desired_dict in changeset.to_create:
-            yaml_def = desired_dict.pop("_yaml_def")
-            name = self.mapper.get_match_key(desired_dict)
-            logger.info(f"Creating {self.resource_name}: {name}")
-            try:
-                api_model = self.mapper.to_api_model(yaml_def, **context)
-                self.create_fn(api_model)
-                logger.info(f"✓ Created {self.resource_name}: {name}")
-            except Exception as e:
-                error_msg = self._format_api_error(e)
-                logger.error(f"✗ Failed to create {self.resource_name} '{name}': {error_msg}")
-                errors.append(f"Create {name}: {error_msg}")
-
-        # Update existing resources
-        for current_dict, desired_dict in changeset.to_update:
-            yaml_def = desired_dict.pop("_yaml_def")
-            name = self.mapper.get_match_key(desired_dict)
-            resource_id = current_dict["id"]
-            logger.info(f"Updating {self.resource_name}: {name} (ID: {resource_id})")
-            try:
-                api_model = self.mapper.to_api_model(yaml_def, **context)
-                # Preserve the ID for update
-                api_model.id = resource_id
-                self.update_fn(resource_id, api_model)
-                logger.info(f"✓ Updated {self.resource_name}: {name}")
-            except Exception as e:
-                error_msg = self._format_api_error(e)
-                logger.error(f"✗ Failed to update {self.resource_name} '{name}': {error_msg}")
-                errors.append(f"Update {name}: {error_msg}")
-
-        # Delete unmanaged resources
-        for current_dict in changeset.to_delete:
-            name = self.mapper.get_match_key(current_dict)
-            resource_id = current_dict["id"]
-            logger.info(f"Deleting {self.resource_name}: {name} (ID: {resource_id})")
-            try:
-                self.delete_fn(resource_id)
-                logger.info(f"✓ Deleted {self.resource_name}: {name}")
-            except Exception as e:
-                error_msg = self._format_api_error(e)
-                logger.error(f"✗ Failed to delete {self.resource_name} '{name}': {error_msg}")
-                errors.append(f"Delete {name}: {error_msg}")
+        Error messages of failed calls are collected in `self.errors`.
+
+        Args:
+            changeset: Changes whose desired items are DesiredItem records
+        """
+        # Build operations in a fixed order: creates, then updates, then deletes
+        operations: list[Callable[[], list[str]]] = []
+        operations.extend(partial(self._create, item) for item in changeset.to_create)
+
+        if self.bulk_update_fn and len(changeset.to_update) > 1:
+            operations.extend(
+                partial(self._bulk_update, chunk) for chunk in self._chunks(changeset.to_update)
+            )
+        else:
+            operations.extend(
+                partial(self._update, current_dict, item)
+                for current_dict, item in changeset.to_update
+            )
+
+        if self.bulk_delete_fn and len(changeset.to_delete) > 1:
+            operations.extend(
+                partial(self._bulk_delete, chunk) for chunk in self._chunks(changeset.to_delete)
+            )
+        else:
+            operations.extend(
+                partial(self._delete, current_dict) for current_dict in changeset.to_delete
+            )
+
+        operations = [partial(self._run_before_deadline, operation) for operation in operations]
+        results = self._run_operations(operations)
+        errors = [error for result in results if result is not None for error in result]
+
+        skipped = results.count(None)
+        if skipped:
+            message = f"{current_deadline().label} deadline exceeded"
+            logger.error(
+                f"✗ {message}: skipped {skipped} remaining {self.resource_name} operation(s)"
+            )
+            errors.append(f"Skipped {skipped} operation(s): {message}")
+        self.errors = errors
 
         # Report summary if there were errors
         if errors:
             logger.warning(
                 f"Completed with {len(errors)} error(s) for {self.resource_name}"
             )
-            
+
+    @staticmethod
+    def _run_before_deadline(operation: Callable[[], list[str]]) -> Optional[list[str]]:
+        """Run an operation unless the current deadline has passed (then return None)."""
+        deadline = current_deadline()
+        if deadline is not None and deadline.expired:
+            return None
+        return operation()
+
+    def _chunks(self, items: list) -> list[list]:
+        """Split items into bulk-call sized chunks."""
+        size = self.bulk_chunk_size
+        return [items[i : i + size] for i in range(0, len(items), size)]
+
+    def _run_operations(self, operations: list[Callable[[], Any]]) -> list[Any]:
+        """
+        Run write operations, concurrently when max_workers > 1.
+
+        Each operation's log output is captured and replayed in submission order,
+        so the log reads the same regardless of which calls finish first.
+
+        Returns:
+            Each operation's result, in submission order
+        """
+        if self.max_workers == 1 or len(operations) <= 1:
+            return [operation() for operation in operations]
+
+        def run_captured(operation: Callable[[], list[str]]):
+            with captured_logs() as records:
+                result = operation()
+            return result, records
+
+        results = []
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="write"
+        ) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, run_captured, operation)
+                for operation in operations
+            ]
+            for future in futures:
+                result, records = future.result()
+                flush_records(records)
+                results.append(result)
+        return results
+
+    def _create(self, item: DesiredItem) -> list[str]:
+        """Create a single resource. Returns error messages on failure."""
+        name = self.mapper.get_match_key(item.comparable)
+        logger.info(f"Creating {self.resource_name}: {name}")
+        try:
+            self.create_fn(item.model)
+            logger.info(f"✓ Created {self.resource_name}: {name}")
+        except Exception as e:
+            error_msg = self._format_api_error(e)
+            logger.error(f"✗ Failed to create {self.resource_name} '{name}': {error_msg}")
+            return [f"Create {name}: {error_msg}"]
+        return []
+
+    def _update(self, current_dict: dict[str, Any], item: DesiredItem) -> list[str]:
+        """Update a single resource. Returns error messages on failure."""
+        name = self.mapper.get_match_key(item.comparable)
+        resource_id = current_dict["id"]
+        logger.info(f"Updating {self.resource_name}: {name} (ID: {resource_id})")
+        try:
+            # Preserve the ID for update
+            item.model.id = resource_id
+            self.update_fn(resource_id, item.model)
+            logger.info(f"✓ Updated {self.resource_name}: {name}")
+        except Exception as e:
+            error_msg = self._format_api_error(e)
+            logger.error(f"✗ Failed to update {self.resource_name} '{name}': {error_msg}")
+            return [f"Update {name}: {error_msg}"]
+        return []
+
+    def _bulk_update(self, pairs: list[tuple[dict[str, Any], DesiredItem]]) -> list[str]:
+        """Update a chunk of resources in one call, falling back to per-item updates on failure."""
+        names = [self.mapper.get_match_key(item.comparable) for _, item in pairs]
+        logger.info(f"Updating {len(pairs)} {self.resource_name} in bulk: {', '.join(names)}")
+        try:
+            for current_dict, item in pairs:
+                item.model.id = current_dict["id"]
+            self.bulk_update_fn([item.model for _, item in pairs])
+        except DeadlineExceeded as e:
+            logger.error(f"✗ Failed to update {len(pairs)} {self.resource_name} in bulk: {e}")
+            return [f"Update {name}: {e}" for name in names]
+        except Exception as e:
+            logger.warning(
+                f"Bulk update of {self.resource_name} failed ({self._format_api_error(e)}), "
+                "falling back to individual updates"
+            )
+            return [
+                error
+                for current_dict, item in pairs
+                for error in self._update(current_dict, item)
+            ]
+
+        logger.info(f"✓ Updated {len(pairs)} {self.resource_name}")
+        return []
+
+    def _delete(self, current_dict: dict[str, Any]) -> list[str]:
+        """Delete a single resource. Returns error messages on failure."""
+        name = self.mapper.get_match_key(current_dict)
+        resource_id = current_dict["id"]
+        logger.info(f"Deleting {self.resource_name}: {name} (ID: {resource_id})")
+        try:
+            self.delete_fn(resource_id)
+            logger.info(f"✓ Deleted {self.resource_name}: {name}")
+        except Exception as e:
+            error_msg = self._format_api_error(e)
+            logger.error(f"✗ Failed to delete {self.resource_name} '{name}': {error_msg}")
+            return [f"Delete {name}: {error_msg}"]
+        return []
+
+    def _bulk_delete(self, current_dicts: list[dict[str, Any]]) -> list[str]:
+        """Delete a chunk of resources in one call, falling back to per-item deletes on failure."""
+        names = [self.mapper.get_match_key(current_dict) for current_dict in current_dicts]
+        logger.info(
+            f"Deleting {len(current_dicts)} {self.resource_name} in bulk: {', '.join(names)}"
+        )
+        try:
+            self.bulk_delete_fn([current_dict["id"] for current_dict in current_dicts])
+        except DeadlineExceeded as e:
+            logger.error(
+                f"✗ Failed to delete {len(current_dicts)} {self.resource_name} in bulk: {e}"
+            )
+            return [f"Delete {name}: {e}" for name in names]
+        except Exception as e:
+            logger.warning(
+                f"Bulk delete of {self.resource_name} failed ({self._format_api_error(e)}), "
+                "falling back to individual deletes"
+            )
+            return [error for current_dict in current_dicts for error in self._delete(current_dict)]
+
+        logger.info(f"✓ Deleted {len(current_dicts)} {self.resource_name}")
+        return []
+
     def _format_api_error(self, exception: Exception) -> str:
         """
         Format API exceptions into readable error messages.
@@ -223,15 +405,19 @@ class Reconciler(Generic[TApiModel, TYamlDef]):
 
         if changeset.to_create:
             logger.info(f"  Would create {len(changeset.to_create)} item(s):")
-            for desired_dict in changeset.to_create:
-                name = self.mapper.get_match_key(desired_dict)
+            for item in changeset.to_create:
+                name = self.mapper.get_match_key(item.comparable)
                 logger.info(f"    + {name}")
 
         if changeset.to_update:
             logger.info(f"  Would update {len(changeset.to_update)} item(s):")
-            for current_dict, desired_dict in changeset.to_update:
-                name = self.mapper.get_match_key(desired_dict)
-                logger.info(f"    ~ {name}")
+            for current_dict, item in changeset.to_update:
+                name = self.mapper.get_match_key(item.comparable)
+                fields = changeset.changed_fields.get(name)
+                if fields:
+                    logger.info(f"    ~ {name} ({', '.join(fields)})")
+                else:
+                    logger.info(f"    ~ {name}")
 
         if changeset.to_delete:
             logger.info(f"  Would delete {len(changeset.to_delete)} item(s):")
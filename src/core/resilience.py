@@ -0,0 +1,249 @@
+"""Retry policy and per-host circuit breakers for API requests."""
+
+import contextvars
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Iterator, Optional
+
+from src.core.pool import origin
+from src.utils.logger import get_logger
+
+logger = get_logger("resilience")
+
+# Methods that can be sent again without changing the outcome
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Statuses signalling a transient server-side problem
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how long to wait before sending a failed request again.
+
+    Idempotent requests are retried on connection errors, timeouts and the
+    statuses in `statuses`. Other requests (POST) are only retried when the
+    connection could not be established (refused, unresolvable host or connect
+    timeout), as the server never saw them.
+
+    Attributes:
+        attempts: Maximum number of retries after the first attempt
+        backoff: Delay in seconds before the first retry; doubled for each further one
+        max_backoff: Upper bound of a single delay in seconds
+        statuses: Response statuses worth retrying
+    """
+
+    attempts: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    statuses: frozenset[int] = field(default=RETRY_STATUSES)
+
+    def delay(self, retry: int, retry_after: Optional[float] = None) -> float:
+        """
+        Get the delay before a retry.
+
+        Uses exponential backoff with full jitter, so clients failing together do
+        not retry in lockstep. A server-provided `Retry-After` takes precedence.
+
+        Args:
+            retry: Number of the retry (1 for the first)
+            retry_after: Delay requested by the server, in seconds
+
+        Returns:
+            Seconds to wait
+        """
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (retry - 1)))
+
+
+# Set by without_retries(); checked by the transport before retrying
+_retries_enabled: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "retries_enabled", default=True
+)
+
+
+@contextmanager
+def without_retries() -> Iterator[None]:
+    """Send requests made inside the block only once (e.g., for quick health probes)."""
+    token = _retries_enabled.set(False)
+    try:
+        yield
+    finally:
+        _retries_enabled.reset(token)
+
+
+def retries_enabled() -> bool:
+    """Whether requests in the current context may be retried."""
+    return _retries_enabled.get()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a `Retry-After` header (delay in seconds or an HTTP date).
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests to a host after repeated failures.
+
+    After `threshold` consecutive failures the circuit opens and requests fail
+    immediately with CircuitOpenError. Once `reset_timeout` seconds have passed,
+    a single trial request is let through: success closes the circuit, failure
+    opens it again.
+    """
+
+    def __init__(self, key: str, threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            key: Origin of the host (used in messages)
+            threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial request
+        """
+        self.key = key
+        self.threshold = max(1, threshold)
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests to the host are currently being refused."""
+        with self._lock:
+            return self._opened_at is not None
+
+    def before_request(self) -> bool:
+        """
+        Check that a request may be sent.
+
+        Returns:
+            Whether the request is the trial request of a half-open circuit; the
+            caller must then call `release_trial()` once the request is over
+
+        Raises:
+            CircuitOpenError: If the circuit is open (and no trial request is due)
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            waited = time.monotonic() - self._opened_at
+            if waited >= self.reset_timeout and not self._trial_running:
+                self._trial_running = True
+                return True
+            raise CircuitOpenError(
+                f"Circuit open for {self.key} after {self._failures} consecutive failures; "
+                f"retrying in {max(0.0, self.reset_timeout - waited):.0f}s"
+            )
+
+    def release_trial(self) -> None:
+        """
+        End a trial request that recorded neither success nor failure.
+
+        A trial ended by an error other than a failed request (e.g., a response
+        that could not be decoded or an expired deadline) lets the next request
+        through as a new trial instead of keeping the circuit open for good.
+        """
+        with self._lock:
+            self._trial_running = False
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info(f"✓ Circuit closed for {self.key}")
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            reopen = self._trial_running
+            self._trial_running = False
+            if reopen or (self._opened_at is None and self._failures >= self.threshold):
+                if self._opened_at is None:
+                    logger.warning(
+                        f"Circuit opened for {self.key} after {self._failures} consecutive "
+                        f"failures; pausing requests for {self.reset_timeout:g}s"
+                    )
+                self._opened_at = time.monotonic()
+
+
+class CircuitBreakerRegistry:
+    """Hands out one circuit breaker per host, shared by all clients of a run."""
+
+    def __init__(self):
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._settings: dict[str, tuple] = {}
+        self._warned: set[tuple[str, tuple]] = set()
+        self._lock = threading.Lock()
+
+    def get(self, url: str, threshold: int = 5, reset_timeout: float = 30.0) -> CircuitBreaker:
+        """
+        Get the circuit breaker of a host, creating it on first use.
+
+        The breaker is shared by every client of the host, so the first client
+        to ask for it decides its settings; later clients asking for different
+        settings get a warning and the existing breaker.
+
+        Args:
+            url: Any URL on the host
+            threshold: Consecutive failures that open a new breaker's circuit
+            reset_timeout: Seconds a new breaker's circuit stays open
+
+        Returns:
+            Circuit breaker shared by all callers for the host
+        """
+        key = origin(url)
+        settings = (threshold, reset_timeout)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(key, threshold, reset_timeout)
+                self._breakers[key] = breaker
+                self._settings[key] = settings
+            elif self._settings[key] != settings and (key, settings) not in self._warned:
+                self._warned.add((key, settings))
+                logger.warning(
+                    f"Ignoring different circuit breaker settings for {key}: all clients of a "
+                    f"host share the breaker of the first one (circuit_breaker_threshold "
+                    f"{breaker.threshold}, circuit_breaker_reset {breaker.reset_timeout:g})"
+                )
+            return breaker
+
+
+# Global registry instance
+_registry = CircuitBreakerRegistry()
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Get the global circuit breaker registry."""
+    return _registry
@@ -0,0 +1,124 @@
+"""Dependency-aware scheduler for reconciling resource types concurrently."""
+
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger("scheduler")
+
+
+def topological_order(graph: dict[str, Iterable[str]]) -> list[str]:
+    """
+    Order graph nodes so that every node comes after its dependencies.
+
+    Dependencies on names that are not nodes of the graph are ignored (e.g. a
+    resource type that is not configured for this instance). Ties are broken by
+    the graph's insertion order, so the result is deterministic.
+
+    Args:
+        graph: Mapping of node name -> names it depends on
+
+    Returns:
+        Node names in dependency order
+
+    Raises:
+        ValueError: If the graph contains a dependency cycle
+    """
+    deps = {name: {d for d in graph[name] if d in graph} for name in graph}
+    order: list[str] = []
+    done: set[str] = set()
+
+    while len(order) < len(deps):
+        ready = [name for name in deps if name not in done and deps[name] <= done]
+        if not ready:
+            cycle = sorted(name for name in deps if name not in done)
+            raise ValueError(f"Dependency cycle detected between: {', '.join(cycle)}")
+        order.extend(ready)
+        done.update(ready)
+
+    return order
+
+
+class DependencyScheduler:
+    """
+    Runs one task per graph node, starting each node as soon as its dependencies succeed.
+
+    Independent nodes run concurrently on a bounded thread pool, so total wall
+    time follows the critical path of the graph instead of the sum of all nodes.
+    A node whose task fails (returns False or raises) causes all of its
+    dependents to be skipped; unrelated nodes keep running.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_workers: Maximum number of tasks to run at once (default: one per node)
+        """
+        self.max_workers = max_workers
+
+    def run(self, graph: dict[str, Iterable[str]], task: Callable[[str], bool]) -> dict[str, bool]:
+        """
+        Execute `task` for every node of the graph in dependency order.
+
+        Tasks run in a copy of the caller's context, so context-local state such as
+        log buffers carries over into the worker threads.
+
+        Args:
+            graph: Mapping of node name -> names it depends on
+            task: Callable taking a node name and returning True on success
+
+        Returns:
+            Mapping of node name -> success (skipped nodes count as failed)
+
+        Raises:
+            ValueError: If the graph contains a dependency cycle
+        """
+        order = topological_order(graph)
+        deps = {name: [d for d in graph[name] if d in graph] for name in order}
+        results: dict[str, bool] = {}
+
+        if not order:
+            return results
+
+        max_workers = self.max_workers or len(order)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="resource") as executor:
+            running: dict[Future, str] = {}
+            remaining = list(order)
+
+            while remaining or running:
+                # Start (or skip) every node whose dependencies have all finished
+                for name in list(remaining):
+                    if not all(dep in results for dep in deps[name]):
+                        continue
+                    remaining.remove(name)
+
+                    failed = [dep for dep in deps[name] if not results[dep]]
+                    if failed:
+                        logger.warning(f"Skipping {name}: dependency {', '.join(failed)} failed")
+                        results[name] = False
+                        continue
+
+                    context = contextvars.copy_context()
+                    running[executor.submit(context.run, self._run_task, task, name)] = name
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+
+        return {name: results[name] for name in order}
+
+    @staticmethod
+    def _run_task(task: Callable[[str], bool], name: str) -> bool:
+        """Run a single task, treating exceptions as failures."""
+        try:
+            return bool(task(name))
+        except Exception as e:
+            logger.error(f"✗ Unexpected error while syncing {name}: {e}")
+            return False
@@ -0,0 +1,265 @@
+"""Serve mode: keep servers in sync with a config file, re-syncing only what changed."""
+
+import signal
+import threading
+import time
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Optional
+
+from src.core.config_cache import load_config, log_config_error
+from src.core.deadline import deadline
+from src.core.preflight import DEFAULT_PREFLIGHT_TIMEOUT
+from src.core.state import DEFAULT_STATE_DIR, StateStore, canonical_hash
+from src.core.sync import (
+    INSTANCE_SETTINGS,
+    InstanceConnection,
+    connect_configured,
+    get_instance_deadline,
+    get_section_hash,
+    preflight_instances,
+    sync_instance,
+)
+from src.core.watch import FileWatcher
+from src.plugins.registry import get_registry
+from src.utils.logger import get_logger
+
+logger = get_logger("serve")
+
+
+@dataclass
+class ServedInstance:
+    """
+    An instance kept warm by `serve`.
+
+    Attributes:
+        plugin: Plugin handling the instance
+        config: Current instance config
+        settings_hash: Hash of the instance's connection settings
+        section_hashes: Hash of each resource section's YAML, by resource type
+        connection: Probed client reused across syncs (None until connected)
+    """
+
+    plugin: Any
+    config: Any
+    settings_hash: str
+    section_hashes: dict[str, str]
+    connection: Optional[InstanceConnection] = None
+
+
+def _load_served_config(
+    config_path: Path, cache_dir: Optional[Path]
+) -> tuple[dict[tuple[str, str], ServedInstance], list[Path]]:
+    """
+    Load and validate the config served by `serve`.
+
+    Args:
+        config_path: Path to the YAML config file
+        cache_dir: Directory of the config cache (None disables it)
+
+    Returns:
+        Instances keyed by (plugin name, instance name), and the config file and
+        every file it includes
+
+    Raises:
+        Exception: If the config cannot be loaded or is invalid
+    """
+    included: list[Path] = []
+    config = load_config(config_path, cache_dir, included)
+
+    registry = get_registry()
+    instances = {}
+    for plugin_name in registry.list_names():
+        plugin = registry.get(plugin_name)
+        for instance_config in getattr(config, plugin_name, []):
+            sections = [
+                name for name in type(instance_config).model_fields if name not in INSTANCE_SETTINGS
+            ]
+            instances[(plugin.name, instance_config.name)] = ServedInstance(
+                plugin=plugin,
+                config=instance_config,
+                settings_hash=canonical_hash(
+                    instance_config.model_dump(mode="json", include=INSTANCE_SETTINGS)
+                ),
+                section_hashes={
+                    name: get_section_hash(instance_config, name) for name in sections
+                },
+            )
+    return instances, [Path(config_path), *included]
+
+
+def _affected_instances(
+    previous: dict[tuple[str, str], ServedInstance],
+    current: dict[tuple[str, str], ServedInstance],
+) -> list[tuple[ServedInstance, Optional[set[str]]]]:
+    """
+    Compare two loads of the config and find what needs to be synced.
+
+    Instances whose connection settings are unchanged keep their warm connection.
+
+    Returns:
+        (instance, changed sections) per affected instance; sections are None
+        for new instances and instances whose connection settings changed
+    """
+    affected = []
+    for key, instance in current.items():
+        old = previous.get(key)
+        label = f"{instance.plugin.display_name}/{instance.config.name}"
+        if old is None:
+            logger.info(f"  + {label}: new instance")
+            affected.append((instance, None))
+        elif old.settings_hash != instance.settings_hash:
+            logger.info(f"  ~ {label}: connection settings changed")
+            affected.append((instance, None))
+        else:
+            instance.connection = old.connection
+            sections = {
+                name
+                for name, section_hash in instance.section_hashes.items()
+                if old.section_hashes.get(name) != section_hash
+            }
+            if sections:
+                logger.info(f"  ~ {label}: {', '.join(sorted(sections))} changed")
+                affected.append((instance, sections))
+
+    for key in previous.keys() - current.keys():
+        logger.info(f"  - {previous[key].plugin.display_name}/{key[1]}: removed (no longer synced)")
+    return affected
+
+
+def serve_config(
+    config_path: Path,
+    interval: float = 2.0,
+    drift_interval: float = 300.0,
+    dry_run: bool = False,
+    state_dir: Optional[Path] = DEFAULT_STATE_DIR,
+    preflight_timeout: float = DEFAULT_PREFLIGHT_TIMEOUT,
+    instance_deadline: Optional[float] = None,
+) -> int:
+    """
+    Keep servers in sync with a config file until interrupted.
+
+    Syncs every instance once, then watches the config file and the files it
+    includes. On a change, only the instances and resource sections whose YAML
+    changed are reconciled (plus the sections depending on them); an invalid
+    config is reported and the previous one stays in effect. Every
+    `drift_interval` seconds all instances are checked for changes made on the
+    servers, which the incremental sync state makes cheap when nothing drifted.
+
+    Clients, their connection pools and the plugin registry stay warm between
+    syncs; an instance is probed again only after a failed sync or when its
+    connection settings change.
+
+    Args:
+        config_path: Path to the YAML config file
+        interval: Seconds between checks of the watched files
+        drift_interval: Seconds between drift checks (0 disables them)
+        dry_run: Only show changes without applying them
+        state_dir: Directory of the incremental sync state and config cache (None disables them)
+        preflight_timeout: Seconds to wait for each preflight probe request
+        instance_deadline: Default time limit in seconds of each instance's sync
+
+    Returns:
+        0 once stopped by SIGINT/SIGTERM
+
+    Raises:
+        FileNotFoundError: If the config file (or an included file) doesn't exist
+        ValidationError: If the initial config is invalid
+    """
+    logger.info(f"Loading config file: {config_path}")
+    served, watched = _load_served_config(config_path, state_dir)
+
+    if dry_run:
+        logger.info("\n🔍 DRY RUN MODE - No changes will be applied\n")
+
+    stop = threading.Event()
+
+    def request_stop(signum, frame):
+        logger.info("\nStopping...")
+        stop.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    state = StateStore(state_dir) if state_dir else None
+
+    def sync(targets: list[tuple[ServedInstance, Optional[set[str]]]]) -> None:
+        pending = [instance for instance, _ in targets if instance.connection is None]
+        if pending:
+            connections = preflight_instances(
+                [
+                    (
+                        instance.plugin,
+                        instance.config.name,
+                        partial(_connect_served, instance, preflight_timeout),
+                    )
+                    for instance in pending
+                ]
+            )
+            for instance, connection in zip(pending, connections):
+                if not isinstance(connection, Exception):
+                    instance.connection = connection
+
+        for instance, sections in targets:
+            if instance.connection is None or stop.is_set():
+                continue
+            try:
+                with deadline(
+                    get_instance_deadline(instance.config, instance_deadline),
+                    f"instance '{instance.config.name}'",
+                ):
+                    success = sync_instance(
+                        instance.plugin,
+                        instance.config,
+                        dry_run,
+                        state=state,
+                        connection=instance.connection,
+                        sections=sections,
+                    )
+            except Exception as e:
+                logger.error(f"✗ Unexpected error syncing instance '{instance.config.name}': {e}")
+                success = False
+            if not success:
+                # Probe the server again before the next sync
+                instance.connection = None
+
+    try:
+        sync([(instance, None) for instance in served.values()])
+
+        watcher = FileWatcher(watched)
+        logger.info(f"\nWatching {len(watcher.paths)} config file(s) for changes")
+        next_drift_check = time.monotonic() + drift_interval
+        while not stop.wait(interval):
+            changed = watcher.changed()
+            if changed:
+                logger.info(f"\nConfig changed: {', '.join(str(path) for path in changed)}")
+                try:
+                    current, watched = _load_served_config(config_path, state_dir)
+                except Exception as e:
+                    log_config_error(e)
+                    logger.error("✗ Keeping the previous config until the error is fixed")
+                    continue
+                watcher.watch(watched)
+                targets = _affected_instances(served, current)
+                served = current
+                if targets:
+                    sync(targets)
+                else:
+                    logger.info("No instance affected")
+
+            if drift_interval and time.monotonic() >= next_drift_check:
+                logger.info("\nChecking for drift...")
+                sync([(instance, None) for instance in served.values()])
+                next_drift_check = time.monotonic() + drift_interval
+    finally:
+        if state:
+            state.close()
+
+    logger.info("✓ Stopped")
+    return 0
+
+
+def _connect_served(instance: ServedInstance, timeout: float) -> InstanceConnection:
+    """Create and probe the client of an instance served by `serve`."""
+    return connect_configured(instance.plugin, instance.config, timeout)
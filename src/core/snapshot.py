@@ -0,0 +1,316 @@
+"""Instance-scoped snapshot of server state shared by context building and reconcilers."""
+
+import contextvars
+import dataclasses
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, Optional
+
+from src.core.state import canonical_hash
+from src.plugins.base import ResourceDefinition
+from src.utils.logger import get_logger
+
+logger = get_logger("snapshot")
+
+
+class InstanceSnapshot:
+    """
+    Caches the result of each list endpoint of one instance for the duration of a sync.
+
+    Every list endpoint is fetched at most once (all of them in parallel via
+    `prefetch()`), and all readers are served from memory. Objects returned by
+    create/update calls are patched into the cached lists, so resources reconciled
+    later (e.g. quality profiles needing new custom format IDs) see fresh IDs
+    without another round trip. If a write response carries no object (e.g. the
+    server answered with a status the generated client does not deserialize),
+    the list is marked stale and fetched again on its next read.
+
+    Resource types registered with their raw response body are kept as the
+    body bytes and only decoded into raw JSON dicts when read, so their
+    fingerprint is a hash of the bytes: checking an unchanged resource type
+    costs one request and one hash, without JSON decoding or model
+    construction. Objects returned by write calls are patched into these lists
+    as the JSON dicts the endpoint would return; only the fingerprint of a
+    written list is fetched again, as the server's bytes cannot be predicted.
+    """
+
+    def __init__(self):
+        self._loaders: dict[str, Callable[[], list]] = {}
+        self._body_loaders: dict[str, Callable[[], bytes]] = {}
+        self._singletons: set[str] = set()
+        self._items: dict[str, list] = {}
+        self._bodies: dict[str, bytes] = {}
+        self._errors: dict[str, Exception] = {}
+        self._stale: set[str] = set()
+        self._lock = threading.RLock()
+
+    def register(self, name: str, list_fn: Callable[[], list]) -> None:
+        """
+        Register the list endpoint for a resource type.
+
+        Args:
+            name: Resource type name (e.g., "tags")
+            list_fn: Callable returning all resources of this type from the server
+        """
+        self._loaders[name] = list_fn
+
+    def register_body(
+        self, name: str, body_fn: Callable[[], bytes], singleton: bool = False
+    ) -> None:
+        """
+        Register the raw list endpoint for a resource type.
+
+        Args:
+            name: Resource type name (e.g., "tags")
+            body_fn: Callable returning the endpoint's JSON response body
+            singleton: Whether the body is a single object rather than a list
+        """
+        self._loaders[name] = partial(self._decode, name)
+        self._body_loaders[name] = body_fn
+        if singleton:
+            self._singletons.add(name)
+
+    def register_definition(self, resource_def: ResourceDefinition) -> None:
+        """Register a resource definition's list endpoint, preferring its raw body variant."""
+        if resource_def.list_body_fn:
+            self.register_body(
+                resource_def.name, resource_def.list_body_fn, singleton=resource_def.is_singleton
+            )
+        else:
+            self.register(resource_def.name, resource_def.list_fn)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._loaders
+
+    def prefetch(self, names: Optional[Iterable[str]] = None) -> None:
+        """
+        Fetch the given (default: all registered) list endpoints concurrently.
+
+        Failures are remembered and re-raised when the resource is read, so a
+        broken endpoint only fails the resource that depends on it. Raw bodies
+        are not decoded until read.
+
+        Args:
+            names: Resource type names to fetch
+        """
+        names = [name for name in (names or self._loaders) if name not in self._items]
+        if not names:
+            return
+
+        with ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="prefetch") as executor:
+            futures = {
+                name: executor.submit(contextvars.copy_context().run, self._fetch, name)
+                for name in names
+            }
+        for name, future in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                logger.debug(f"Prefetch of {name} failed: {e}")
+                with self._lock:
+                    self._errors[name] = e
+
+    def get(self, name: str) -> list:
+        """
+        Get the current items of a resource type, fetching them on first use.
+
+        Returns:
+            A copy of the cached list (safe to iterate while writers patch it)
+
+        Raises:
+            KeyError: If no list endpoint is registered for the name
+            Exception: Whatever the list endpoint raised during prefetch
+        """
+        with self._lock:
+            self._drop_stale(name)
+            if name in self._items:
+                return list(self._items[name])
+            error = self._errors.pop(name, None)
+        if error is not None:
+            raise error
+        return list(self._load(name))
+
+    def fingerprint(self, name: str) -> str:
+        """
+        Hash the server's current representation of a resource type.
+
+        Returns:
+            SHA-256 of the response body for raw endpoints (nothing is decoded);
+            otherwise the canonical hash of all cached API models serialized via
+            their `to_dict()`
+
+        Raises:
+            Exception: Whatever the list endpoint raised
+        """
+        if name not in self._body_loaders:
+            items = self.get(name)
+            return canonical_hash(
+                [item.to_dict() if hasattr(item, "to_dict") else item for item in items]
+            )
+
+        with self._lock:
+            self._drop_stale(name)
+            body = self._bodies.get(name)
+            error = self._errors.pop(name, None) if body is None else None
+        if error is not None:
+            raise error
+        if body is None:
+            body = self._fetch_body(name)
+        return hashlib.sha256(body).hexdigest()
+
+    def _drop_stale(self, name: str) -> None:
+        """Forget a list marked stale, so its next read fetches it again (lock held)."""
+        if name in self._stale:
+            self._stale.discard(name)
+            self._items.pop(name, None)
+            self._bodies.pop(name, None)
+
+    def _fetch(self, name: str) -> None:
+        """Fetch a list endpoint (raw bodies are cached undecoded)."""
+        if name in self._body_loaders:
+            self._fetch_body(name)
+        else:
+            self._load(name)
+
+    def _fetch_body(self, name: str) -> bytes:
+        """Call a raw list endpoint and cache its response body."""
+        body = self._body_loaders[name]() or b""
+        with self._lock:
+            return self._bodies.setdefault(name, body)
+
+    def _decode(self, name: str) -> list:
+        """Decode the cached (or freshly fetched) body of a raw list endpoint."""
+        with self._lock:
+            body = self._bodies.get(name)
+        if body is None:
+            body = self._fetch_body(name)
+        return self._parse(name, body)
+
+    def _parse(self, name: str, body: bytes) -> list:
+        """Decode the response body of a raw list endpoint into a list of dicts."""
+        data = json.loads(body) if body else None
+        if name in self._singletons:
+            return [data] if data is not None else []
+        return data or []
+
+    def _load(self, name: str) -> list:
+        """Call the list endpoint and cache its result."""
+        items = list(self._loaders[name]() or [])
+        with self._lock:
+            self._items.setdefault(name, items)
+            return self._items[name]
+
+    def record_created(self, name: str, item: Any) -> Any:
+        """Add an object returned by a create call to the cached list."""
+        with self._lock:
+            cached = self._patchable(name)
+            if _item_id(item) is None:
+                self._stale.add(name)
+            elif cached is not None:
+                cached.append(self._cached_form(name, item))
+        return item
+
+    def record_updated(self, name: str, item: Any) -> Any:
+        """Replace the cached object with the one returned by an update call."""
+        items = item if isinstance(item, list) else [item]
+        with self._lock:
+            cached = self._patchable(name)
+            for updated in items:
+                item_id = _item_id(updated)
+                if item_id is None:
+                    self._stale.add(name)
+                    continue
+                if cached is None:
+                    continue
+                for index, existing in enumerate(cached):
+                    if _item_id(existing) == item_id:
+                        cached[index] = self._cached_form(name, updated)
+                        break
+        return item
+
+    def record_deleted(self, name: str, ids: Iterable[int]) -> None:
+        """Drop deleted objects from the cached list."""
+        ids = set(ids)
+        with self._lock:
+            if self._patchable(name) is not None:
+                self._items[name] = [
+                    item for item in self._items[name] if _item_id(item) not in ids
+                ]
+
+    def _patchable(self, name: str) -> Optional[list]:
+        """
+        Get the cached list of a resource type to patch after a write (lock held).
+
+        Raw lists only cached as a body are decoded first. Their body is dropped,
+        as it no longer matches the server, so the next `fingerprint()` fetches it
+        again while readers keep using the patched items.
+
+        Returns:
+            The cached list, or None if nothing is cached yet (the next read fetches it)
+        """
+        if name in self._body_loaders:
+            body = self._bodies.pop(name, None)
+            if name not in self._items and body is not None:
+                self._items[name] = self._parse(name, body)
+        return self._items.get(name)
+
+    def _cached_form(self, name: str, item: Any) -> Any:
+        """Convert an object returned by a write call to the form its list is cached in."""
+        if name in self._body_loaders and hasattr(item, "model_dump"):
+            # The JSON the list endpoint would return for the object
+            return item.model_dump(mode="json", by_alias=True, exclude_none=True)
+        return item
+
+    def bind(self, resource_def: ResourceDefinition) -> ResourceDefinition:
+        """
+        Wrap a resource definition so it reads from and writes through this snapshot.
+
+        Args:
+            resource_def: Definition whose list endpoint has been registered
+
+        Returns:
+            A copy of the definition whose list_fn is served from the snapshot (in the
+            form registered) and whose create/update/delete calls patch the snapshot
+            with their results
+        """
+        name = resource_def.name
+        create_fn = resource_def.create_fn
+        update_fn = resource_def.update_fn
+        delete_fn = resource_def.delete_fn
+        bulk_update_fn = resource_def.bulk_update_fn
+        bulk_delete_fn = resource_def.bulk_delete_fn
+
+        def delete(id):
+            result = delete_fn(id)
+            self.record_deleted(name, [id])
+            return result
+
+        def bulk_delete(ids):
+            result = bulk_delete_fn(ids)
+            self.record_deleted(name, ids)
+            return result
+
+        return dataclasses.replace(
+            resource_def,
+            list_fn=lambda: self.get(name),
+            list_body_fn=None,
+            create_fn=lambda model: self.record_created(name, create_fn(model)),
+            update_fn=lambda id, model: self.record_updated(name, update_fn(id, model)),
+            delete_fn=delete if delete_fn else None,
+            bulk_update_fn=(
+                (lambda models: self.record_updated(name, bulk_update_fn(models)))
+                if bulk_update_fn
+                else None
+            ),
+            bulk_delete_fn=bulk_delete if bulk_delete_fn else None,
+        )
+
+
+def _item_id(item: Any) -> Any:
+    """Get the ID of an API model or raw JSON dict."""
+    if isinstance(item, dict):
+        return item.get("id")
+    return getattr(item, "id", None)
@@ -0,0 +1,111 @@
+"""Persistent sync state used to skip resource sections that have not changed."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+DEFAULT_STATE_DIR = Path(".configarr")
+
+
+def canonical_hash(obj: Any) -> str:
+    """
+    Hash a JSON-compatible object independently of dict key order.
+
+    Args:
+        obj: Object to hash (non-JSON values are hashed by their string form)
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    payload = json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SectionState:
+    """
+    State recorded after the last successful sync of one resource section.
+
+    Attributes:
+        desired_hash: Canonical hash of the section's YAML configuration
+        server_fingerprint: Hash of the server's list of resources after the sync
+        synced_at: Unix timestamp of the sync
+    """
+
+    desired_hash: str
+    server_fingerprint: str
+    synced_at: float
+
+
+class StateStore:
+    """
+    SQLite-backed store of per-section sync state, keyed by plugin, instance and section.
+
+    A section can be skipped when neither its YAML nor the server's copy of it has
+    changed since it was last synced successfully. The store is safe to share
+    between threads.
+    """
+
+    def __init__(self, state_dir: Path | str = DEFAULT_STATE_DIR):
+        """
+        Open (and create if needed) the state database.
+
+        Args:
+            state_dir: Directory holding the state database
+        """
+        self.path = Path(state_dir) / "state.db"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS section_state (
+                    plugin TEXT NOT NULL,
+                    instance TEXT NOT NULL,
+                    section TEXT NOT NULL,
+                    desired_hash TEXT NOT NULL,
+                    server_fingerprint TEXT NOT NULL,
+                    synced_at REAL NOT NULL,
+                    PRIMARY KEY (plugin, instance, section)
+                )
+                """
+            )
+
+    def __enter__(self) -> "StateStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def get(self, plugin: str, instance: str, section: str) -> Optional[SectionState]:
+        """Get the recorded state of a section, or None if it was never synced."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT desired_hash, server_fingerprint, synced_at FROM section_state "
+                "WHERE plugin = ? AND instance = ? AND section = ?",
+                (plugin, instance, section),
+            ).fetchone()
+        return SectionState(*row) if row else None
+
+    def record(
+        self, plugin: str, instance: str, section: str, desired_hash: str, server_fingerprint: str
+    ) -> None:
+        """Record a successful sync of a section."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO section_state "
+                "(plugin, instance, section, desired_hash, server_fingerprint, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (plugin, instance, section, desired_hash, server_fingerprint, time.time()),
+            )
@@ -0,0 +1,745 @@
+"""Sync engine: probing instances and reconciling their resource types against the config."""
+
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from pydantic import BaseModel
+
+from src.core.config_cache import load_config
+from src.core.config_schema import ConfigarrConfig
+from src.core.deadline import current_deadline, deadline
+from src.core.diff import ChangeSet
+from src.core.pool import get_pool_registry, origin
+from src.core.preflight import (
+    DEFAULT_PREFLIGHT_TIMEOUT,
+    ServerInfo,
+    describe_error,
+    probe,
+    run_preflight,
+)
+from src.core.profiling import phase
+from src.core.reconciler import Reconciler
+from src.core.scheduler import DependencyScheduler
+from src.core.snapshot import InstanceSnapshot
+from src.core.state import DEFAULT_STATE_DIR, StateStore, canonical_hash
+from src.plugins.base import warm_models
+from src.plugins.registry import get_registry
+from src.shared.schemas import ConnectionConfig
+from src.utils.env import get_instance_config
+from src.utils.logger import buffered_logs, get_logger
+
+if TYPE_CHECKING:
+    from src.core.plan import InstancePlan
+
+logger = get_logger("sync")
+
+# Instance fields that configure the connection rather than a resource section
+INSTANCE_SETTINGS = {"name", "base_url", "api_key", "connection"}
+
+# Section fields tuning how a section is synced rather than what the server should contain
+_TUNING_FIELDS = {"concurrency"}
+
+
+@dataclass
+class InstanceResult:
+    """Outcome of syncing a single instance."""
+
+    plugin_name: str
+    instance_name: str
+    success: bool
+    duration: float
+    plan: Optional["InstancePlan"] = None
+
+
+@dataclass
+class ResourceResult:
+    """Outcome of reconciling a single resource type."""
+
+    success: bool
+    changed: bool = False  # Has changes, applied or (in a dry run) only computed
+    errors: int = 0
+    changeset: Optional[ChangeSet] = None
+
+
+@dataclass
+class InstanceConnection:
+    """A client for an instance whose server passed the preflight probe."""
+
+    client: Any
+    base_url: str
+    api_key: str
+    server_info: ServerInfo
+
+
+def collect_instances(config: ConfigarrConfig) -> list[tuple[Any, Any]]:
+    """Get the (plugin, instance config) pair of every configured instance, in plugin order."""
+    registry = get_registry()
+    instances = []
+    for plugin_name in registry.list_names():
+        plugin = registry.get(plugin_name)
+        for instance_config in getattr(config, plugin_name, []):
+            instances.append((plugin, instance_config))
+    return instances
+
+
+def resolve_credentials(plugin, instance_config) -> tuple[str, str]:
+    """
+    Get the base URL and API key of an instance, falling back to environment variables.
+
+    Raises:
+        ValueError: If the credentials are neither configured nor in the environment
+    """
+    base_url = instance_config.base_url
+    api_key = instance_config.api_key
+
+    # If not provided inline, try to load from env
+    if not base_url or not api_key:
+        env_config = get_instance_config(plugin.name.upper(), instance_config.name)
+        base_url = base_url or env_config["base_url"]
+        api_key = api_key or env_config["api_key"]
+    return base_url, api_key
+
+
+def connect_instance(
+    plugin,
+    base_url: str,
+    api_key: str,
+    pool_size: int,
+    timeout: float,
+    connection_config: Optional[ConnectionConfig] = None,
+) -> InstanceConnection:
+    """
+    Create a client for an instance and probe its server.
+
+    Args:
+        timeout: Seconds to wait for each probe request
+        connection_config: Request timeouts and retry settings of the client
+
+    Raises:
+        Exception: If the server is unreachable or rejects the API key
+    """
+    # Size the host's shared connection pool for this instance before its first request
+    get_pool_registry().reserve(base_url, pool_size)
+    client = plugin.get_client(base_url=base_url, api_key=api_key, connection=connection_config)
+    return InstanceConnection(client, base_url, api_key, probe(client, timeout))
+
+
+def connect_configured(plugin, instance_config, timeout: float) -> InstanceConnection:
+    """
+    Create and probe the client of a configured instance.
+
+    Raises:
+        ValueError: If the credentials are neither configured nor in the environment
+        Exception: If the server is unreachable or rejects the API key
+    """
+    base_url, api_key = resolve_credentials(plugin, instance_config)
+    return connect_instance(
+        plugin,
+        base_url,
+        api_key,
+        get_pool_size(instance_config),
+        timeout,
+        getattr(instance_config, "connection", None),
+    )
+
+
+def preflight_instances(
+    targets: list[tuple[Any, str, Callable[[], InstanceConnection]]],
+) -> list[InstanceConnection | Exception]:
+    """
+    Probe every instance concurrently before any of them is synced.
+
+    Args:
+        targets: (plugin, instance name, connect function) per instance
+
+    Returns:
+        Each instance's connection, or the exception that made it unreachable
+    """
+    if not targets:
+        return []
+
+    logger.info(f"Preflight: probing {len(targets)} instance(s)...")
+    results = run_preflight([connect for _, _, connect in targets])
+    for (plugin, instance_name, _), result in zip(targets, results):
+        if isinstance(result, Exception):
+            logger.error(f"  ✗ {plugin.display_name}/{instance_name}: {describe_error(result)}")
+        else:
+            info = result.server_info
+            logger.info(
+                f"  ✓ {plugin.display_name}/{instance_name}: "
+                f"{info.app_name or plugin.display_name} {info.version or '(unknown version)'} "
+                f"({info.latency * 1000:.0f} ms)"
+            )
+    return results
+
+
+def sync_instance(
+    plugin,
+    instance_config,
+    dry_run: bool = False,
+    no_backup: bool = False,
+    state: Optional[StateStore] = None,
+    full: bool = False,
+    plan: Optional["InstancePlan"] = None,
+    connection: Optional[InstanceConnection] = None,
+    preflight_timeout: float = DEFAULT_PREFLIGHT_TIMEOUT,
+    sections: Optional[set[str]] = None,
+):
+    """
+    Sync a single instance using its plugin.
+
+    Uses the connection established by the preflight phase if given; otherwise
+    the server is probed first.
+
+    When a state store is given, sections whose YAML and server representation
+    are unchanged since their last successful sync are skipped (unless `full`),
+    and every successfully applied section is recorded for the next run.
+
+    When an instance plan is given, every computed change is recorded in it
+    together with the server fingerprint it was computed against (use with
+    `dry_run`, so nothing is applied).
+
+    When `sections` is given, only those resource types and the ones depending
+    on them are reconciled.
+
+    Returns:
+        True on success, False on error
+    """
+    instance_name = instance_config.name
+
+    logger.info(f"\n{'='*60}")
+    logger.info(f"Syncing {plugin.display_name} instance: {instance_name}")
+    logger.info(f"{'='*60}\n")
+
+    if connection is None:
+        # Get credentials
+        try:
+            base_url, _ = resolve_credentials(plugin, instance_config)
+        except ValueError as e:
+            logger.error(f"✗ Failed to get credentials for instance '{instance_name}': {e}")
+            return False
+
+        # Test connection
+        logger.info(f"Testing connection to {base_url}...")
+        try:
+            connection = connect_configured(plugin, instance_config, preflight_timeout)
+        except Exception as e:
+            logger.error(
+                f"✗ Connection test failed for instance '{instance_name}': {describe_error(e)}"
+            )
+            return False
+
+    client = connection.client
+    info = connection.server_info
+    logger.info(
+        f"✓ Connected to {info.app_name or plugin.display_name} "
+        f"{info.version or '(unknown version)'} at {connection.base_url}\n"
+    )
+
+    if plan is not None:
+        plan.set_target(connection.base_url, getattr(instance_config, "connection", None))
+
+    with client:
+        # Get resource definitions from plugin
+        resource_definitions = plugin.get_resource_definitions(client, instance_config)
+
+        if not resource_definitions:
+            logger.info("No resources configured for sync")
+            return True
+
+        selected = _with_dependents(resource_definitions, sections)
+        if not selected:
+            logger.info("No affected resources to sync")
+            return True
+
+        with phase("warm_models"):
+            warm_models(rd for rd in resource_definitions if rd.name in selected)
+
+        # Fetch every selected list endpoint once, in parallel; reconcilers read from
+        # this snapshot (other registered lists are only fetched if a mapper needs them)
+        snapshot = InstanceSnapshot()
+        for resource_def in resource_definitions:
+            snapshot.register_definition(resource_def)
+        with phase("prefetch"):
+            snapshot.prefetch(selected)
+        definitions_by_name = {rd.name: snapshot.bind(rd) for rd in resource_definitions}
+        changed: set[str] = set()
+
+        def sync_resource(name: str) -> bool:
+            resource_def = definitions_by_name[name]
+            # Keep each resource's output together while independent resources run concurrently
+            with buffered_logs(), phase("resource", resource=name):
+                if deadline_exceeded(name):
+                    return False
+
+                desired_hash = get_section_hash(instance_config, name)
+                # A dependency that changed may alter this section's mapped IDs
+                deps_changed = any(dep in changed for dep in resource_def.depends_on)
+
+                if state and not full and not deps_changed:
+                    try:
+                        fingerprint = snapshot.fingerprint(name)
+                    except Exception:
+                        fingerprint = None
+                    recorded = state.get(plugin.name, instance_name, name) if fingerprint else None
+                    if recorded and recorded.desired_hash == desired_hash:
+                        if recorded.server_fingerprint == fingerprint:
+                            logger.info(f"Skipping {name}: unchanged since last sync")
+                            return True
+                        logger.info(
+                            f"Drift detected in {name}: changed on the server since last sync"
+                        )
+
+                if plan is not None:
+                    try:
+                        fingerprint = snapshot.fingerprint(name)
+                    except Exception as e:
+                        logger.error(f"  ✗ Failed to fetch {name}: {e}")
+                        return False
+
+                # Build context maps (tag map, custom format map, etc.) once this
+                # resource's dependencies are done, so IDs they created are included
+                context = _build_context_maps(snapshot)
+                result = _sync_resource(resource_def, instance_config, context, dry_run)
+                if result.changed:
+                    changed.add(name)
+
+                if plan is not None and result.success:
+                    plan.add_resource(
+                        resource_def,
+                        fingerprint,
+                        desired_hash,
+                        get_concurrency(instance_config, name),
+                        result.changeset,
+                    )
+
+                # Record the section so the next run can skip it if nothing changes
+                if state and result.success and not result.errors and not dry_run:
+                    try:
+                        state.record(
+                            plugin.name,
+                            instance_name,
+                            name,
+                            desired_hash,
+                            snapshot.fingerprint(name),
+                        )
+                    except Exception as e:
+                        logger.debug(f"Could not record sync state for {name}: {e}")
+                return result.success
+
+        # Reconcile resources in dependency order, independent ones concurrently
+        graph = {rd.name: rd.depends_on for rd in resource_definitions if rd.name in selected}
+        results = DependencyScheduler().run(graph, sync_resource)
+        if not all(results.values()):
+            return False
+
+    logger.info(f"\n✓ Successfully synced {plugin.display_name} instance: {instance_name}")
+    return True
+
+
+def _with_dependents(resource_definitions, sections: Optional[set[str]]) -> list[str]:
+    """
+    Get the names of the given resource types and of every type depending on them.
+
+    Args:
+        resource_definitions: Definitions of the configured resource types
+        sections: Resource type names (None selects every type)
+
+    Returns:
+        Selected names, in definition order
+    """
+    names = [rd.name for rd in resource_definitions]
+    if sections is None:
+        return names
+
+    selected = set(sections) & set(names)
+    grew = True
+    while grew:
+        dependents = {
+            rd.name
+            for rd in resource_definitions
+            if rd.name not in selected and any(dep in selected for dep in rd.depends_on)
+        }
+        selected |= dependents
+        grew = bool(dependents)
+    return [name for name in names if name in selected]
+
+
+def _sync_resource(resource_def, instance_config, context: dict, dry_run: bool) -> ResourceResult:
+    """
+    Reconcile a single resource type of an instance.
+
+    Returns:
+        ResourceResult describing whether the sync succeeded and changed anything
+    """
+    logger.info(f"Syncing {resource_def.name}...")
+
+    # Get YAML definitions for this resource
+    yaml_defs = _get_yaml_definitions(instance_config, resource_def.name)
+
+    if not yaml_defs:
+        logger.info(f"  No {resource_def.name} configured, skipping")
+        return ResourceResult(success=True)
+
+    # Create and run reconciler
+    reconciler = Reconciler(
+        resource_name=resource_def.name,
+        mapper=resource_def.mapper,
+        list_fn=resource_def.list_fn,
+        create_fn=resource_def.create_fn,
+        update_fn=resource_def.update_fn,
+        delete_fn=resource_def.delete_fn,
+        max_workers=get_concurrency(instance_config, resource_def.name),
+        bulk_update_fn=resource_def.bulk_update_fn,
+        bulk_delete_fn=resource_def.bulk_delete_fn,
+        bulk_chunk_size=resource_def.bulk_chunk_size,
+    )
+
+    try:
+        changeset = reconciler.reconcile(
+            desired=yaml_defs,
+            dry_run=dry_run,
+            delete_unmanaged=_should_delete_unmanaged(instance_config, resource_def.name),
+            context=context,
+        )
+    except Exception as e:
+        logger.error(f"  ✗ Failed to sync {resource_def.name}: {e}")
+        return ResourceResult(success=False)
+
+    return ResourceResult(
+        success=True,
+        changed=bool(changeset),
+        errors=len(reconciler.errors),
+        changeset=changeset,
+    )
+
+
+def _build_context_maps(snapshot: InstanceSnapshot) -> dict:
+    """Build context maps needed by mappers (tag IDs, custom format IDs, etc.)."""
+    context = {}
+
+    # Build tag map if tags are being synced
+    if "tags" in snapshot:
+        try:
+            context["tag_map"] = {
+                _get_field(tag, "label"): _get_field(tag, "id") for tag in snapshot.get("tags")
+            }
+        except Exception:
+            context["tag_map"] = {}
+
+    # Build custom format map if custom formats are being synced
+    if "custom_formats" in snapshot:
+        try:
+            context["custom_format_map"] = {
+                _get_field(cf, "name"): _get_field(cf, "id")
+                for cf in snapshot.get("custom_formats")
+            }
+        except Exception:
+            context["custom_format_map"] = {}
+
+    return context
+
+
+def _get_field(item, name: str):
+    """Read a field of a server resource, given as an API model or a raw JSON dict."""
+    if isinstance(item, dict):
+        return item.get(name)
+    return getattr(item, name)
+
+
+def _get_yaml_definitions(instance_config, resource_name: str):
+    """Extract YAML definitions for a specific resource from instance config."""
+    resource_config = getattr(instance_config, resource_name, None)
+    if not resource_config:
+        return []
+
+    # Handle different resource structures
+    if resource_name in ["naming", "media_management"]:
+        # Singleton resources - return the config itself as a single-item list
+        return [resource_config]
+    elif hasattr(resource_config, "definitions"):
+        # Most resources have a 'definitions' list
+        return resource_config.definitions
+    else:
+        return []
+
+
+def get_section_hash(instance_config, resource_name: str) -> str:
+    """
+    Get the canonical hash of a resource section's YAML configuration.
+
+    Tuning knobs that do not change the desired server state (e.g. the write
+    concurrency) are left out, so adjusting them does not force a full resync.
+    """
+    resource_config = getattr(instance_config, resource_name, None)
+    if resource_config is None:
+        return canonical_hash(None)
+    return canonical_hash(resource_config.model_dump(mode="json", exclude=_TUNING_FIELDS))
+
+
+def _should_delete_unmanaged(instance_config, resource_name: str) -> bool:
+    """Check if unmanaged resources should be deleted for this resource type."""
+    resource_config = getattr(instance_config, resource_name, None)
+    if not resource_config:
+        return False
+    return getattr(resource_config, "delete_unmanaged", False)
+
+
+def sync_instances(
+    instances,
+    dry_run: bool,
+    no_backup: bool,
+    jobs: int,
+    state: Optional[StateStore] = None,
+    full: bool = False,
+    new_plan: Optional[Callable[[str, str], "InstancePlan"]] = None,
+    preflight_timeout: float = DEFAULT_PREFLIGHT_TIMEOUT,
+    instance_deadline: Optional[float] = None,
+) -> list[InstanceResult]:
+    """
+    Sync (plugin, instance_config) pairs, running up to `jobs` of them concurrently.
+
+    All instances are probed concurrently first; unreachable ones (or ones whose
+    credentials are missing or rejected) are reported as failed and left out of
+    the run, so a dead host cannot stall the others.
+
+    With more than one job, each instance's log output is buffered and written as a
+    single block once that instance finishes, so output from different instances
+    is never interleaved. With `new_plan` (called with the plugin and instance
+    name), each result carries the instance's plan.
+
+    Each instance runs under its own deadline (its `connection.deadline`, or
+    `instance_deadline`), nested in the caller's deadline for the whole run.
+
+    Returns:
+        One InstanceResult per instance, in input order
+    """
+
+    def run(plugin, instance_config, connection: InstanceConnection) -> InstanceResult:
+        start = time.perf_counter()
+        instance_plan = new_plan(plugin.name, instance_config.name) if new_plan else None
+        try:
+            with deadline(
+                get_instance_deadline(instance_config, instance_deadline),
+                f"instance '{instance_config.name}'",
+            ), phase("instance", instance=instance_config.name):
+                success = sync_instance(
+                    plugin,
+                    instance_config,
+                    dry_run,
+                    no_backup,
+                    state=state,
+                    full=full,
+                    plan=instance_plan,
+                    connection=connection,
+                )
+        except Exception as e:
+            logger.error(f"✗ Unexpected error syncing instance '{instance_config.name}': {e}")
+            success = False
+        return InstanceResult(
+            plugin_name=plugin.display_name,
+            instance_name=instance_config.name,
+            success=success,
+            duration=time.perf_counter() - start,
+            plan=instance_plan,
+        )
+
+    def run_buffered(plugin, instance_config, connection) -> InstanceResult:
+        with buffered_logs():
+            return run(plugin, instance_config, connection)
+
+    _reserve_connection_pools(instances, jobs)
+    with phase("preflight"):
+        connections = preflight_instances(
+            [
+                (
+                    plugin,
+                    instance_config.name,
+                    partial(connect_configured, plugin, instance_config, preflight_timeout),
+                )
+                for plugin, instance_config in instances
+            ]
+        )
+
+    results: list[Optional[InstanceResult]] = [None] * len(instances)
+    reachable = []
+    for index, ((plugin, instance_config), connection) in enumerate(zip(instances, connections)):
+        if isinstance(connection, Exception):
+            results[index] = InstanceResult(
+                plugin_name=plugin.display_name,
+                instance_name=instance_config.name,
+                success=False,
+                duration=0.0,
+            )
+        else:
+            reachable.append((index, plugin, instance_config, connection))
+
+    if jobs <= 1 or len(reachable) <= 1:
+        for index, plugin, instance_config, connection in reachable:
+            results[index] = run(plugin, instance_config, connection)
+        return results
+
+    logger.info(
+        f"Syncing {len(reachable)} instances with {min(jobs, len(reachable))} parallel jobs"
+    )
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="sync") as executor:
+        futures = {
+            index: executor.submit(
+                contextvars.copy_context().run, run_buffered, plugin, instance_config, connection
+            )
+            for index, plugin, instance_config, connection in reachable
+        }
+        for index, future in futures.items():
+            results[index] = future.result()
+    return results
+
+
+def _reserve_connection_pools(instances, jobs: int) -> None:
+    """
+    Size each host's shared connection pool before the first request to it.
+
+    Instances synced in parallel against the same host need their combined
+    number of connections; run one at a time, they need the largest.
+    """
+    sizes: dict[str, int] = {}
+    for _, instance_config in instances:
+        if not instance_config.base_url:
+            continue  # Resolved from the environment; reserved by sync_instance
+        key = origin(instance_config.base_url)
+        size = get_pool_size(instance_config)
+        sizes[key] = sizes.get(key, 0) + size if jobs > 1 else max(sizes.get(key, 0), size)
+
+    registry = get_pool_registry()
+    for key, size in sizes.items():
+        registry.reserve(key, size)
+
+
+def log_summary(results: list[InstanceResult]) -> None:
+    """Log a per-instance summary of a sync run."""
+    if len(results) <= 1:
+        return
+
+    logger.info(f"\n{'='*60}")
+    logger.info("Sync summary")
+    logger.info(f"{'='*60}")
+    for result in results:
+        status = "✓" if result.success else "✗"
+        logger.info(
+            f"  {status} {result.plugin_name}/{result.instance_name} ({result.duration:.1f}s)"
+        )
+    succeeded = sum(1 for result in results if result.success)
+    logger.info(f"{succeeded}/{len(results)} instance(s) synced successfully")
+
+
+def get_concurrency(instance_config, resource_name: str) -> int:
+    """Get the maximum number of parallel API writes configured for a resource type."""
+    resource_config = getattr(instance_config, resource_name, None)
+    if not resource_config:
+        return 1
+    return getattr(resource_config, "concurrency", 1)
+
+
+def get_pool_size(instance_config) -> int:
+    """
+    Get the number of connections an instance may use at once.
+
+    Configured sections are prefetched in parallel and independent sections are
+    reconciled concurrently, each with up to its configured write concurrency.
+    """
+    sections = [
+        value
+        for name in type(instance_config).model_fields
+        if name not in INSTANCE_SETTINGS
+        and isinstance(value := getattr(instance_config, name, None), BaseModel)
+    ]
+    return max(1, len(sections), sum(getattr(section, "concurrency", 1) for section in sections))
+
+
+def get_instance_deadline(instance_config, default: Optional[float]) -> Optional[float]:
+    """
+    Get the time limit in seconds of an instance's sync (None for unlimited).
+
+    Args:
+        instance_config: Instance config, or an instance plan (both carry `connection`)
+        default: Limit of instances without a configured `connection.deadline`
+    """
+    connection = getattr(instance_config, "connection", None)
+    configured = getattr(connection, "deadline", None)
+    return configured if configured is not None else default
+
+
+def deadline_exceeded(name: str) -> bool:
+    """Log and return True if the current deadline passed before a resource type started."""
+    active = current_deadline()
+    if active is None or not active.expired:
+        return False
+    logger.error(f"✗ Skipping {name}: {active.label} deadline exceeded")
+    return True
+
+
+def sync_config(
+    config_path: Path,
+    dry_run: bool = False,
+    no_backup: bool = False,
+    jobs: int = 1,
+    full: bool = False,
+    state_dir: Optional[Path] = DEFAULT_STATE_DIR,
+    preflight_timeout: float = DEFAULT_PREFLIGHT_TIMEOUT,
+    instance_deadline: Optional[float] = None,
+) -> int:
+    """
+    Sync configuration to servers.
+
+    Args:
+        config_path: Path to the YAML config file
+        dry_run: Only show changes without applying them
+        no_backup: Skip creating a backup before sync
+        jobs: Maximum number of instances to sync concurrently
+        full: Reconcile every section, even those unchanged since the last sync
+        state_dir: Directory of the incremental sync state and config cache (None disables them)
+        preflight_timeout: Seconds to wait for each preflight probe request
+        instance_deadline: Default time limit in seconds of each instance
+
+    Returns:
+        0 on success, 1 if any instance failed
+
+    Raises:
+        FileNotFoundError: If the config file (or an included file) doesn't exist
+        ValidationError: If the config is invalid
+    """
+    logger.info(f"Loading config file: {config_path}")
+    with phase("load_config"):
+        config = load_config(config_path, state_dir)
+
+    if dry_run:
+        logger.info("\n🔍 DRY RUN MODE - No changes will be applied\n")
+
+    state = StateStore(state_dir) if state_dir else None
+    try:
+        results = sync_instances(
+            collect_instances(config),
+            dry_run,
+            no_backup,
+            jobs,
+            state=state,
+            full=full,
+            preflight_timeout=preflight_timeout,
+            instance_deadline=instance_deadline,
+        )
+    finally:
+        if state:
+            state.close()
+    log_summary(results)
+    get_pool_registry().log_stats()
+
+    if all(result.success for result in results):
+        logger.info("\n✓ All instances synced successfully")
+        return 0
+    else:
+        logger.error("\n✗ Some instances failed to sync")
+        return 1
@@ -0,0 +1,290 @@
+"""Client-side rate limiting and adaptive concurrency control per host."""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from src.core.deadline import DeadlineExceeded, current_deadline
+from src.core.pool import origin
+from src.utils.logger import get_logger
+
+logger = get_logger("throttle")
+
+
+def _wait_timeout() -> Optional[float]:
+    """Seconds a request may wait for its turn (None if there is no deadline)."""
+    deadline = current_deadline()
+    if deadline is None:
+        return None
+    deadline.check()
+    return deadline.remaining()
+
+
+class TokenBucket:
+    """
+    Token bucket limiting the request rate to a host.
+
+    Holds up to `burst` tokens, refilled at `rate` tokens per second; every
+    request takes one token, waiting for it if the bucket is empty.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the bucket (full).
+
+        Args:
+            rate: Sustained requests per second
+            burst: Requests that may be sent at once after a quiet period
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Take a token, waiting until one is available.
+
+        Raises:
+            DeadlineExceeded: If the current deadline passes before a token is available
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+
+            timeout = _wait_timeout()
+            if timeout is not None and timeout < wait:
+                raise DeadlineExceeded(f"{current_deadline().label} deadline exceeded")
+            time.sleep(wait)
+
+
+@dataclass
+class RequestOutcome:
+    """
+    Result of a request, reported back to the concurrency limiter.
+
+    Attributes:
+        failed: True if the server was overloaded or failed (5xx, 429, timeout)
+    """
+
+    failed: bool = False
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD (additive increase, multiplicative decrease) limit on in-flight requests.
+
+    The limit starts at the maximum, is cut by `decrease_factor` when latency
+    rises well above the best latency seen recently or a request fails with an
+    overload symptom (429, 5xx, timeout), and grows back by about one per round
+    of requests while latency stays flat. Fast servers keep the configured
+    parallelism, while small, SQLite-backed servers are backed off until they
+    stay responsive.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        initial: Optional[int] = None,
+        minimum: int = 1,
+        maximum: int = 8,
+        latency_tolerance: float = 2.0,
+        decrease_factor: float = 0.7,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            key: Origin of the host (used in messages)
+            initial: Starting limit (None for `maximum`)
+            minimum: Lowest limit
+            maximum: Highest limit
+            latency_tolerance: Ratio of smoothed to baseline latency treated as congestion
+            decrease_factor: Factor applied to the limit on congestion or failure
+        """
+        self.key = key
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.latency_tolerance = latency_tolerance
+        self.decrease_factor = decrease_factor
+        initial = self.maximum if initial is None else initial
+        self._limit = float(min(max(initial, self.minimum), self.maximum))
+        self._in_flight = 0
+        self._baseline: Optional[float] = None
+        self._smoothed: Optional[float] = None
+        self._since_decrease = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current maximum number of in-flight requests."""
+        return int(self._limit)
+
+    @contextmanager
+    def slot(self) -> Iterator[RequestOutcome]:
+        """
+        Hold one in-flight slot while sending a request.
+
+        Exceptions raised inside the block count as failures; otherwise the
+        block reports failures by setting `failed` on the yielded outcome.
+
+        Raises:
+            DeadlineExceeded: If the current deadline passes before a slot is free
+        """
+        with self._condition:
+            while self._in_flight >= self.limit:
+                timeout = _wait_timeout()
+                if not self._condition.wait(timeout) and timeout is not None:
+                    raise DeadlineExceeded(f"{current_deadline().label} deadline exceeded")
+            self._in_flight += 1
+
+        outcome = RequestOutcome()
+        start = time.monotonic()
+        try:
+            yield outcome
+        except Exception:
+            outcome.failed = True
+            raise
+        finally:
+            self._release(time.monotonic() - start, outcome.failed)
+
+    def _release(self, latency: float, failed: bool) -> None:
+        """Free a slot and adjust the limit from the request's latency and outcome."""
+        with self._condition:
+            self._in_flight -= 1
+            previous = self.limit
+
+            # Baseline: best recent latency, allowed to drift up slowly as load changes
+            if self._baseline is None or latency < self._baseline:
+                self._baseline = latency
+            else:
+                self._baseline += (latency - self._baseline) * 0.01
+            self._smoothed = (
+                latency if self._smoothed is None else self._smoothed * 0.7 + latency * 0.3
+            )
+            # Ignore jitter of fast requests; only sustained slowdowns count as congestion
+            congested = (
+                self._smoothed > self._baseline * self.latency_tolerance
+                and self._smoothed - self._baseline > 0.05
+            )
+
+            self._since_decrease += 1
+            if failed or congested:
+                # Decrease at most once per round of requests, not once per slow reply
+                if self._since_decrease >= previous:
+                    self._limit = max(self.minimum, self._limit * self.decrease_factor)
+                    self._since_decrease = 0
+            else:
+                self._limit = min(self.maximum, self._limit + 1 / self._limit)
+
+            if self.limit != previous:
+                logger.debug(
+                    f"Concurrency limit for {self.key}: {previous} -> {self.limit} "
+                    f"(latency {self._smoothed * 1000:.0f} ms, "
+                    f"baseline {self._baseline * 1000:.0f} ms"
+                    f"{', failure' if failed else ''})"
+                )
+            self._condition.notify_all()
+
+
+class HostThrottle:
+    """Rate limit and concurrency limit applied to every request to one host."""
+
+    def __init__(
+        self,
+        bucket: Optional[TokenBucket] = None,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    ):
+        self.bucket = bucket
+        self.limiter = limiter
+
+    @contextmanager
+    def request(self) -> Iterator[RequestOutcome]:
+        """
+        Wait for the host's rate and concurrency limits, then hold a slot.
+
+        Raises:
+            DeadlineExceeded: If the current deadline passes while waiting
+        """
+        if self.bucket:
+            self.bucket.acquire()
+        if self.limiter is None:
+            yield RequestOutcome()
+            return
+        with self.limiter.slot() as outcome:
+            yield outcome
+
+
+class ThrottleRegistry:
+    """Hands out one throttle per host, shared by all clients of a run."""
+
+    def __init__(self):
+        self._throttles: dict[str, HostThrottle] = {}
+        self._settings: dict[str, tuple] = {}
+        self._warned: set[tuple[str, tuple]] = set()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        url: str,
+        rate_limit: Optional[float] = None,
+        burst: int = 1,
+        max_concurrency: Optional[int] = None,
+    ) -> HostThrottle:
+        """
+        Get the throttle of a host, creating it on first use.
+
+        The limits are shared by every client of the host, so the first client
+        to ask for it decides them; later clients asking for different limits
+        get a warning and the existing throttle.
+
+        Args:
+            url: Any URL on the host
+            rate_limit: Requests per second (None for unlimited)
+            burst: Requests that may be sent at once under the rate limit
+            max_concurrency: Upper bound of the adaptive concurrency limit (None
+                disables adaptive concurrency)
+
+        Returns:
+            Throttle shared by all callers for the host
+        """
+        key = origin(url)
+        settings = (rate_limit, burst, max_concurrency)
+        with self._lock:
+            throttle = self._throttles.get(key)
+            if throttle is None:
+                throttle = HostThrottle(
+                    TokenBucket(rate_limit, burst) if rate_limit else None,
+                    AdaptiveConcurrencyLimiter(key, maximum=max_concurrency)
+                    if max_concurrency
+                    else None,
+                )
+                self._throttles[key] = throttle
+                self._settings[key] = settings
+            elif self._settings[key] != settings and (key, settings) not in self._warned:
+                self._warned.add((key, settings))
+                rate, _, concurrency = self._settings[key]
+                logger.warning(
+                    f"Ignoring different connection limits for {key}: all clients of a host "
+                    f"share the limits of the first one (rate_limit {rate}, "
+                    f"max_concurrency {concurrency})"
+                )
+            return throttle
+
+
+# Global registry instance
+_registry = ThrottleRegistry()
+
+
+def get_throttles() -> ThrottleRegistry:
+    """Get the global throttle registry."""
+    return _registry
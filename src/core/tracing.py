@@ -0,0 +1,111 @@
+"""Span tracing of sync runs, exported as Chrome trace-event JSON (`--trace`)."""
+
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+
+class Tracer:
+    """
+    Records spans (named, timed intervals) of a run.
+
+    Spans are written as Chrome trace-event "complete" events, one track per
+    thread, so the file can be opened in Perfetto (ui.perfetto.dev) or
+    chrome://tracing to see which instances, resources and requests ran
+    concurrently and which ones waited on each other.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.events: list[dict[str, Any]] = []
+        # Names of the threads seen per thread ID (IDs are reused by later threads)
+        self._threads: dict[int, list[str]] = {}
+        self._lock = threading.Lock()
+
+    def add_span(
+        self, name: str, category: str, start: float, end: float, args: dict[str, Any]
+    ) -> None:
+        """
+        Record a finished span.
+
+        Args:
+            name: Span name (e.g., "instance", "GET /api/v3/tag")
+            category: Span category (e.g., "phase", "http")
+            start: Start on the `time.perf_counter()` clock
+            end: End on the `time.perf_counter()` clock
+            args: Details shown with the span (labels, status, ...)
+        """
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self.started) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": thread.ident,
+            "args": args,
+        }
+        with self._lock:
+            self.events.append(event)
+            names = self._threads.setdefault(thread.ident, [])
+            if thread.name not in names:
+                names.append(thread.name)
+
+    def to_json(self) -> dict[str, Any]:
+        """Build the trace in Chrome trace-event format."""
+        with self._lock:
+            events = list(self.events)
+            threads = {tid: ", ".join(names) for tid, names in self._threads.items()}
+
+        pid = os.getpid()
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "configarr"}}
+        ]
+        metadata.extend(
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in threads.items()
+        )
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Path | str) -> None:
+        """Write the trace as JSON."""
+        Path(path).write_text(json.dumps(self.to_json()), encoding="utf-8")
+
+
+# Tracer of the current run (None unless --trace is given)
+_current_tracer: contextvars.ContextVar[Optional[Tracer]] = contextvars.ContextVar(
+    "tracer", default=None
+)
+
+
+def current_tracer() -> Optional[Tracer]:
+    """Get the tracer of the current context, or None if tracing is off."""
+    return _current_tracer.get()
+
+
+@contextmanager
+def tracing(enabled: bool = True) -> Iterator[Optional[Tracer]]:
+    """
+    Trace the work done inside the block.
+
+    Args:
+        enabled: Whether to trace at all (yields None if not)
+
+    Yields:
+        The active tracer (None if disabled)
+    """
+    if not enabled:
+        yield None
+        return
+    token = _current_tracer.set(Tracer())
+    try:
+        yield _current_tracer.get()
+    finally:
+        _current_tracer.reset(token)
+
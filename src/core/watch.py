@@ -0,0 +1,63 @@
+"""Polling file watcher used by `configarr serve` to notice config changes."""
+
+import os
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+def _stat_key(path: Path) -> Optional[tuple[int, int]]:
+    """Modification time and size of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class FileWatcher:
+    """
+    Detects changes to a set of files by polling their modification time and size.
+
+    Polling needs no platform-specific APIs and costs one `stat()` per file per
+    check, which is negligible for a config file and its includes. Files that
+    do not exist yet are watched too and count as changed once created.
+    """
+
+    def __init__(self, paths: Iterable[Path | str] = ()):
+        """
+        Initialize the watcher.
+
+        Args:
+            paths: Files to watch (their current state is the baseline)
+        """
+        self._snapshot: dict[Path, Optional[tuple[int, int]]] = {}
+        self.watch(paths)
+
+    @property
+    def paths(self) -> list[Path]:
+        """Files being watched."""
+        return list(self._snapshot)
+
+    def watch(self, paths: Iterable[Path | str]) -> None:
+        """
+        Replace the watched files, taking their current state as the baseline.
+
+        Args:
+            paths: Files to watch
+        """
+        self._snapshot = {Path(path).resolve(): _stat_key(Path(path)) for path in paths}
+
+    def changed(self) -> list[Path]:
+        """
+        Get the files that changed since the last call (or since `watch()`).
+
+        Returns:
+            Changed, created or deleted files (empty if nothing changed)
+        """
+        changed = []
+        for path, previous in self._snapshot.items():
+            current = _stat_key(path)
+            if current != previous:
+                self._snapshot[path] = current
+                changed.append(path)
+        return changed
@@ -2,17 +2,54 @@
 
 import argparse
 import sys
+import traceback
+from functools import partial
 from pathlib import Path
+from typing import Callable
 
 from pydantic import ValidationError
 
+from src.core.config_cache import log_config_error
 from src.core.config_schema import ConfigarrConfig
-from src.core.reconciler import Reconciler
+from src.core.deadline import deadline
+from src.core.plan import apply_plan, plan_config
+from src.core.preflight import DEFAULT_PREFLIGHT_TIMEOUT
+from src.core.profiling import phase, profiling
+from src.core.serve import serve_config
+from src.core.state import DEFAULT_STATE_DIR
+from src.core.sync import sync_config
+from src.core.tracing import tracing
 from src.plugins.registry import get_registry
-from src.utils.env import get_instance_config, load_environment
+from src.utils.env import load_environment
 from src.utils.logger import get_logger, setup_logger
 from src.utils.yaml_loader import load_yaml_config
 
+logger = get_logger("main")
+
+
+def _positive_int(value: str) -> int:
+    """Parse a command-line integer that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _positive_float(value: str) -> float:
+    """Parse a command-line number that must be greater than 0."""
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
+def _non_negative_float(value: str) -> float:
+    """Parse a command-line number that must not be negative."""
+    number = float(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative, got {value}")
+    return number
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command-line arguments."""
@@ -25,17 +62,88 @@ def parse_args() -> argparse.Namespace:
         "--version", action="version", version="0.1.0", help="Show version and exit"
     )
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    # Options shared by several commands
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "-v", "--verbose", action="store_true", help="Enable verbose logging (DEBUG level)"
+    )
 
-    # Sync command
-    sync_parser = subparsers.add_parser("sync", help="Sync configuration to servers")
-    sync_parser.add_argument(
+    config = argparse.ArgumentParser(add_help=False)
+    config.add_argument(
         "-c",
         "--config",
         type=Path,
         default=Path("config/sonarr.yaml"),
         help="Path to config file (default: config/sonarr.yaml)",
     )
+
+    connect = argparse.ArgumentParser(add_help=False)
+    connect.add_argument(
+        "--state-dir",
+        type=Path,
+        default=DEFAULT_STATE_DIR,
+        help="Directory for incremental sync state and the config cache "
+        f"(default: {DEFAULT_STATE_DIR})",
+    )
+    connect.add_argument(
+        "--preflight-timeout",
+        type=float,
+        default=DEFAULT_PREFLIGHT_TIMEOUT,
+        help="Seconds to wait for each preflight probe request "
+        f"(default: {DEFAULT_PREFLIGHT_TIMEOUT:g})",
+    )
+    connect.add_argument(
+        "--instance-deadline",
+        type=float,
+        metavar="SECONDS",
+        help="Default time limit per instance (overridden by its connection.deadline)",
+    )
+
+    run = argparse.ArgumentParser(add_help=False)
+    run.add_argument(
+        "--deadline",
+        type=float,
+        metavar="SECONDS",
+        help="Abort outstanding work once the whole run has taken this long",
+    )
+    run.add_argument(
+        "--profile",
+        type=Path,
+        nargs="?",
+        const=Path("profile.json"),
+        metavar="FILE",
+        help="Time each phase and HTTP call; print a summary and write a JSON report "
+        "(default file: profile.json)",
+    )
+    run.add_argument(
+        "--trace",
+        type=Path,
+        metavar="FILE",
+        help="Write a Chrome trace-event file of the run (open in ui.perfetto.dev)",
+    )
+
+    diff = argparse.ArgumentParser(add_help=False)
+    diff.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        help="Number of instances to process in parallel (default: 1)",
+    )
+    diff.add_argument(
+        "--full",
+        action="store_true",
+        help="Diff every section, even those unchanged since the last sync",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # Sync command
+    sync_parser = subparsers.add_parser(
+        "sync",
+        parents=[common, config, connect, run, diff],
+        help="Sync configuration to servers",
+    )
     sync_parser.add_argument(
         "--dry-run", action="store_true", help="Show changes without applying them"
     )
@@ -44,266 +152,137 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Skip creating backup before sync (NOT RECOMMENDED)",
     )
-    sync_parser.add_argument(
-        "-v", "--verbose", action="store_true", help="Enable verbose logging (DEBUG level)"
-    )
 
-    # Validate command
-    validate_parser = subparsers.add_parser("validate", help="Validate configuration file")
-    validate_parser.add_argument(
-        "-c",
-        "--config",
+    # Plan command
+    plan_parser = subparsers.add_parser(
+        "plan",
+        parents=[common, config, connect, run, diff],
+        help="Compute changes and save them to a plan file for `apply`",
+    )
+    plan_parser.add_argument(
+        "-o",
+        "--output",
         type=Path,
-        default=Path("config/sonarr.yaml"),
-        help="Path to config file (default: config/sonarr.yaml)",
+        default=Path("plan.json"),
+        help="Path of the plan file to write (default: plan.json)",
     )
-    validate_parser.add_argument(
-        "-v", "--verbose", action="store_true", help="Enable verbose logging (DEBUG level)"
+
+    # Apply command
+    apply_parser = subparsers.add_parser(
+        "apply", parents=[common, connect, run], help="Apply a plan file written by `plan`"
+    )
+    apply_parser.add_argument("plan", type=Path, help="Path to the plan file")
+
+    # Serve command
+    serve_parser = subparsers.add_parser(
+        "serve",
+        parents=[common, config, connect],
+        help="Keep servers in sync, re-syncing whenever the config changes",
+    )
+    serve_parser.add_argument(
+        "--interval",
+        type=_positive_float,
+        default=2.0,
+        metavar="SECONDS",
+        help="Seconds between checks of the config file and its includes (default: 2)",
+    )
+    serve_parser.add_argument(
+        "--drift-interval",
+        type=_non_negative_float,
+        default=300.0,
+        metavar="SECONDS",
+        help="Seconds between checks for changes made on the servers; 0 disables them "
+        "(default: 300)",
+    )
+    serve_parser.add_argument(
+        "--dry-run", action="store_true", help="Show changes without applying them"
+    )
+
+    # Validate command
+    subparsers.add_parser(
+        "validate", parents=[common, config], help="Validate configuration file"
     )
 
     return parser.parse_args()
 
 
-def validate_config(config_path: Path, verbose: bool = False) -> int:
+def validate_config(config_path: Path) -> int:
     """
     Validate a config file.
 
     Returns:
-        0 on success, 1 on error
-    """
-    logger = setup_logger(verbose=verbose)
-    
-    # Load environment variables for interpolation
-    load_environment()
+        0 on success
 
-    logger.info(f"Validating config file: {config_path}")
-
-    try:
-        # Load and parse YAML
-        raw_config = load_yaml_config(config_path)
-        logger.debug(f"Loaded raw config: {len(raw_config)} top-level keys")
-
-        # Validate with Pydantic
-        config = ConfigarrConfig(**raw_config)
-        logger.info("✓ Config validation successful")
-        
-        # Report instances by plugin
-        registry = get_registry()
-        for plugin_name in registry.list_names():
-            instances = getattr(config, plugin_name, [])
-            if instances:
-                plugin = registry.get(plugin_name)
-                logger.info(f"  Found {len(instances)} {plugin.display_name} instance(s)")
-                for instance in instances:
-                    logger.info(f"    - {instance.name}")
-
-        return 0
-
-    except FileNotFoundError as e:
-        logger.error(f"✗ Config file not found: {e}")
-        return 1
-    except ValidationError as e:
-        logger.error("✗ Config validation failed:")
-        for error in e.errors():
-            loc = " -> ".join(str(l) for l in error["loc"])
-            logger.error(f"    {loc}: {error['msg']}")
-        return 1
-    except Exception as e:
-        logger.error(f"✗ Unexpected error: {e}")
-        return 1
-
-
-def sync_instance(plugin, instance_config, dry_run: bool = False, no_backup: bool = False, logger=None):
-    """
-    Sync a single instance using its plugin.
-
-    Returns:
-        True on success, False on error
+    Raises:
+        FileNotFoundError: If the config file (or an included file) doesn't exist
+        ValidationError: If the config is invalid
     """
-    instance_name = instance_config.name
+    logger.info(f"Validating config file: {config_path}")
 
-    logger.info(f"\n{'='*60}")
-    logger.info(f"Syncing {plugin.display_name} instance: {instance_name}")
-    logger.info(f"{'='*60}\n")
+    # Load and parse YAML
+    raw_config = load_yaml_config(config_path)
+    logger.debug(f"Loaded raw config: {len(raw_config)} top-level keys")
 
-    # Get credentials
-    base_url = instance_config.base_url
-    api_key = instance_config.api_key
+    # Validate with Pydantic
+    config = ConfigarrConfig(**raw_config)
+    logger.info("✓ Config validation successful")
 
-    # If not provided inline, try to load from env
-    if not base_url or not api_key:
-        try:
-            env_config = get_instance_config(plugin.name.upper(), instance_name)
-            base_url = base_url or env_config["base_url"]
-            api_key = api_key or env_config["api_key"]
-        except ValueError as e:
-            logger.error(f"✗ Failed to get credentials for instance '{instance_name}': {e}")
-            return False
-
-    # Initialize client
-    client = plugin.get_client(base_url=base_url, api_key=api_key)
-
-    # Test connection
-    logger.info(f"Testing connection to {base_url}...")
-    try:
-        with client:
-            # Simple connection test - check if we can access the client
-            logger.info("✓ Connection successful\n")
-    except Exception as e:
-        logger.error(f"✗ Connection test failed for instance '{instance_name}': {e}")
-        return False
-
-    with client:
-        # Get resource definitions from plugin
-        resource_definitions = plugin.get_resource_definitions(client, instance_config)
-        
-        if not resource_definitions:
-            logger.info("No resources configured for sync")
-            return True
-
-        # Build context maps (tag map, custom format map, etc.)
-        context = _build_context_maps(client, resource_definitions)
-
-        # Sync each resource in order
-        for resource_def in sorted(resource_definitions, key=lambda r: r.order):
-            logger.info(f"Syncing {resource_def.name}...")
-            
-            # Get YAML definitions for this resource
-            yaml_defs = _get_yaml_definitions(instance_config, resource_def.name)
-            
-            if not yaml_defs:
-                logger.info(f"  No {resource_def.name} configured, skipping")
-                continue
-
-            # Create and run reconciler
-            reconciler = Reconciler(
-                resource_name=resource_def.name,
-                mapper=resource_def.mapper,
-                list_fn=resource_def.list_fn,
-                create_fn=resource_def.create_fn,
-                update_fn=resource_def.update_fn,
-                delete_fn=resource_def.delete_fn,
-            )
-
-            try:
-                reconciler.reconcile(
-                    desired=yaml_defs,
-                    dry_run=dry_run,
-                    delete_unmanaged=_should_delete_unmanaged(instance_config, resource_def.name),
-                    context=context,
-                )
-            except Exception as e:
-                logger.error(f"  ✗ Failed to sync {resource_def.name}: {e}")
-                return False
-
-    logger.info(f"\n✓ Successfully synced {plugin.display_name} instance: {instance_name}")
-    return True
-
-
-def _build_context_maps(client, resource_definitions) -> dict:
-    """Build context maps needed by mappers (tag IDs, custom format IDs, etc.)."""
-    context = {}
-    
-    # Build tag map if tags are being synced
-    if any(rd.name == "tags" for rd in resource_definitions):
-        try:
-            tags = client.tags.api_v3_tag_get()
-            context["tag_map"] = {tag.label: tag.id for tag in tags}
-        except:
-            context["tag_map"] = {}
-    
-    # Build custom format map if custom formats are being synced
-    if any(rd.name == "custom_formats" for rd in resource_definitions):
-        try:
-            cfs = client.custom_formats.api_v3_customformat_get()
-            context["custom_format_map"] = {cf.name: cf.id for cf in cfs}
-        except:
-            context["custom_format_map"] = {}
-    
-    return context
-
-
-def _get_yaml_definitions(instance_config, resource_name: str):
-    """Extract YAML definitions for a specific resource from instance config."""
-    resource_config = getattr(instance_config, resource_name, None)
-    if not resource_config:
-        return []
-    
-    # Handle different resource structures
-    if resource_name in ["naming", "media_management"]:
-        # Singleton resources - return the config itself as a single-item list
-        return [resource_config]
-    elif hasattr(resource_config, "definitions"):
-        # Most resources have a 'definitions' list
-        return resource_config.definitions
-    else:
-        return []
+    # Report instances by plugin
+    registry = get_registry()
+    for plugin_name in registry.list_names():
+        instances = getattr(config, plugin_name, [])
+        if instances:
+            display_name = registry.display_name(plugin_name)
+            logger.info(f"  Found {len(instances)} {display_name} instance(s)")
+            for instance in instances:
+                logger.info(f"    - {instance.name}")
 
+    return 0
 
-def _should_delete_unmanaged(instance_config, resource_name: str) -> bool:
-    """Check if unmanaged resources should be deleted for this resource type."""
-    resource_config = getattr(instance_config, resource_name, None)
-    if not resource_config:
-        return False
-    return getattr(resource_config, "delete_unmanaged", False)
 
-
-def sync_config(config_path: Path, dry_run: bool = False, no_backup: bool = False, verbose: bool = False) -> int:
+def run_command(args: argparse.Namespace, command: Callable[[], int]) -> int:
     """
-    Sync configuration to servers.
+    Run a command with the logging, profiling and error handling shared by all commands.
+
+    Args:
+        args: Parsed command-line arguments
+        command: Runs the command and returns its exit code
 
     Returns:
-        0 on success, 1 on error
+        The command's exit code, or 1 if it raised
     """
-    logger = setup_logger(verbose=verbose)
-    
-    # Load environment variables
+    setup_logger(verbose=args.verbose)
+    # Load environment variables (for config interpolation and instance credentials)
     load_environment()
 
-    logger.info(f"Loading config file: {config_path}")
-
-    try:
-        # Load and validate config
-        raw_config = load_yaml_config(config_path)
-        config = ConfigarrConfig(**raw_config)
-
-        if dry_run:
-            logger.info("\n🔍 DRY RUN MODE - No changes will be applied\n")
-
-        # Get plugin registry
-        registry = get_registry()
-
-        # Sync instances for each plugin
-        success = True
-        for plugin_name in registry.list_names():
-            plugin = registry.get(plugin_name)
-            instances = getattr(config, plugin_name, [])
-            
-            for instance_config in instances:
-                if not sync_instance(plugin, instance_config, dry_run, no_backup, logger):
-                    success = False
-
-        if success:
-            logger.info("\n✓ All instances synced successfully")
-            return 0
-        else:
-            logger.error("\n✗ Some instances failed to sync")
-            return 1
-
-    except FileNotFoundError as e:
-        logger.error(f"✗ Config file not found: {e}")
-        return 1
-    except ValidationError as e:
-        logger.error("✗ Config validation failed:")
-        for error in e.errors():
-            loc = " -> ".join(str(l) for l in error["loc"])
-            logger.error(f"    {loc}: {error['msg']}")
-        return 1
-    except Exception as e:
-        logger.error(f"✗ Unexpected error: {e}")
-        import traceback
-        logger.debug(traceback.format_exc())
-        return 1
+    profile = getattr(args, "profile", None)
+    trace = getattr(args, "trace", None)
+    with profiling(profile is not None) as profiler, tracing(trace is not None) as tracer:
+        try:
+            with phase("run"), deadline(getattr(args, "deadline", None), "run"):
+                exit_code = command()
+        except (FileNotFoundError, ValidationError) as e:
+            log_config_error(e)
+            exit_code = 1
+        except Exception as e:
+            logger.error(f"✗ Unexpected error: {e}")
+            logger.debug(traceback.format_exc())
+            exit_code = 1
+
+    if tracer:
+        try:
+            tracer.write(trace)
+            logger.info(f"\n✓ Trace written to {trace}")
+        except OSError as e:
+            logger.error(f"✗ Failed to write trace: {e}")
+    if profiler:
+        profiler.log_summary()
+        try:
+            profiler.write(profile)
+            logger.info(f"\n✓ Profile written to {profile}")
+        except OSError as e:
+            logger.error(f"✗ Failed to write profile: {e}")
+    return exit_code
 
 
 def main():
@@ -311,13 +290,55 @@ def main():
     args = parse_args()
 
     if args.command == "validate":
-        return validate_config(args.config, args.verbose)
+        command = partial(validate_config, args.config)
     elif args.command == "sync":
-        return sync_config(args.config, args.dry_run, args.no_backup, args.verbose)
+        command = partial(
+            sync_config,
+            args.config,
+            args.dry_run,
+            args.no_backup,
+            args.jobs,
+            full=args.full,
+            state_dir=args.state_dir,
+            preflight_timeout=args.preflight_timeout,
+            instance_deadline=args.instance_deadline,
+        )
+    elif args.command == "plan":
+        command = partial(
+            plan_config,
+            args.config,
+            args.output,
+            args.jobs,
+            full=args.full,
+            state_dir=args.state_dir,
+            preflight_timeout=args.preflight_timeout,
+            instance_deadline=args.instance_deadline,
+        )
+    elif args.command == "apply":
+        command = partial(
+            apply_plan,
+            args.plan,
+            state_dir=args.state_dir,
+            preflight_timeout=args.preflight_timeout,
+            instance_deadline=args.instance_deadline,
+        )
+    elif args.command == "serve":
+        command = partial(
+            serve_config,
+            args.config,
+            interval=args.interval,
+            drift_interval=args.drift_interval,
+            dry_run=args.dry_run,
+            state_dir=args.state_dir,
+            preflight_timeout=args.preflight_timeout,
+            instance_deadline=args.instance_deadline,
+        )
     else:
         print("No command specified. Use --help for usage information.")
         return 1
 
+    return run_command(args, command)
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -2,10 +2,12 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Callable, Protocol
+from typing import Any, Callable, Iterable, Optional, Protocol, get_args
 
 from pydantic import BaseModel
 
+from src.shared.schemas import ConnectionConfig
+
 
 class ArrClient(Protocol):
     """
@@ -23,6 +25,10 @@ class ArrClient(Protocol):
         """Exit the context manager."""
         ...
 
+    def probe(self, timeout: float) -> dict[str, Any]:
+        """Check that the server is reachable and accepts the credentials; return its status."""
+        ...
+
 
 @dataclass
 class ResourceDefinition:
@@ -31,23 +37,77 @@ class ResourceDefinition:
     
     Attributes:
         name: Resource type name (e.g., "tags", "custom_formats")
-        order: Sync order priority (lower numbers sync first)
         mapper: ResourceMapper instance for this resource
         list_fn: Callable that returns list of current resources from API
+        list_body_fn: Optional callable returning the list endpoint's raw JSON response
+            body (for singletons, the one object), skipping API model construction;
+            its bytes fingerprint the server state and the decoded dicts are read by
+            mappers via `from_api_dict`
         create_fn: Callable that creates a new resource via API
         update_fn: Callable that updates an existing resource via API
         delete_fn: Callable that deletes a resource via API (None for singleton resources)
         is_singleton: Whether this resource has only one instance (e.g., naming config)
+        bulk_update_fn: Optional callable that updates a list of resources in one API call
+        bulk_delete_fn: Optional callable that deletes a list of resource IDs in one API call
+        bulk_chunk_size: Maximum number of items per bulk call
+        depends_on: Names of resource types that must be reconciled before this one
+            (resource types without a dependency path between them sync concurrently)
+        models: API model classes the resource's calls send and receive (models nested
+            in their fields are found automatically); see `warm_models`
     """
 
     name: str
-    order: int
     mapper: Any  # ResourceMapper - avoiding import cycle
     list_fn: Callable[[], list]
     create_fn: Callable[[Any], Any]
     update_fn: Callable[[str, Any], Any]
     delete_fn: Callable[[str], None] | None = None
     is_singleton: bool = False
+    bulk_update_fn: Callable[[list], Any] | None = None
+    bulk_delete_fn: Callable[[list[int]], None] | None = None
+    bulk_chunk_size: int = 100
+    depends_on: tuple[str, ...] = ()
+    list_body_fn: Callable[[], bytes] | None = None
+    models: tuple[type[BaseModel], ...] = ()
+
+
+def _nested_models(annotation: Any) -> Iterable[type[BaseModel]]:
+    """Yield the model classes appearing in a field annotation (e.g. `Optional[List[X]]`)."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        yield annotation
+    for arg in get_args(annotation):
+        yield from _nested_models(arg)
+
+
+def warm_models(resource_definitions: Iterable[ResourceDefinition]) -> int:
+    """
+    Build the validators of the API models used by the given resource types.
+
+    Generated API models defer building their validators until first use, so
+    commands only pay for the models they touch. Warming the ones a sync needs
+    up front keeps that cost out of the concurrent reconcile phase, where
+    several threads would otherwise race to build the same model.
+
+    Args:
+        resource_definitions: Resource types about to be reconciled
+
+    Returns:
+        Number of models built
+    """
+    pending = [model for definition in resource_definitions for model in definition.models]
+    seen: set[type[BaseModel]] = set()
+    built = 0
+    while pending:
+        model = pending.pop()
+        if model in seen:
+            continue
+        seen.add(model)
+        if not model.__pydantic_complete__:
+            model.model_rebuild()
+            built += 1
+        for field in model.model_fields.values():
+            pending.extend(_nested_models(field.annotation))
+    return built
 
 
 class ArrPlugin(ABC):
@@ -77,13 +137,16 @@ class ArrPlugin(ABC):
         pass
 
     @abstractmethod
-    def get_client(self, base_url: str, api_key: str) -> ArrClient:
+    def get_client(
+        self, base_url: str, api_key: str, connection: Optional[ConnectionConfig] = None
+    ) -> ArrClient:
         """
         Create an API client for this plugin.
         
         Args:
             base_url: Server URL
             api_key: API authentication key
+            connection: Request timeouts and retry settings (None for defaults)
             
         Returns:
             Configured API client instance
@@ -105,14 +168,32 @@ class ArrPlugin(ABC):
         self, client: ArrClient, instance_config: BaseModel
     ) -> list[ResourceDefinition]:
         """
-        Build the ordered list of resource definitions to reconcile.
+        Build the list of resource definitions to reconcile.
+        
+        Sync order is derived from each definition's `depends_on` declarations.
         
         Args:
             client: API client instance
             instance_config: Validated instance configuration
             
         Returns:
-            List of ResourceDefinition objects in sync order
+            List of ResourceDefinition objects
+        """
+        pass
+
+    @abstractmethod
+    def get_all_resource_definitions(self, client: ArrClient) -> list[ResourceDefinition]:
+        """
+        Build the definitions of every resource type this plugin supports.
+        
+        Used to look up resources by name without an instance configuration
+        (e.g., when applying a saved plan).
+        
+        Args:
+            client: API client instance
+            
+        Returns:
+            List of ResourceDefinition objects
         """
         pass
 
@@ -1,57 +1,122 @@
 """Plugin registry for discovering and managing Configarr plugins."""
 
-from typing import Dict
+import importlib
+import threading
+from typing import Callable, Dict, Optional
 
 from src.plugins.base import ArrPlugin
-from src.plugins.sonarr.plugin import SonarrPlugin
+
+# Built-in plugins: name -> ("module:class" imported when first used, display name)
+BUILTIN_PLUGINS = {
+    "sonarr": ("src.plugins.sonarr.plugin:SonarrPlugin", "Sonarr"),
+}
+
+
+def _import_plugin(path: str) -> Callable[[], ArrPlugin]:
+    """Get a factory importing and instantiating the plugin class at "module:class"."""
+
+    def factory() -> ArrPlugin:
+        module_name, class_name = path.split(":")
+        return getattr(importlib.import_module(module_name), class_name)()
+
+    return factory
 
 
 class PluginRegistry:
-    """Central registry for all *arr plugins."""
+    """
+    Central registry for all *arr plugins.
+
+    Plugins may be registered as factories, which are only called (importing
+    the plugin and its generated API client) when the plugin is first used,
+    so commands that never talk to a server start quickly.
+    """
 
     def __init__(self):
         self._plugins: Dict[str, ArrPlugin] = {}
+        self._factories: Dict[str, Callable[[], ArrPlugin]] = {}
+        self._names: list[str] = []
+        self._display_names: Dict[str, str] = {}
+        self._lock = threading.Lock()
         self._register_builtin_plugins()
 
     def _register_builtin_plugins(self):
         """Register built-in plugins."""
-        self.register(SonarrPlugin())
+        for name, (path, display_name) in BUILTIN_PLUGINS.items():
+            self.register_factory(name, _import_plugin(path), display_name)
 
     def register(self, plugin: ArrPlugin):
         """
         Register a plugin.
-        
+
         Args:
             plugin: Plugin instance to register
         """
-        if plugin.name in self._plugins:
+        if plugin.name in self._plugins or plugin.name in self._factories:
             raise ValueError(f"Plugin '{plugin.name}' is already registered")
         self._plugins[plugin.name] = plugin
+        self._names.append(plugin.name)
+
+    def register_factory(
+        self, name: str, factory: Callable[[], ArrPlugin], display_name: Optional[str] = None
+    ):
+        """
+        Register a plugin to be created on first use.
+
+        Args:
+            name: Plugin name (must match the created plugin's name)
+            factory: Callable creating the plugin instance
+            display_name: Human-readable name, available without creating the plugin
+        """
+        if name in self._plugins or name in self._factories:
+            raise ValueError(f"Plugin '{name}' is already registered")
+        self._factories[name] = factory
+        self._names.append(name)
+        if display_name:
+            self._display_names[name] = display_name
 
     def get(self, name: str) -> ArrPlugin:
         """
-        Get a plugin by name.
-        
+        Get a plugin by name, creating it on first use.
+
         Args:
             name: Plugin name (e.g., 'sonarr', 'radarr')
-            
+
         Returns:
             Plugin instance
-            
+
+        Raises:
+            KeyError: If plugin not found
+        """
+        plugin = self._plugins.get(name)
+        if plugin is not None:
+            return plugin
+        with self._lock:
+            if name in self._plugins:
+                return self._plugins[name]
+            if name not in self._factories:
+                raise KeyError(f"Plugin '{name}' not found. Available: {self.list_names()}")
+            plugin = self._factories.pop(name)()
+            self._plugins[name] = plugin
+            return plugin
+
+    def display_name(self, name: str) -> str:
+        """
+        Get the human-readable name of a plugin, without creating it if possible.
+
         Raises:
             KeyError: If plugin not found
         """
-        if name not in self._plugins:
-            raise KeyError(f"Plugin '{name}' not found. Available: {list(self._plugins.keys())}")
-        return self._plugins[name]
+        if name in self._display_names:
+            return self._display_names[name]
+        return self.get(name).display_name
 
     def get_all(self) -> Dict[str, ArrPlugin]:
-        """Get all registered plugins."""
-        return self._plugins.copy()
+        """Get all registered plugins (creating any not used yet)."""
+        return {name: self.get(name) for name in self.list_names()}
 
     def list_names(self) -> list[str]:
-        """Get list of registered plugin names."""
-        return list(self._plugins.keys())
+        """Get list of registered plugin names (without creating the plugins)."""
+        return list(self._names)
 
 
 # Global registry instance
@@ -1,6 +1,7 @@
 """Sonarr API client wrapper."""
 
-from typing import Optional
+import json
+from typing import Any, Optional
 
 from sonarr_api import ApiClient, Configuration
 from sonarr_api.api.custom_format_api import CustomFormatApi
@@ -12,31 +13,88 @@ from sonarr_api.api.naming_config_api import NamingConfigApi
 from sonarr_api.api.ping_api import PingApi
 from sonarr_api.api.quality_definition_api import QualityDefinitionApi
 from sonarr_api.api.quality_profile_api import QualityProfileApi
+from sonarr_api.api.system_api import SystemApi
 from sonarr_api.api.tag_api import TagApi
+from sonarr_api.exceptions import ApiException
 
+from src.core.preflight import major_version
+from src.core.resilience import RetryPolicy, get_circuit_breakers
+from src.core.throttle import get_throttles
+from src.plugins.sonarr.transport import PooledRESTClientObject
+from src.shared.schemas import ConnectionConfig
 from src.utils.logger import get_logger
 
 logger = get_logger("sonarr_client")
 
 
+def read_body(response) -> bytes:
+    """
+    Read the body of a response from a `*_without_preload_content` API call.
+
+    Args:
+        response: Raw urllib3 response
+
+    Returns:
+        Undecoded response body
+
+    Raises:
+        ApiException: If the server answered with an error status
+    """
+    data = response.data
+    if not 200 <= response.status <= 299:
+        ApiException.from_response(
+            http_resp=response, body=data.decode("utf-8", errors="replace"), data=None
+        )
+    return data
+
+
+def read_json(response) -> Any:
+    """
+    Decode the body of a response from a `*_without_preload_content` API call.
+
+    Skips the generated client's model deserialization, for callers that only
+    need the plain JSON data.
+
+    Args:
+        response: Raw urllib3 response
+
+    Returns:
+        Decoded JSON (dicts with the API's camelCase keys)
+
+    Raises:
+        ApiException: If the server answered with an error status
+    """
+    data = read_body(response)
+    return json.loads(data) if data else None
+
+
 class SonarrClient:
     """
     Wrapper around the generated Sonarr API client.
 
     Provides convenient access to all API endpoints and handles
-    authentication configuration.
+    authentication configuration. The underlying API client is created once and
+    reused across `with` blocks; its connections come from the process-wide
+    pool of the server's host.
     """
 
-    def __init__(self, base_url: str, api_key: str):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        connection: Optional[ConnectionConfig] = None,
+    ):
         """
         Initialize the Sonarr client.
 
         Args:
             base_url: Sonarr server URL (e.g., "http://localhost:8989")
             api_key: API key for authentication
+            connection: Timeouts and retry settings (defaults if not given)
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
+        self.connection = connection or ConnectionConfig()
 
         # Configure API client
         self.config = Configuration(
@@ -46,6 +104,9 @@ class SonarrClient:
 
         self._api_client: Optional[ApiClient] = None
 
+        # Set by probe(); used to enable version-dependent features
+        self.server_version: Optional[str] = None
+
         # API endpoint instances (lazy-loaded)
         self._custom_format_api: Optional[CustomFormatApi] = None
         self._quality_profile_api: Optional[QualityProfileApi] = None
@@ -57,18 +118,40 @@ class SonarrClient:
         self._naming_config_api: Optional[NamingConfigApi] = None
         self._media_management_config_api: Optional[MediaManagementConfigApi] = None
         self._ping_api: Optional[PingApi] = None
+        self._system_api: Optional[SystemApi] = None
 
     def __enter__(self):
         """Enter context manager."""
-        self._api_client = ApiClient(self.config)
+        if self._api_client is None:
+            self._api_client = ApiClient(self.config)
+            connection = self.connection
+            self._api_client.rest_client = PooledRESTClientObject(
+                self.config,
+                timeout=(connection.connect_timeout, connection.read_timeout),
+                retry_policy=RetryPolicy(
+                    attempts=connection.retries, backoff=connection.retry_backoff
+                ),
+                circuit_breaker=get_circuit_breakers().get(
+                    self.base_url,
+                    threshold=connection.circuit_breaker_threshold,
+                    reset_timeout=connection.circuit_breaker_reset,
+                ),
+                throttle=get_throttles().get(
+                    self.base_url,
+                    rate_limit=connection.rate_limit,
+                    burst=connection.rate_burst,
+                    max_concurrency=(
+                        connection.max_concurrency if connection.adaptive_concurrency else None
+                    ),
+                ),
+            )
         self._api_client.__enter__()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Exit context manager."""
+        """Exit context manager (the API client and its pooled connections stay open)."""
         if self._api_client:
             self._api_client.__exit__(exc_type, exc_val, exc_tb)
-            self._api_client = None
 
     @property
     def api_client(self) -> ApiClient:
@@ -149,6 +232,41 @@ class SonarrClient:
             self._ping_api = PingApi(self.api_client)
         return self._ping_api
 
+    @property
+    def system(self) -> SystemApi:
+        """Get the System API."""
+        if self._system_api is None:
+            self._system_api = SystemApi(self.api_client)
+        return self._system_api
+
+    @property
+    def supports_bulk(self) -> bool:
+        """Whether the server has the bulk endpoints added in Sonarr v4 (assumed if unknown)."""
+        major = major_version(self.server_version)
+        return major is None or major >= 4
+
+    def probe(self, timeout: float) -> dict[str, Any]:
+        """
+        Check that the server is up and accepts the API key.
+
+        Pings the server, then reads the (authenticated) system status.
+
+        Args:
+            timeout: Seconds to wait for each request
+
+        Returns:
+            System status as raw JSON (includes "appName" and "version")
+
+        Raises:
+            ApiException: If the server rejects a request (e.g. 401 for a bad API key)
+        """
+        read_json(self.ping.ping_get_without_preload_content(_request_timeout=timeout))
+        status = read_json(
+            self.system.api_v3_system_status_get_without_preload_content(_request_timeout=timeout)
+        )
+        self.server_version = (status or {}).get("version")
+        return status
+
     def test_connection(self) -> bool:
         """
         Test the connection to Sonarr server.
@@ -0,0 +1,108 @@
+"""
+Patch the generated sonarr_api sources to build their validators on first use.
+
+Run after regenerating the client with openapi-generator:
+
+    python src/plugins/sonarr/generated/postprocess.py
+
+The patches are idempotent; `--check` only reports files that still need them
+(exit status 1). They make every generated module honor
+`sonarr_api.build_options` (hand-written, so never overwritten by the generator):
+
+- models: import DEFER_BUILD, pass `defer_build=DEFER_BUILD` to the model's
+  ConfigDict and only run the trailing `model_rebuild()` when building eagerly
+- APIs: decorate endpoints with `build_options.validate_call` instead of
+  `pydantic.validate_call`
+
+The lazily-loading package `__init__.py` is hand-written too and listed in
+.openapi-generator-ignore, so the generator leaves it alone.
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent / "sonarr_api"
+
+DEFER_IMPORT = "from sonarr_api.build_options import DEFER_BUILD\n"
+VALIDATE_CALL_IMPORT = "from sonarr_api.build_options import validate_call\n"
+
+_PYDANTIC_IMPORT = re.compile(r"^from pydantic import .*\n", re.MULTILINE)
+_CONFIG_DICT = re.compile(r"(    model_config = ConfigDict\(\n(?:        .*\n)*?)(    \)\n)")
+_MODEL_REBUILD = re.compile(r"^(\w+\.model_rebuild\(raise_errors=False\)\n)", re.MULTILINE)
+_PYDANTIC_VALIDATE_CALL = re.compile(r"^from pydantic import validate_call, (.*\n)", re.MULTILINE)
+
+
+def patch_model(source: str) -> str:
+    """Defer building a generated model module's validators (no-op for enums and patched files)."""
+    if "model_config = ConfigDict(" not in source or DEFER_IMPORT in source:
+        return source
+    source = _PYDANTIC_IMPORT.sub(lambda match: match.group(0) + DEFER_IMPORT, source, count=1)
+    source = _CONFIG_DICT.sub(r"\1        defer_build=DEFER_BUILD,\n\2", source, count=1)
+    return _MODEL_REBUILD.sub(r"if not DEFER_BUILD:\n    \1", source)
+
+
+def patch_api(source: str) -> str:
+    """Defer building a generated API module's `validate_call` wrappers (no-op if patched)."""
+    if VALIDATE_CALL_IMPORT in source:
+        return source
+    return _PYDANTIC_VALIDATE_CALL.sub(
+        lambda match: f"from pydantic import {match.group(1)}{VALIDATE_CALL_IMPORT}",
+        source,
+        count=1,
+    )
+
+
+def patch_package(package_dir: Path, check: bool = False) -> list[Path]:
+    """
+    Patch every generated model and API module of the package.
+
+    Args:
+        package_dir: Directory of the generated `sonarr_api` package
+        check: Only report files that need patching, without writing them
+
+    Returns:
+        Files that were (or, with `check`, would be) changed
+    """
+    if not (package_dir / "build_options.py").is_file():
+        raise FileNotFoundError(f"{package_dir / 'build_options.py'} is missing")
+
+    changed = []
+    targets = [(path, patch_model) for path in sorted((package_dir / "models").glob("*.py"))]
+    targets += [(path, patch_api) for path in sorted((package_dir / "api").glob("*.py"))]
+    for path, patch in targets:
+        source = path.read_text(encoding="utf-8")
+        patched = patch(source)
+        if patched != source:
+            changed.append(path)
+            if not check:
+                path.write_text(patched, encoding="utf-8")
+    return changed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "package_dir",
+        type=Path,
+        nargs="?",
+        default=PACKAGE_DIR,
+        help=f"Generated package directory (default: {PACKAGE_DIR})",
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="Only list files that need patching"
+    )
+    args = parser.parse_args()
+
+    changed = patch_package(args.package_dir, check=args.check)
+    for path in changed:
+        print(f"{'needs patching' if args.check else 'patched'}: {path}")
+    if args.check and changed:
+        return 1
+    print(f"{len(changed)} file(s) {'need patching' if args.check else 'patched'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
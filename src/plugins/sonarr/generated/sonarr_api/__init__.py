@@ -234,223 +234,467 @@ __all__ = [
     "UpdateResource",
 ]
 
-# import apis into sdk package
-from sonarr_api.api.api_info_api import ApiInfoApi as ApiInfoApi
-from sonarr_api.api.authentication_api import AuthenticationApi as AuthenticationApi
-from sonarr_api.api.auto_tagging_api import AutoTaggingApi as AutoTaggingApi
-from sonarr_api.api.backup_api import BackupApi as BackupApi
-from sonarr_api.api.blocklist_api import BlocklistApi as BlocklistApi
-from sonarr_api.api.calendar_api import CalendarApi as CalendarApi
-from sonarr_api.api.calendar_feed_api import CalendarFeedApi as CalendarFeedApi
-from sonarr_api.api.command_api import CommandApi as CommandApi
-from sonarr_api.api.custom_filter_api import CustomFilterApi as CustomFilterApi
-from sonarr_api.api.custom_format_api import CustomFormatApi as CustomFormatApi
-from sonarr_api.api.cutoff_api import CutoffApi as CutoffApi
-from sonarr_api.api.delay_profile_api import DelayProfileApi as DelayProfileApi
-from sonarr_api.api.disk_space_api import DiskSpaceApi as DiskSpaceApi
-from sonarr_api.api.download_client_api import DownloadClientApi as DownloadClientApi
-from sonarr_api.api.download_client_config_api import DownloadClientConfigApi as DownloadClientConfigApi
-from sonarr_api.api.episode_api import EpisodeApi as EpisodeApi
-from sonarr_api.api.episode_file_api import EpisodeFileApi as EpisodeFileApi
-from sonarr_api.api.file_system_api import FileSystemApi as FileSystemApi
-from sonarr_api.api.health_api import HealthApi as HealthApi
-from sonarr_api.api.history_api import HistoryApi as HistoryApi
-from sonarr_api.api.host_config_api import HostConfigApi as HostConfigApi
-from sonarr_api.api.import_list_api import ImportListApi as ImportListApi
-from sonarr_api.api.import_list_config_api import ImportListConfigApi as ImportListConfigApi
-from sonarr_api.api.import_list_exclusion_api import ImportListExclusionApi as ImportListExclusionApi
-from sonarr_api.api.indexer_api import IndexerApi as IndexerApi
-from sonarr_api.api.indexer_config_api import IndexerConfigApi as IndexerConfigApi
-from sonarr_api.api.indexer_flag_api import IndexerFlagApi as IndexerFlagApi
-from sonarr_api.api.language_api import LanguageApi as LanguageApi
-from sonarr_api.api.language_profile_api import LanguageProfileApi as LanguageProfileApi
-from sonarr_api.api.language_profile_schema_api import LanguageProfileSchemaApi as LanguageProfileSchemaApi
-from sonarr_api.api.localization_api import LocalizationApi as LocalizationApi
-from sonarr_api.api.log_api import LogApi as LogApi
-from sonarr_api.api.log_file_api import LogFileApi as LogFileApi
-from sonarr_api.api.manual_import_api import ManualImportApi as ManualImportApi
-from sonarr_api.api.media_cover_api import MediaCoverApi as MediaCoverApi
-from sonarr_api.api.media_management_config_api import MediaManagementConfigApi as MediaManagementConfigApi
-from sonarr_api.api.metadata_api import MetadataApi as MetadataApi
-from sonarr_api.api.missing_api import MissingApi as MissingApi
-from sonarr_api.api.naming_config_api import NamingConfigApi as NamingConfigApi
-from sonarr_api.api.notification_api import NotificationApi as NotificationApi
-from sonarr_api.api.parse_api import ParseApi as ParseApi
-from sonarr_api.api.ping_api import PingApi as PingApi
-from sonarr_api.api.quality_definition_api import QualityDefinitionApi as QualityDefinitionApi
-from sonarr_api.api.quality_profile_api import QualityProfileApi as QualityProfileApi
-from sonarr_api.api.quality_profile_schema_api import QualityProfileSchemaApi as QualityProfileSchemaApi
-from sonarr_api.api.queue_api import QueueApi as QueueApi
-from sonarr_api.api.queue_action_api import QueueActionApi as QueueActionApi
-from sonarr_api.api.queue_details_api import QueueDetailsApi as QueueDetailsApi
-from sonarr_api.api.queue_status_api import QueueStatusApi as QueueStatusApi
-from sonarr_api.api.release_api import ReleaseApi as ReleaseApi
-from sonarr_api.api.release_profile_api import ReleaseProfileApi as ReleaseProfileApi
-from sonarr_api.api.release_push_api import ReleasePushApi as ReleasePushApi
-from sonarr_api.api.remote_path_mapping_api import RemotePathMappingApi as RemotePathMappingApi
-from sonarr_api.api.rename_episode_api import RenameEpisodeApi as RenameEpisodeApi
-from sonarr_api.api.root_folder_api import RootFolderApi as RootFolderApi
-from sonarr_api.api.season_pass_api import SeasonPassApi as SeasonPassApi
-from sonarr_api.api.series_api import SeriesApi as SeriesApi
-from sonarr_api.api.series_editor_api import SeriesEditorApi as SeriesEditorApi
-from sonarr_api.api.series_folder_api import SeriesFolderApi as SeriesFolderApi
-from sonarr_api.api.series_import_api import SeriesImportApi as SeriesImportApi
-from sonarr_api.api.series_lookup_api import SeriesLookupApi as SeriesLookupApi
-from sonarr_api.api.static_resource_api import StaticResourceApi as StaticResourceApi
-from sonarr_api.api.system_api import SystemApi as SystemApi
-from sonarr_api.api.tag_api import TagApi as TagApi
-from sonarr_api.api.tag_details_api import TagDetailsApi as TagDetailsApi
-from sonarr_api.api.task_api import TaskApi as TaskApi
-from sonarr_api.api.ui_config_api import UiConfigApi as UiConfigApi
-from sonarr_api.api.update_api import UpdateApi as UpdateApi
-from sonarr_api.api.update_log_file_api import UpdateLogFileApi as UpdateLogFileApi
+import importlib
+from typing import TYPE_CHECKING
 
-# import ApiClient
-from sonarr_api.api_response import ApiResponse as ApiResponse
-from sonarr_api.api_client import ApiClient as ApiClient
-from sonarr_api.configuration import Configuration as Configuration
-from sonarr_api.exceptions import OpenApiException as OpenApiException
-from sonarr_api.exceptions import ApiTypeError as ApiTypeError
-from sonarr_api.exceptions import ApiValueError as ApiValueError
-from sonarr_api.exceptions import ApiKeyError as ApiKeyError
-from sonarr_api.exceptions import ApiAttributeError as ApiAttributeError
-from sonarr_api.exceptions import ApiException as ApiException
+# Exports are imported on first access (PEP 562), so importing the package only
+# loads the API classes and models that are actually used
+_LAZY_IMPORTS = {
+    "ApiInfoApi": "sonarr_api.api.api_info_api",
+    "AuthenticationApi": "sonarr_api.api.authentication_api",
+    "AutoTaggingApi": "sonarr_api.api.auto_tagging_api",
+    "BackupApi": "sonarr_api.api.backup_api",
+    "BlocklistApi": "sonarr_api.api.blocklist_api",
+    "CalendarApi": "sonarr_api.api.calendar_api",
+    "CalendarFeedApi": "sonarr_api.api.calendar_feed_api",
+    "CommandApi": "sonarr_api.api.command_api",
+    "CustomFilterApi": "sonarr_api.api.custom_filter_api",
+    "CustomFormatApi": "sonarr_api.api.custom_format_api",
+    "CutoffApi": "sonarr_api.api.cutoff_api",
+    "DelayProfileApi": "sonarr_api.api.delay_profile_api",
+    "DiskSpaceApi": "sonarr_api.api.disk_space_api",
+    "DownloadClientApi": "sonarr_api.api.download_client_api",
+    "DownloadClientConfigApi": "sonarr_api.api.download_client_config_api",
+    "EpisodeApi": "sonarr_api.api.episode_api",
+    "EpisodeFileApi": "sonarr_api.api.episode_file_api",
+    "FileSystemApi": "sonarr_api.api.file_system_api",
+    "HealthApi": "sonarr_api.api.health_api",
+    "HistoryApi": "sonarr_api.api.history_api",
+    "HostConfigApi": "sonarr_api.api.host_config_api",
+    "ImportListApi": "sonarr_api.api.import_list_api",
+    "ImportListConfigApi": "sonarr_api.api.import_list_config_api",
+    "ImportListExclusionApi": "sonarr_api.api.import_list_exclusion_api",
+    "IndexerApi": "sonarr_api.api.indexer_api",
+    "IndexerConfigApi": "sonarr_api.api.indexer_config_api",
+    "IndexerFlagApi": "sonarr_api.api.indexer_flag_api",
+    "LanguageApi": "sonarr_api.api.language_api",
+    "LanguageProfileApi": "sonarr_api.api.language_profile_api",
+    "LanguageProfileSchemaApi": "sonarr_api.api.language_profile_schema_api",
+    "LocalizationApi": "sonarr_api.api.localization_api",
+    "LogApi": "sonarr_api.api.log_api",
+    "LogFileApi": "sonarr_api.api.log_file_api",
+    "ManualImportApi": "sonarr_api.api.manual_import_api",
+    "MediaCoverApi": "sonarr_api.api.media_cover_api",
+    "MediaManagementConfigApi": "sonarr_api.api.media_management_config_api",
+    "MetadataApi": "sonarr_api.api.metadata_api",
+    "MissingApi": "sonarr_api.api.missing_api",
+    "NamingConfigApi": "sonarr_api.api.naming_config_api",
+    "NotificationApi": "sonarr_api.api.notification_api",
+    "ParseApi": "sonarr_api.api.parse_api",
+    "PingApi": "sonarr_api.api.ping_api",
+    "QualityDefinitionApi": "sonarr_api.api.quality_definition_api",
+    "QualityProfileApi": "sonarr_api.api.quality_profile_api",
+    "QualityProfileSchemaApi": "sonarr_api.api.quality_profile_schema_api",
+    "QueueApi": "sonarr_api.api.queue_api",
+    "QueueActionApi": "sonarr_api.api.queue_action_api",
+    "QueueDetailsApi": "sonarr_api.api.queue_details_api",
+    "QueueStatusApi": "sonarr_api.api.queue_status_api",
+    "ReleaseApi": "sonarr_api.api.release_api",
+    "ReleaseProfileApi": "sonarr_api.api.release_profile_api",
+    "ReleasePushApi": "sonarr_api.api.release_push_api",
+    "RemotePathMappingApi": "sonarr_api.api.remote_path_mapping_api",
+    "RenameEpisodeApi": "sonarr_api.api.rename_episode_api",
+    "RootFolderApi": "sonarr_api.api.root_folder_api",
+    "SeasonPassApi": "sonarr_api.api.season_pass_api",
+    "SeriesApi": "sonarr_api.api.series_api",
+    "SeriesEditorApi": "sonarr_api.api.series_editor_api",
+    "SeriesFolderApi": "sonarr_api.api.series_folder_api",
+    "SeriesImportApi": "sonarr_api.api.series_import_api",
+    "SeriesLookupApi": "sonarr_api.api.series_lookup_api",
+    "StaticResourceApi": "sonarr_api.api.static_resource_api",
+    "SystemApi": "sonarr_api.api.system_api",
+    "TagApi": "sonarr_api.api.tag_api",
+    "TagDetailsApi": "sonarr_api.api.tag_details_api",
+    "TaskApi": "sonarr_api.api.task_api",
+    "UiConfigApi": "sonarr_api.api.ui_config_api",
+    "UpdateApi": "sonarr_api.api.update_api",
+    "UpdateLogFileApi": "sonarr_api.api.update_log_file_api",
+    "ApiResponse": "sonarr_api.api_response",
+    "ApiClient": "sonarr_api.api_client",
+    "Configuration": "sonarr_api.configuration",
+    "OpenApiException": "sonarr_api.exceptions",
+    "ApiTypeError": "sonarr_api.exceptions",
+    "ApiValueError": "sonarr_api.exceptions",
+    "ApiKeyError": "sonarr_api.exceptions",
+    "ApiAttributeError": "sonarr_api.exceptions",
+    "ApiException": "sonarr_api.exceptions",
+    "AddSeriesOptions": "sonarr_api.models.add_series_options",
+    "AlternateTitleResource": "sonarr_api.models.alternate_title_resource",
+    "ApplyTags": "sonarr_api.models.apply_tags",
+    "AuthenticationRequiredType": "sonarr_api.models.authentication_required_type",
+    "AuthenticationType": "sonarr_api.models.authentication_type",
+    "AutoTaggingResource": "sonarr_api.models.auto_tagging_resource",
+    "AutoTaggingSpecificationSchema": "sonarr_api.models.auto_tagging_specification_schema",
+    "BackupResource": "sonarr_api.models.backup_resource",
+    "BackupType": "sonarr_api.models.backup_type",
+    "BlocklistBulkResource": "sonarr_api.models.blocklist_bulk_resource",
+    "BlocklistResource": "sonarr_api.models.blocklist_resource",
+    "BlocklistResourcePagingResource": "sonarr_api.models.blocklist_resource_paging_resource",
+    "CertificateValidationType": "sonarr_api.models.certificate_validation_type",
+    "Command": "sonarr_api.models.command",
+    "CommandPriority": "sonarr_api.models.command_priority",
+    "CommandResource": "sonarr_api.models.command_resource",
+    "CommandResult": "sonarr_api.models.command_result",
+    "CommandStatus": "sonarr_api.models.command_status",
+    "CommandTrigger": "sonarr_api.models.command_trigger",
+    "CustomFilterResource": "sonarr_api.models.custom_filter_resource",
+    "CustomFormatBulkResource": "sonarr_api.models.custom_format_bulk_resource",
+    "CustomFormatResource": "sonarr_api.models.custom_format_resource",
+    "CustomFormatSpecificationSchema": "sonarr_api.models.custom_format_specification_schema",
+    "DatabaseType": "sonarr_api.models.database_type",
+    "DelayProfileResource": "sonarr_api.models.delay_profile_resource",
+    "DiskSpaceResource": "sonarr_api.models.disk_space_resource",
+    "DownloadClientBulkResource": "sonarr_api.models.download_client_bulk_resource",
+    "DownloadClientConfigResource": "sonarr_api.models.download_client_config_resource",
+    "DownloadClientResource": "sonarr_api.models.download_client_resource",
+    "DownloadProtocol": "sonarr_api.models.download_protocol",
+    "EpisodeFileListResource": "sonarr_api.models.episode_file_list_resource",
+    "EpisodeFileResource": "sonarr_api.models.episode_file_resource",
+    "EpisodeHistoryEventType": "sonarr_api.models.episode_history_event_type",
+    "EpisodeResource": "sonarr_api.models.episode_resource",
+    "EpisodeResourcePagingResource": "sonarr_api.models.episode_resource_paging_resource",
+    "EpisodeTitleRequiredType": "sonarr_api.models.episode_title_required_type",
+    "EpisodesMonitoredResource": "sonarr_api.models.episodes_monitored_resource",
+    "FileDateType": "sonarr_api.models.file_date_type",
+    "HealthCheckResult": "sonarr_api.models.health_check_result",
+    "HealthResource": "sonarr_api.models.health_resource",
+    "HistoryResource": "sonarr_api.models.history_resource",
+    "HistoryResourcePagingResource": "sonarr_api.models.history_resource_paging_resource",
+    "HostConfigResource": "sonarr_api.models.host_config_resource",
+    "HttpUri": "sonarr_api.models.http_uri",
+    "ImportListBulkResource": "sonarr_api.models.import_list_bulk_resource",
+    "ImportListConfigResource": "sonarr_api.models.import_list_config_resource",
+    "ImportListExclusionBulkResource": "sonarr_api.models.import_list_exclusion_bulk_resource",
+    "ImportListExclusionResource": "sonarr_api.models.import_list_exclusion_resource",
+    "ImportListExclusionResourcePagingResource": "sonarr_api.models.import_list_exclusion_resource_paging_resource",
+    "ImportListResource": "sonarr_api.models.import_list_resource",
+    "ImportListType": "sonarr_api.models.import_list_type",
+    "ImportRejectionResource": "sonarr_api.models.import_rejection_resource",
+    "IndexerBulkResource": "sonarr_api.models.indexer_bulk_resource",
+    "IndexerConfigResource": "sonarr_api.models.indexer_config_resource",
+    "IndexerFlagResource": "sonarr_api.models.indexer_flag_resource",
+    "IndexerResource": "sonarr_api.models.indexer_resource",
+    "Language": "sonarr_api.models.language",
+    "LanguageProfileItemResource": "sonarr_api.models.language_profile_item_resource",
+    "LanguageProfileResource": "sonarr_api.models.language_profile_resource",
+    "LanguageResource": "sonarr_api.models.language_resource",
+    "ListSyncLevelType": "sonarr_api.models.list_sync_level_type",
+    "LocalizationLanguageResource": "sonarr_api.models.localization_language_resource",
+    "LocalizationResource": "sonarr_api.models.localization_resource",
+    "LogFileResource": "sonarr_api.models.log_file_resource",
+    "LogResource": "sonarr_api.models.log_resource",
+    "LogResourcePagingResource": "sonarr_api.models.log_resource_paging_resource",
+    "ManualImportReprocessResource": "sonarr_api.models.manual_import_reprocess_resource",
+    "ManualImportResource": "sonarr_api.models.manual_import_resource",
+    "MediaCover": "sonarr_api.models.media_cover",
+    "MediaCoverTypes": "sonarr_api.models.media_cover_types",
+    "MediaInfoResource": "sonarr_api.models.media_info_resource",
+    "MediaManagementConfigResource": "sonarr_api.models.media_management_config_resource",
+    "MetadataResource": "sonarr_api.models.metadata_resource",
+    "ModelField": "sonarr_api.models.model_field",
+    "MonitorTypes": "sonarr_api.models.monitor_types",
+    "MonitoringOptions": "sonarr_api.models.monitoring_options",
+    "NamingConfigResource": "sonarr_api.models.naming_config_resource",
+    "NewItemMonitorTypes": "sonarr_api.models.new_item_monitor_types",
+    "NotificationResource": "sonarr_api.models.notification_resource",
+    "ParseResource": "sonarr_api.models.parse_resource",
+    "ParsedEpisodeInfo": "sonarr_api.models.parsed_episode_info",
+    "PingResource": "sonarr_api.models.ping_resource",
+    "PrivacyLevel": "sonarr_api.models.privacy_level",
+    "ProfileFormatItemResource": "sonarr_api.models.profile_format_item_resource",
+    "ProperDownloadTypes": "sonarr_api.models.proper_download_types",
+    "ProviderMessage": "sonarr_api.models.provider_message",
+    "ProviderMessageType": "sonarr_api.models.provider_message_type",
+    "ProxyType": "sonarr_api.models.proxy_type",
+    "Quality": "sonarr_api.models.quality",
+    "QualityDefinitionLimitsResource": "sonarr_api.models.quality_definition_limits_resource",
+    "QualityDefinitionResource": "sonarr_api.models.quality_definition_resource",
+    "QualityModel": "sonarr_api.models.quality_model",
+    "QualityProfileQualityItemResource": "sonarr_api.models.quality_profile_quality_item_resource",
+    "QualityProfileResource": "sonarr_api.models.quality_profile_resource",
+    "QualitySource": "sonarr_api.models.quality_source",
+    "QueueBulkResource": "sonarr_api.models.queue_bulk_resource",
+    "QueueResource": "sonarr_api.models.queue_resource",
+    "QueueResourcePagingResource": "sonarr_api.models.queue_resource_paging_resource",
+    "QueueStatus": "sonarr_api.models.queue_status",
+    "QueueStatusResource": "sonarr_api.models.queue_status_resource",
+    "Ratings": "sonarr_api.models.ratings",
+    "RejectionType": "sonarr_api.models.rejection_type",
+    "ReleaseEpisodeResource": "sonarr_api.models.release_episode_resource",
+    "ReleaseProfileResource": "sonarr_api.models.release_profile_resource",
+    "ReleaseResource": "sonarr_api.models.release_resource",
+    "ReleaseType": "sonarr_api.models.release_type",
+    "RemotePathMappingResource": "sonarr_api.models.remote_path_mapping_resource",
+    "RenameEpisodeResource": "sonarr_api.models.rename_episode_resource",
+    "RescanAfterRefreshType": "sonarr_api.models.rescan_after_refresh_type",
+    "Revision": "sonarr_api.models.revision",
+    "RootFolderResource": "sonarr_api.models.root_folder_resource",
+    "RuntimeMode": "sonarr_api.models.runtime_mode",
+    "SeasonPassResource": "sonarr_api.models.season_pass_resource",
+    "SeasonPassSeriesResource": "sonarr_api.models.season_pass_series_resource",
+    "SeasonResource": "sonarr_api.models.season_resource",
+    "SeasonStatisticsResource": "sonarr_api.models.season_statistics_resource",
+    "SelectOption": "sonarr_api.models.select_option",
+    "SeriesEditorResource": "sonarr_api.models.series_editor_resource",
+    "SeriesResource": "sonarr_api.models.series_resource",
+    "SeriesStatisticsResource": "sonarr_api.models.series_statistics_resource",
+    "SeriesStatusType": "sonarr_api.models.series_status_type",
+    "SeriesTitleInfo": "sonarr_api.models.series_title_info",
+    "SeriesTypes": "sonarr_api.models.series_types",
+    "SortDirection": "sonarr_api.models.sort_direction",
+    "SystemResource": "sonarr_api.models.system_resource",
+    "TagDetailsResource": "sonarr_api.models.tag_details_resource",
+    "TagResource": "sonarr_api.models.tag_resource",
+    "TaskResource": "sonarr_api.models.task_resource",
+    "TrackedDownloadState": "sonarr_api.models.tracked_download_state",
+    "TrackedDownloadStatus": "sonarr_api.models.tracked_download_status",
+    "TrackedDownloadStatusMessage": "sonarr_api.models.tracked_download_status_message",
+    "UiConfigResource": "sonarr_api.models.ui_config_resource",
+    "UnmappedFolder": "sonarr_api.models.unmapped_folder",
+    "UpdateChanges": "sonarr_api.models.update_changes",
+    "UpdateMechanism": "sonarr_api.models.update_mechanism",
+    "UpdateResource": "sonarr_api.models.update_resource",
+}
 
-# import models into sdk package
-from sonarr_api.models.add_series_options import AddSeriesOptions as AddSeriesOptions
-from sonarr_api.models.alternate_title_resource import AlternateTitleResource as AlternateTitleResource
-from sonarr_api.models.apply_tags import ApplyTags as ApplyTags
-from sonarr_api.models.authentication_required_type import AuthenticationRequiredType as AuthenticationRequiredType
-from sonarr_api.models.authentication_type import AuthenticationType as AuthenticationType
-from sonarr_api.models.auto_tagging_resource import AutoTaggingResource as AutoTaggingResource
-from sonarr_api.models.auto_tagging_specification_schema import AutoTaggingSpecificationSchema as AutoTaggingSpecificationSchema
-from sonarr_api.models.backup_resource import BackupResource as BackupResource
-from sonarr_api.models.backup_type import BackupType as BackupType
-from sonarr_api.models.blocklist_bulk_resource import BlocklistBulkResource as BlocklistBulkResource
-from sonarr_api.models.blocklist_resource import BlocklistResource as BlocklistResource
-from sonarr_api.models.blocklist_resource_paging_resource import BlocklistResourcePagingResource as BlocklistResourcePagingResource
-from sonarr_api.models.certificate_validation_type import CertificateValidationType as CertificateValidationType
-from sonarr_api.models.command import Command as Command
-from sonarr_api.models.command_priority import CommandPriority as CommandPriority
-from sonarr_api.models.command_resource import CommandResource as CommandResource
-from sonarr_api.models.command_result import CommandResult as CommandResult
-from sonarr_api.models.command_status import CommandStatus as CommandStatus
-from sonarr_api.models.command_trigger import CommandTrigger as CommandTrigger
-from sonarr_api.models.custom_filter_resource import CustomFilterResource as CustomFilterResource
-from sonarr_api.models.custom_format_bulk_resource import CustomFormatBulkResource as CustomFormatBulkResource
-from sonarr_api.models.custom_format_resource import CustomFormatResource as CustomFormatResource
-from sonarr_api.models.custom_format_specification_schema import CustomFormatSpecificationSchema as CustomFormatSpecificationSchema
-from sonarr_api.models.database_type import DatabaseType as DatabaseType
-from sonarr_api.models.delay_profile_resource import DelayProfileResource as DelayProfileResource
-from sonarr_api.models.disk_space_resource import DiskSpaceResource as DiskSpaceResource
-from sonarr_api.models.download_client_bulk_resource import DownloadClientBulkResource as DownloadClientBulkResource
-from sonarr_api.models.download_client_config_resource import DownloadClientConfigResource as DownloadClientConfigResource
-from sonarr_api.models.download_client_resource import DownloadClientResource as DownloadClientResource
-from sonarr_api.models.download_protocol import DownloadProtocol as DownloadProtocol
-from sonarr_api.models.episode_file_list_resource import EpisodeFileListResource as EpisodeFileListResource
-from sonarr_api.models.episode_file_resource import EpisodeFileResource as EpisodeFileResource
-from sonarr_api.models.episode_history_event_type import EpisodeHistoryEventType as EpisodeHistoryEventType
-from sonarr_api.models.episode_resource import EpisodeResource as EpisodeResource
-from sonarr_api.models.episode_resource_paging_resource import EpisodeResourcePagingResource as EpisodeResourcePagingResource
-from sonarr_api.models.episode_title_required_type import EpisodeTitleRequiredType as EpisodeTitleRequiredType
-from sonarr_api.models.episodes_monitored_resource import EpisodesMonitoredResource as EpisodesMonitoredResource
-from sonarr_api.models.file_date_type import FileDateType as FileDateType
-from sonarr_api.models.health_check_result import HealthCheckResult as HealthCheckResult
-from sonarr_api.models.health_resource import HealthResource as HealthResource
-from sonarr_api.models.history_resource import HistoryResource as HistoryResource
-from sonarr_api.models.history_resource_paging_resource import HistoryResourcePagingResource as HistoryResourcePagingResource
-from sonarr_api.models.host_config_resource import HostConfigResource as HostConfigResource
-from sonarr_api.models.http_uri import HttpUri as HttpUri
-from sonarr_api.models.import_list_bulk_resource import ImportListBulkResource as ImportListBulkResource
-from sonarr_api.models.import_list_config_resource import ImportListConfigResource as ImportListConfigResource
-from sonarr_api.models.import_list_exclusion_bulk_resource import ImportListExclusionBulkResource as ImportListExclusionBulkResource
-from sonarr_api.models.import_list_exclusion_resource import ImportListExclusionResource as ImportListExclusionResource
-from sonarr_api.models.import_list_exclusion_resource_paging_resource import ImportListExclusionResourcePagingResource as ImportListExclusionResourcePagingResource
-from sonarr_api.models.import_list_resource import ImportListResource as ImportListResource
-from sonarr_api.models.import_list_type import ImportListType as ImportListType
-from sonarr_api.models.import_rejection_resource import ImportRejectionResource as ImportRejectionResource
-from sonarr_api.models.indexer_bulk_resource import IndexerBulkResource as IndexerBulkResource
-from sonarr_api.models.indexer_config_resource import IndexerConfigResource as IndexerConfigResource
-from sonarr_api.models.indexer_flag_resource import IndexerFlagResource as IndexerFlagResource
-from sonarr_api.models.indexer_resource import IndexerResource as IndexerResource
-from sonarr_api.models.language import Language as Language
-from sonarr_api.models.language_profile_item_resource import LanguageProfileItemResource as LanguageProfileItemResource
-from sonarr_api.models.language_profile_resource import LanguageProfileResource as LanguageProfileResource
-from sonarr_api.models.language_resource import LanguageResource as LanguageResource
-from sonarr_api.models.list_sync_level_type import ListSyncLevelType as ListSyncLevelType
-from sonarr_api.models.localization_language_resource import LocalizationLanguageResource as LocalizationLanguageResource
-from sonarr_api.models.localization_resource import LocalizationResource as LocalizationResource
-from sonarr_api.models.log_file_resource import LogFileResource as LogFileResource
-from sonarr_api.models.log_resource import LogResource as LogResource
-from sonarr_api.models.log_resource_paging_resource import LogResourcePagingResource as LogResourcePagingResource
-from sonarr_api.models.manual_import_reprocess_resource import ManualImportReprocessResource as ManualImportReprocessResource
-from sonarr_api.models.manual_import_resource import ManualImportResource as ManualImportResource
-from sonarr_api.models.media_cover import MediaCover as MediaCover
-from sonarr_api.models.media_cover_types import MediaCoverTypes as MediaCoverTypes
-from sonarr_api.models.media_info_resource import MediaInfoResource as MediaInfoResource
-from sonarr_api.models.media_management_config_resource import MediaManagementConfigResource as MediaManagementConfigResource
-from sonarr_api.models.metadata_resource import MetadataResource as MetadataResource
-from sonarr_api.models.model_field import ModelField as ModelField
-from sonarr_api.models.monitor_types import MonitorTypes as MonitorTypes
-from sonarr_api.models.monitoring_options import MonitoringOptions as MonitoringOptions
-from sonarr_api.models.naming_config_resource import NamingConfigResource as NamingConfigResource
-from sonarr_api.models.new_item_monitor_types import NewItemMonitorTypes as NewItemMonitorTypes
-from sonarr_api.models.notification_resource import NotificationResource as NotificationResource
-from sonarr_api.models.parse_resource import ParseResource as ParseResource
-from sonarr_api.models.parsed_episode_info import ParsedEpisodeInfo as ParsedEpisodeInfo
-from sonarr_api.models.ping_resource import PingResource as PingResource
-from sonarr_api.models.privacy_level import PrivacyLevel as PrivacyLevel
-from sonarr_api.models.profile_format_item_resource import ProfileFormatItemResource as ProfileFormatItemResource
-from sonarr_api.models.proper_download_types import ProperDownloadTypes as ProperDownloadTypes
-from sonarr_api.models.provider_message import ProviderMessage as ProviderMessage
-from sonarr_api.models.provider_message_type import ProviderMessageType as ProviderMessageType
-from sonarr_api.models.proxy_type import ProxyType as ProxyType
-from sonarr_api.models.quality import Quality as Quality
-from sonarr_api.models.quality_definition_limits_resource import QualityDefinitionLimitsResource as QualityDefinitionLimitsResource
-from sonarr_api.models.quality_definition_resource import QualityDefinitionResource as QualityDefinitionResource
-from sonarr_api.models.quality_model import QualityModel as QualityModel
-from sonarr_api.models.quality_profile_quality_item_resource import QualityProfileQualityItemResource as QualityProfileQualityItemResource
-from sonarr_api.models.quality_profile_resource import QualityProfileResource as QualityProfileResource
-from sonarr_api.models.quality_source import QualitySource as QualitySource
-from sonarr_api.models.queue_bulk_resource import QueueBulkResource as QueueBulkResource
-from sonarr_api.models.queue_resource import QueueResource as QueueResource
-from sonarr_api.models.queue_resource_paging_resource import QueueResourcePagingResource as QueueResourcePagingResource
-from sonarr_api.models.queue_status import QueueStatus as QueueStatus
-from sonarr_api.models.queue_status_resource import QueueStatusResource as QueueStatusResource
-from sonarr_api.models.ratings import Ratings as Ratings
-from sonarr_api.models.rejection_type import RejectionType as RejectionType
-from sonarr_api.models.release_episode_resource import ReleaseEpisodeResource as ReleaseEpisodeResource
-from sonarr_api.models.release_profile_resource import ReleaseProfileResource as ReleaseProfileResource
-from sonarr_api.models.release_resource import ReleaseResource as ReleaseResource
-from sonarr_api.models.release_type import ReleaseType as ReleaseType
-from sonarr_api.models.remote_path_mapping_resource import RemotePathMappingResource as RemotePathMappingResource
-from sonarr_api.models.rename_episode_resource import RenameEpisodeResource as RenameEpisodeResource
-from sonarr_api.models.rescan_after_refresh_type import RescanAfterRefreshType as RescanAfterRefreshType
-from sonarr_api.models.revision import Revision as Revision
-from sonarr_api.models.root_folder_resource import RootFolderResource as RootFolderResource
-from sonarr_api.models.runtime_mode import RuntimeMode as RuntimeMode
-from sonarr_api.models.season_pass_resource import SeasonPassResource as SeasonPassResource
-from sonarr_api.models.season_pass_series_resource import SeasonPassSeriesResource as SeasonPassSeriesResource
-from sonarr_api.models.season_resource import SeasonResource as SeasonResource
-from sonarr_api.models.season_statistics_resource import SeasonStatisticsResource as SeasonStatisticsResource
-from sonarr_api.models.select_option import SelectOption as SelectOption
-from sonarr_api.models.series_editor_resource import SeriesEditorResource as SeriesEditorResource
-from sonarr_api.models.series_resource import SeriesResource as SeriesResource
-from sonarr_api.models.series_statistics_resource import SeriesStatisticsResource as SeriesStatisticsResource
-from sonarr_api.models.series_status_type import SeriesStatusType as SeriesStatusType
-from sonarr_api.models.series_title_info import SeriesTitleInfo as SeriesTitleInfo
-from sonarr_api.models.series_types import SeriesTypes as SeriesTypes
-from sonarr_api.models.sort_direction import SortDirection as SortDirection
-from sonarr_api.models.system_resource import SystemResource as SystemResource
-from sonarr_api.models.tag_details_resource import TagDetailsResource as TagDetailsResource
-from sonarr_api.models.tag_resource import TagResource as TagResource
-from sonarr_api.models.task_resource import TaskResource as TaskResource
-from sonarr_api.models.tracked_download_state import TrackedDownloadState as TrackedDownloadState
-from sonarr_api.models.tracked_download_status import TrackedDownloadStatus as TrackedDownloadStatus
-from sonarr_api.models.tracked_download_status_message import TrackedDownloadStatusMessage as TrackedDownloadStatusMessage
-from sonarr_api.models.ui_config_resource import UiConfigResource as UiConfigResource
-from sonarr_api.models.unmapped_folder import UnmappedFolder as UnmappedFolder
-from sonarr_api.models.update_changes import UpdateChanges as UpdateChanges
-from sonarr_api.models.update_mechanism import UpdateMechanism as UpdateMechanism
-from sonarr_api.models.update_resource import UpdateResource as UpdateResource
+_SUBMODULES = {
+    "api",
+    "api_client",
+    "api_response",
+    "build_options",
+    "configuration",
+    "exceptions",
+    "models",
+    "rest",
+}
 
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        if name in _SUBMODULES:
+            return importlib.import_module(f"{__name__}.{name}")
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if TYPE_CHECKING:
+    from sonarr_api.api.api_info_api import ApiInfoApi as ApiInfoApi
+    from sonarr_api.api.authentication_api import AuthenticationApi as AuthenticationApi
+    from sonarr_api.api.auto_tagging_api import AutoTaggingApi as AutoTaggingApi
+    from sonarr_api.api.backup_api import BackupApi as BackupApi
+    from sonarr_api.api.blocklist_api import BlocklistApi as BlocklistApi
+    from sonarr_api.api.calendar_api import CalendarApi as CalendarApi
+    from sonarr_api.api.calendar_feed_api import CalendarFeedApi as CalendarFeedApi
+    from sonarr_api.api.command_api import CommandApi as CommandApi
+    from sonarr_api.api.custom_filter_api import CustomFilterApi as CustomFilterApi
+    from sonarr_api.api.custom_format_api import CustomFormatApi as CustomFormatApi
+    from sonarr_api.api.cutoff_api import CutoffApi as CutoffApi
+    from sonarr_api.api.delay_profile_api import DelayProfileApi as DelayProfileApi
+    from sonarr_api.api.disk_space_api import DiskSpaceApi as DiskSpaceApi
+    from sonarr_api.api.download_client_api import DownloadClientApi as DownloadClientApi
+    from sonarr_api.api.download_client_config_api import DownloadClientConfigApi as DownloadClientConfigApi
+    from sonarr_api.api.episode_api import EpisodeApi as EpisodeApi
+    from sonarr_api.api.episode_file_api import EpisodeFileApi as EpisodeFileApi
+    from sonarr_api.api.file_system_api import FileSystemApi as FileSystemApi
+    from sonarr_api.api.health_api import HealthApi as HealthApi
+    from sonarr_api.api.history_api import HistoryApi as HistoryApi
+    from sonarr_api.api.host_config_api import HostConfigApi as HostConfigApi
+    from sonarr_api.api.import_list_api import ImportListApi as ImportListApi
+    from sonarr_api.api.import_list_config_api import ImportListConfigApi as ImportListConfigApi
+    from sonarr_api.api.import_list_exclusion_api import ImportListExclusionApi as ImportListExclusionApi
+    from sonarr_api.api.indexer_api import IndexerApi as IndexerApi
+    from sonarr_api.api.indexer_config_api import IndexerConfigApi as IndexerConfigApi
+    from sonarr_api.api.indexer_flag_api import IndexerFlagApi as IndexerFlagApi
+    from sonarr_api.api.language_api import LanguageApi as LanguageApi
+    from sonarr_api.api.language_profile_api import LanguageProfileApi as LanguageProfileApi
+    from sonarr_api.api.language_profile_schema_api import LanguageProfileSchemaApi as LanguageProfileSchemaApi
+    from sonarr_api.api.localization_api import LocalizationApi as LocalizationApi
+    from sonarr_api.api.log_api import LogApi as LogApi
+    from sonarr_api.api.log_file_api import LogFileApi as LogFileApi
+    from sonarr_api.api.manual_import_api import ManualImportApi as ManualImportApi
+    from sonarr_api.api.media_cover_api import MediaCoverApi as MediaCoverApi
+    from sonarr_api.api.media_management_config_api import MediaManagementConfigApi as MediaManagementConfigApi
+    from sonarr_api.api.metadata_api import MetadataApi as MetadataApi
+    from sonarr_api.api.missing_api import MissingApi as MissingApi
+    from sonarr_api.api.naming_config_api import NamingConfigApi as NamingConfigApi
+    from sonarr_api.api.notification_api import NotificationApi as NotificationApi
+    from sonarr_api.api.parse_api import ParseApi as ParseApi
+    from sonarr_api.api.ping_api import PingApi as PingApi
+    from sonarr_api.api.quality_definition_api import QualityDefinitionApi as QualityDefinitionApi
+    from sonarr_api.api.quality_profile_api import QualityProfileApi as QualityProfileApi
+    from sonarr_api.api.quality_profile_schema_api import QualityProfileSchemaApi as QualityProfileSchemaApi
+    from sonarr_api.api.queue_api import QueueApi as QueueApi
+    from sonarr_api.api.queue_action_api import QueueActionApi as QueueActionApi
+    from sonarr_api.api.queue_details_api import QueueDetailsApi as QueueDetailsApi
+    from sonarr_api.api.queue_status_api import QueueStatusApi as QueueStatusApi
+    from sonarr_api.api.release_api import ReleaseApi as ReleaseApi
+    from sonarr_api.api.release_profile_api import ReleaseProfileApi as ReleaseProfileApi
+    from sonarr_api.api.release_push_api import ReleasePushApi as ReleasePushApi
+    from sonarr_api.api.remote_path_mapping_api import RemotePathMappingApi as RemotePathMappingApi
+    from sonarr_api.api.rename_episode_api import RenameEpisodeApi as RenameEpisodeApi
+    from sonarr_api.api.root_folder_api import RootFolderApi as RootFolderApi
+    from sonarr_api.api.season_pass_api import SeasonPassApi as SeasonPassApi
+    from sonarr_api.api.series_api import SeriesApi as SeriesApi
+    from sonarr_api.api.series_editor_api import SeriesEditorApi as SeriesEditorApi
+    from sonarr_api.api.series_folder_api import SeriesFolderApi as SeriesFolderApi
+    from sonarr_api.api.series_import_api import SeriesImportApi as SeriesImportApi
+    from sonarr_api.api.series_lookup_api import SeriesLookupApi as SeriesLookupApi
+    from sonarr_api.api.static_resource_api import StaticResourceApi as StaticResourceApi
+    from sonarr_api.api.system_api import SystemApi as SystemApi
+    from sonarr_api.api.tag_api import TagApi as TagApi
+    from sonarr_api.api.tag_details_api import TagDetailsApi as TagDetailsApi
+    from sonarr_api.api.task_api import TaskApi as TaskApi
+    from sonarr_api.api.ui_config_api import UiConfigApi as UiConfigApi
+    from sonarr_api.api.update_api import UpdateApi as UpdateApi
+    from sonarr_api.api.update_log_file_api import UpdateLogFileApi as UpdateLogFileApi
+    from sonarr_api.api_response import ApiResponse as ApiResponse
+    from sonarr_api.api_client import ApiClient as ApiClient
+    from sonarr_api.configuration import Configuration as Configuration
+    from sonarr_api.exceptions import OpenApiException as OpenApiException
+    from sonarr_api.exceptions import ApiTypeError as ApiTypeError
+    from sonarr_api.exceptions import ApiValueError as ApiValueError
+    from sonarr_api.exceptions import ApiKeyError as ApiKeyError
+    from sonarr_api.exceptions import ApiAttributeError as ApiAttributeError
+    from sonarr_api.exceptions import ApiException as ApiException
+    from sonarr_api.models.add_series_options import AddSeriesOptions as AddSeriesOptions
+    from sonarr_api.models.alternate_title_resource import AlternateTitleResource as AlternateTitleResource
+    from sonarr_api.models.apply_tags import ApplyTags as ApplyTags
+    from sonarr_api.models.authentication_required_type import AuthenticationRequiredType as AuthenticationRequiredType
+    from sonarr_api.models.authentication_type import AuthenticationType as AuthenticationType
+    from sonarr_api.models.auto_tagging_resource import AutoTaggingResource as AutoTaggingResource
+    from sonarr_api.models.auto_tagging_specification_schema import AutoTaggingSpecificationSchema as AutoTaggingSpecificationSchema
+    from sonarr_api.models.backup_resource import BackupResource as BackupResource
+    from sonarr_api.models.backup_type import BackupType as BackupType
+    from sonarr_api.models.blocklist_bulk_resource import BlocklistBulkResource as BlocklistBulkResource
+    from sonarr_api.models.blocklist_resource import BlocklistResource as BlocklistResource
+    from sonarr_api.models.blocklist_resource_paging_resource import BlocklistResourcePagingResource as BlocklistResourcePagingResource
+    from sonarr_api.models.certificate_validation_type import CertificateValidationType as CertificateValidationType
+    from sonarr_api.models.command import Command as Command
+    from sonarr_api.models.command_priority import CommandPriority as CommandPriority
+    from sonarr_api.models.command_resource import CommandResource as CommandResource
+    from sonarr_api.models.command_result import CommandResult as CommandResult
+    from sonarr_api.models.command_status import CommandStatus as CommandStatus
+    from sonarr_api.models.command_trigger import CommandTrigger as CommandTrigger
+    from sonarr_api.models.custom_filter_resource import CustomFilterResource as CustomFilterResource
+    from sonarr_api.models.custom_format_bulk_resource import CustomFormatBulkResource as CustomFormatBulkResource
+    from sonarr_api.models.custom_format_resource import CustomFormatResource as CustomFormatResource
+    from sonarr_api.models.custom_format_specification_schema import CustomFormatSpecificationSchema as CustomFormatSpecificationSchema
+    from sonarr_api.models.database_type import DatabaseType as DatabaseType
+    from sonarr_api.models.delay_profile_resource import DelayProfileResource as DelayProfileResource
+    from sonarr_api.models.disk_space_resource import DiskSpaceResource as DiskSpaceResource
+    from sonarr_api.models.download_client_bulk_resource import DownloadClientBulkResource as DownloadClientBulkResource
+    from sonarr_api.models.download_client_config_resource import DownloadClientConfigResource as DownloadClientConfigResource
+    from sonarr_api.models.download_client_resource import DownloadClientResource as DownloadClientResource
+    from sonarr_api.models.download_protocol import DownloadProtocol as DownloadProtocol
+    from sonarr_api.models.episode_file_list_resource import EpisodeFileListResource as EpisodeFileListResource
+    from sonarr_api.models.episode_file_resource import EpisodeFileResource as EpisodeFileResource
+    from sonarr_api.models.episode_history_event_type import EpisodeHistoryEventType as EpisodeHistoryEventType
+    from sonarr_api.models.episode_resource import EpisodeResource as EpisodeResource
+    from sonarr_api.models.episode_resource_paging_resource import EpisodeResourcePagingResource as EpisodeResourcePagingResource
+    from sonarr_api.models.episode_title_required_type import EpisodeTitleRequiredType as EpisodeTitleRequiredType
+    from sonarr_api.models.episodes_monitored_resource import EpisodesMonitoredResource as EpisodesMonitoredResource
+    from sonarr_api.models.file_date_type import FileDateType as FileDateType
+    from sonarr_api.models.health_check_result import HealthCheckResult as HealthCheckResult
+    from sonarr_api.models.health_resource import HealthResource as HealthResource
+    from sonarr_api.models.history_resource import HistoryResource as HistoryResource
+    from sonarr_api.models.history_resource_paging_resource import HistoryResourcePagingResource as HistoryResourcePagingResource
+    from sonarr_api.models.host_config_resource import HostConfigResource as HostConfigResource
+    from sonarr_api.models.http_uri import HttpUri as HttpUri
+    from sonarr_api.models.import_list_bulk_resource import ImportListBulkResource as ImportListBulkResource
+    from sonarr_api.models.import_list_config_resource import ImportListConfigResource as ImportListConfigResource
+    from sonarr_api.models.import_list_exclusion_bulk_resource import ImportListExclusionBulkResource as ImportListExclusionBulkResource
+    from sonarr_api.models.import_list_exclusion_resource import ImportListExclusionResource as ImportListExclusionResource
+    from sonarr_api.models.import_list_exclusion_resource_paging_resource import ImportListExclusionResourcePagingResource as ImportListExclusionResourcePagingResource
+    from sonarr_api.models.import_list_resource import ImportListResource as ImportListResource
+    from sonarr_api.models.import_list_type import ImportListType as ImportListType
+    from sonarr_api.models.import_rejection_resource import ImportRejectionResource as ImportRejectionResource
+    from sonarr_api.models.indexer_bulk_resource import IndexerBulkResource as IndexerBulkResource
+    from sonarr_api.models.indexer_config_resource import IndexerConfigResource as IndexerConfigResource
+    from sonarr_api.models.indexer_flag_resource import IndexerFlagResource as IndexerFlagResource
+    from sonarr_api.models.indexer_resource import IndexerResource as IndexerResource
+    from sonarr_api.models.language import Language as Language
+    from sonarr_api.models.language_profile_item_resource import LanguageProfileItemResource as LanguageProfileItemResource
+    from sonarr_api.models.language_profile_resource import LanguageProfileResource as LanguageProfileResource
+    from sonarr_api.models.language_resource import LanguageResource as LanguageResource
+    from sonarr_api.models.list_sync_level_type import ListSyncLevelType as ListSyncLevelType
+    from sonarr_api.models.localization_language_resource import LocalizationLanguageResource as LocalizationLanguageResource
+    from sonarr_api.models.localization_resource import LocalizationResource as LocalizationResource
+    from sonarr_api.models.log_file_resource import LogFileResource as LogFileResource
+    from sonarr_api.models.log_resource import LogResource as LogResource
+    from sonarr_api.models.log_resource_paging_resource import LogResourcePagingResource as LogResourcePagingResource
+    from sonarr_api.models.manual_import_reprocess_resource import ManualImportReprocessResource as ManualImportReprocessResource
+    from sonarr_api.models.manual_import_resource import ManualImportResource as ManualImportResource
+    from sonarr_api.models.media_cover import MediaCover as MediaCover
+    from sonarr_api.models.media_cover_types import MediaCoverTypes as MediaCoverTypes
+    from sonarr_api.models.media_info_resource import MediaInfoResource as MediaInfoResource
+    from sonarr_api.models.media_management_config_resource import MediaManagementConfigResource as MediaManagementConfigResource
+    from sonarr_api.models.metadata_resource import MetadataResource as MetadataResource
+    from sonarr_api.models.model_field import ModelField as ModelField
+    from sonarr_api.models.monitor_types import MonitorTypes as MonitorTypes
+    from sonarr_api.models.monitoring_options import MonitoringOptions as MonitoringOptions
+    from sonarr_api.models.naming_config_resource import NamingConfigResource as NamingConfigResource
+    from sonarr_api.models.new_item_monitor_types import NewItemMonitorTypes as NewItemMonitorTypes
+    from sonarr_api.models.notification_resource import NotificationResource as NotificationResource
+    from sonarr_api.models.parse_resource import ParseResource as ParseResource
+    from sonarr_api.models.parsed_episode_info import ParsedEpisodeInfo as ParsedEpisodeInfo
+    from sonarr_api.models.ping_resource import PingResource as PingResource
+    from sonarr_api.models.privacy_level import PrivacyLevel as PrivacyLevel
+    from sonarr_api.models.profile_format_item_resource import ProfileFormatItemResource as ProfileFormatItemResource
+    from sonarr_api.models.proper_download_types import ProperDownloadTypes as ProperDownloadTypes
+    from sonarr_api.models.provider_message import ProviderMessage as ProviderMessage
+    from sonarr_api.models.provider_message_type import ProviderMessageType as ProviderMessageType
+    from sonarr_api.models.proxy_type import ProxyType as ProxyType
+    from sonarr_api.models.quality import Quality as Quality
+    from sonarr_api.models.quality_definition_limits_resource import QualityDefinitionLimitsResource as QualityDefinitionLimitsResource
+    from sonarr_api.models.quality_definition_resource import QualityDefinitionResource as QualityDefinitionResource
+    from sonarr_api.models.quality_model import QualityModel as QualityModel
+    from sonarr_api.models.quality_profile_quality_item_resource import QualityProfileQualityItemResource as QualityProfileQualityItemResource
+    from sonarr_api.models.quality_profile_resource import QualityProfileResource as QualityProfileResource
+    from sonarr_api.models.quality_source import QualitySource as QualitySource
+    from sonarr_api.models.queue_bulk_resource import QueueBulkResource as QueueBulkResource
+    from sonarr_api.models.queue_resource import QueueResource as QueueResource
+    from sonarr_api.models.queue_resource_paging_resource import QueueResourcePagingResource as QueueResourcePagingResource
+    from sonarr_api.models.queue_status import QueueStatus as QueueStatus
+    from sonarr_api.models.queue_status_resource import QueueStatusResource as QueueStatusResource
+    from sonarr_api.models.ratings import Ratings as Ratings
+    from sonarr_api.models.rejection_type import RejectionType as RejectionType
+    from sonarr_api.models.release_episode_resource import ReleaseEpisodeResource as ReleaseEpisodeResource
+    from sonarr_api.models.release_profile_resource import ReleaseProfileResource as ReleaseProfileResource
+    from sonarr_api.models.release_resource import ReleaseResource as ReleaseResource
+    from sonarr_api.models.release_type import ReleaseType as ReleaseType
+    from sonarr_api.models.remote_path_mapping_resource import RemotePathMappingResource as RemotePathMappingResource
+    from sonarr_api.models.rename_episode_resource import RenameEpisodeResource as RenameEpisodeResource
+    from sonarr_api.models.rescan_after_refresh_type import RescanAfterRefreshType as RescanAfterRefreshType
+    from sonarr_api.models.revision import Revision as Revision
+    from sonarr_api.models.root_folder_resource import RootFolderResource as RootFolderResource
+    from sonarr_api.models.runtime_mode import RuntimeMode as RuntimeMode
+    from sonarr_api.models.season_pass_resource import SeasonPassResource as SeasonPassResource
+    from sonarr_api.models.season_pass_series_resource import SeasonPassSeriesResource as SeasonPassSeriesResource
+    from sonarr_api.models.season_resource import SeasonResource as SeasonResource
+    from sonarr_api.models.season_statistics_resource import SeasonStatisticsResource as SeasonStatisticsResource
+    from sonarr_api.models.select_option import SelectOption as SelectOption
+    from sonarr_api.models.series_editor_resource import SeriesEditorResource as SeriesEditorResource
+    from sonarr_api.models.series_resource import SeriesResource as SeriesResource
+    from sonarr_api.models.series_statistics_resource import SeriesStatisticsResource as SeriesStatisticsResource
+    from sonarr_api.models.series_status_type import SeriesStatusType as SeriesStatusType
+    from sonarr_api.models.series_title_info import SeriesTitleInfo as SeriesTitleInfo
+    from sonarr_api.models.series_types import SeriesTypes as SeriesTypes
+    from sonarr_api.models.sort_direction import SortDirection as SortDirection
+    from sonarr_api.models.system_resource import SystemResource as SystemResource
+    from sonarr_api.models.tag_details_resource import TagDetailsResource as TagDetailsResource
+    from sonarr_api.models.tag_resource import TagResource as TagResource
+    from sonarr_api.models.task_resource import TaskResource as TaskResource
+    from sonarr_api.models.tracked_download_state import TrackedDownloadState as TrackedDownloadState
+    from sonarr_api.models.tracked_download_status import TrackedDownloadStatus as TrackedDownloadStatus
+    from sonarr_api.models.tracked_download_status_message import TrackedDownloadStatusMessage as TrackedDownloadStatusMessage
+    from sonarr_api.models.ui_config_resource import UiConfigResource as UiConfigResource
+    from sonarr_api.models.unmapped_folder import UnmappedFolder as UnmappedFolder
+    from sonarr_api.models.update_changes import UpdateChanges as UpdateChanges
+    from sonarr_api.models.update_mechanism import UpdateMechanism as UpdateMechanism
+    from sonarr_api.models.update_resource import UpdateResource as UpdateResource
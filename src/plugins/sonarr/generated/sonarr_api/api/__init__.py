@@ -1,73 +1,168 @@
 # flake8: noqa
 
-# import apis into api package
-from sonarr_api.api.api_info_api import ApiInfoApi
-from sonarr_api.api.authentication_api import AuthenticationApi
-from sonarr_api.api.auto_tagging_api import AutoTaggingApi
-from sonarr_api.api.backup_api import BackupApi
-from sonarr_api.api.blocklist_api import BlocklistApi
-from sonarr_api.api.calendar_api import CalendarApi
-from sonarr_api.api.calendar_feed_api import CalendarFeedApi
-from sonarr_api.api.command_api import CommandApi
-from sonarr_api.api.custom_filter_api import CustomFilterApi
-from sonarr_api.api.custom_format_api import CustomFormatApi
-from sonarr_api.api.cutoff_api import CutoffApi
-from sonarr_api.api.delay_profile_api import DelayProfileApi
-from sonarr_api.api.disk_space_api import DiskSpaceApi
-from sonarr_api.api.download_client_api import DownloadClientApi
-from sonarr_api.api.download_client_config_api import DownloadClientConfigApi
-from sonarr_api.api.episode_api import EpisodeApi
-from sonarr_api.api.episode_file_api import EpisodeFileApi
-from sonarr_api.api.file_system_api import FileSystemApi
-from sonarr_api.api.health_api import HealthApi
-from sonarr_api.api.history_api import HistoryApi
-from sonarr_api.api.host_config_api import HostConfigApi
-from sonarr_api.api.import_list_api import ImportListApi
-from sonarr_api.api.import_list_config_api import ImportListConfigApi
-from sonarr_api.api.import_list_exclusion_api import ImportListExclusionApi
-from sonarr_api.api.indexer_api import IndexerApi
-from sonarr_api.api.indexer_config_api import IndexerConfigApi
-from sonarr_api.api.indexer_flag_api import IndexerFlagApi
-from sonarr_api.api.language_api import LanguageApi
-from sonarr_api.api.language_profile_api import LanguageProfileApi
-from sonarr_api.api.language_profile_schema_api import LanguageProfileSchemaApi
-from sonarr_api.api.localization_api import LocalizationApi
-from sonarr_api.api.log_api import LogApi
-from sonarr_api.api.log_file_api import LogFileApi
-from sonarr_api.api.manual_import_api import ManualImportApi
-from sonarr_api.api.media_cover_api import MediaCoverApi
-from sonarr_api.api.media_management_config_api import MediaManagementConfigApi
-from sonarr_api.api.metadata_api import MetadataApi
-from sonarr_api.api.missing_api import MissingApi
-from sonarr_api.api.naming_config_api import NamingConfigApi
-from sonarr_api.api.notification_api import NotificationApi
-from sonarr_api.api.parse_api import ParseApi
-from sonarr_api.api.ping_api import PingApi
-from sonarr_api.api.quality_definition_api import QualityDefinitionApi
-from sonarr_api.api.quality_profile_api import QualityProfileApi
-from sonarr_api.api.quality_profile_schema_api import QualityProfileSchemaApi
-from sonarr_api.api.queue_api import QueueApi
-from sonarr_api.api.queue_action_api import QueueActionApi
-from sonarr_api.api.queue_details_api import QueueDetailsApi
-from sonarr_api.api.queue_status_api import QueueStatusApi
-from sonarr_api.api.release_api import ReleaseApi
-from sonarr_api.api.release_profile_api import ReleaseProfileApi
-from sonarr_api.api.release_push_api import ReleasePushApi
-from sonarr_api.api.remote_path_mapping_api import RemotePathMappingApi
-from sonarr_api.api.rename_episode_api import RenameEpisodeApi
-from sonarr_api.api.root_folder_api import RootFolderApi
-from sonarr_api.api.season_pass_api import SeasonPassApi
-from sonarr_api.api.series_api import SeriesApi
-from sonarr_api.api.series_editor_api import SeriesEditorApi
-from sonarr_api.api.series_folder_api import SeriesFolderApi
-from sonarr_api.api.series_import_api import SeriesImportApi
-from sonarr_api.api.series_lookup_api import SeriesLookupApi
-from sonarr_api.api.static_resource_api import StaticResourceApi
-from sonarr_api.api.system_api import SystemApi
-from sonarr_api.api.tag_api import TagApi
-from sonarr_api.api.tag_details_api import TagDetailsApi
-from sonarr_api.api.task_api import TaskApi
-from sonarr_api.api.ui_config_api import UiConfigApi
-from sonarr_api.api.update_api import UpdateApi
-from sonarr_api.api.update_log_file_api import UpdateLogFileApi
+import importlib
+from typing import TYPE_CHECKING
 
+# Exports are imported on first access (PEP 562), so importing the package only
+# loads the API classes and models that are actually used
+_LAZY_IMPORTS = {
+    "ApiInfoApi": "sonarr_api.api.api_info_api",
+    "AuthenticationApi": "sonarr_api.api.authentication_api",
+    "AutoTaggingApi": "sonarr_api.api.auto_tagging_api",
+    "BackupApi": "sonarr_api.api.backup_api",
+    "BlocklistApi": "sonarr_api.api.blocklist_api",
+    "CalendarApi": "sonarr_api.api.calendar_api",
+    "CalendarFeedApi": "sonarr_api.api.calendar_feed_api",
+    "CommandApi": "sonarr_api.api.command_api",
+    "CustomFilterApi": "sonarr_api.api.custom_filter_api",
+    "CustomFormatApi": "sonarr_api.api.custom_format_api",
+    "CutoffApi": "sonarr_api.api.cutoff_api",
+    "DelayProfileApi": "sonarr_api.api.delay_profile_api",
+    "DiskSpaceApi": "sonarr_api.api.disk_space_api",
+    "DownloadClientApi": "sonarr_api.api.download_client_api",
+    "DownloadClientConfigApi": "sonarr_api.api.download_client_config_api",
+    "EpisodeApi": "sonarr_api.api.episode_api",
+    "EpisodeFileApi": "sonarr_api.api.episode_file_api",
+    "FileSystemApi": "sonarr_api.api.file_system_api",
+    "HealthApi": "sonarr_api.api.health_api",
+    "HistoryApi": "sonarr_api.api.history_api",
+    "HostConfigApi": "sonarr_api.api.host_config_api",
+    "ImportListApi": "sonarr_api.api.import_list_api",
+    "ImportListConfigApi": "sonarr_api.api.import_list_config_api",
+    "ImportListExclusionApi": "sonarr_api.api.import_list_exclusion_api",
+    "IndexerApi": "sonarr_api.api.indexer_api",
+    "IndexerConfigApi": "sonarr_api.api.indexer_config_api",
+    "IndexerFlagApi": "sonarr_api.api.indexer_flag_api",
+    "LanguageApi": "sonarr_api.api.language_api",
+    "LanguageProfileApi": "sonarr_api.api.language_profile_api",
+    "LanguageProfileSchemaApi": "sonarr_api.api.language_profile_schema_api",
+    "LocalizationApi": "sonarr_api.api.localization_api",
+    "LogApi": "sonarr_api.api.log_api",
+    "LogFileApi": "sonarr_api.api.log_file_api",
+    "ManualImportApi": "sonarr_api.api.manual_import_api",
+    "MediaCoverApi": "sonarr_api.api.media_cover_api",
+    "MediaManagementConfigApi": "sonarr_api.api.media_management_config_api",
+    "MetadataApi": "sonarr_api.api.metadata_api",
+    "MissingApi": "sonarr_api.api.missing_api",
+    "NamingConfigApi": "sonarr_api.api.naming_config_api",
+    "NotificationApi": "sonarr_api.api.notification_api",
+    "ParseApi": "sonarr_api.api.parse_api",
+    "PingApi": "sonarr_api.api.ping_api",
+    "QualityDefinitionApi": "sonarr_api.api.quality_definition_api",
+    "QualityProfileApi": "sonarr_api.api.quality_profile_api",
+    "QualityProfileSchemaApi": "sonarr_api.api.quality_profile_schema_api",
+    "QueueApi": "sonarr_api.api.queue_api",
+    "QueueActionApi": "sonarr_api.api.queue_action_api",
+    "QueueDetailsApi": "sonarr_api.api.queue_details_api",
+    "QueueStatusApi": "sonarr_api.api.queue_status_api",
+    "ReleaseApi": "sonarr_api.api.release_api",
+    "ReleaseProfileApi": "sonarr_api.api.release_profile_api",
+    "ReleasePushApi": "sonarr_api.api.release_push_api",
+    "RemotePathMappingApi": "sonarr_api.api.remote_path_mapping_api",
+    "RenameEpisodeApi": "sonarr_api.api.rename_episode_api",
+    "RootFolderApi": "sonarr_api.api.root_folder_api",
+    "SeasonPassApi": "sonarr_api.api.season_pass_api",
+    "SeriesApi": "sonarr_api.api.series_api",
+    "SeriesEditorApi": "sonarr_api.api.series_editor_api",
+    "SeriesFolderApi": "sonarr_api.api.series_folder_api",
+    "SeriesImportApi": "sonarr_api.api.series_import_api",
+    "SeriesLookupApi": "sonarr_api.api.series_lookup_api",
+    "StaticResourceApi": "sonarr_api.api.static_resource_api",
+    "SystemApi": "sonarr_api.api.system_api",
+    "TagApi": "sonarr_api.api.tag_api",
+    "TagDetailsApi": "sonarr_api.api.tag_details_api",
+    "TaskApi": "sonarr_api.api.task_api",
+    "UiConfigApi": "sonarr_api.api.ui_config_api",
+    "UpdateApi": "sonarr_api.api.update_api",
+    "UpdateLogFileApi": "sonarr_api.api.update_log_file_api",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+_SUBMODULES = set()
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        if name in _SUBMODULES:
+            return importlib.import_module(f"{__name__}.{name}")
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if TYPE_CHECKING:
+    from sonarr_api.api.api_info_api import ApiInfoApi
+    from sonarr_api.api.authentication_api import AuthenticationApi
+    from sonarr_api.api.auto_tagging_api import AutoTaggingApi
+    from sonarr_api.api.backup_api import BackupApi
+    from sonarr_api.api.blocklist_api import BlocklistApi
+    from sonarr_api.api.calendar_api import CalendarApi
+    from sonarr_api.api.calendar_feed_api import CalendarFeedApi
+    from sonarr_api.api.command_api import CommandApi
+    from sonarr_api.api.custom_filter_api import CustomFilterApi
+    from sonarr_api.api.custom_format_api import CustomFormatApi
+    from sonarr_api.api.cutoff_api import CutoffApi
+    from sonarr_api.api.delay_profile_api import DelayProfileApi
+    from sonarr_api.api.disk_space_api import DiskSpaceApi
+    from sonarr_api.api.download_client_api import DownloadClientApi
+    from sonarr_api.api.download_client_config_api import DownloadClientConfigApi
+    from sonarr_api.api.episode_api import EpisodeApi
+    from sonarr_api.api.episode_file_api import EpisodeFileApi
+    from sonarr_api.api.file_system_api import FileSystemApi
+    from sonarr_api.api.health_api import HealthApi
+    from sonarr_api.api.history_api import HistoryApi
+    from sonarr_api.api.host_config_api import HostConfigApi
+    from sonarr_api.api.import_list_api import ImportListApi
+    from sonarr_api.api.import_list_config_api import ImportListConfigApi
+    from sonarr_api.api.import_list_exclusion_api import ImportListExclusionApi
+    from sonarr_api.api.indexer_api import IndexerApi
+    from sonarr_api.api.indexer_config_api import IndexerConfigApi
+    from sonarr_api.api.indexer_flag_api import IndexerFlagApi
+    from sonarr_api.api.language_api import LanguageApi
+    from sonarr_api.api.language_profile_api import LanguageProfileApi
+    from sonarr_api.api.language_profile_schema_api import LanguageProfileSchemaApi
+    from sonarr_api.api.localization_api import LocalizationApi
+    from sonarr_api.api.log_api import LogApi
+    from sonarr_api.api.log_file_api import LogFileApi
+    from sonarr_api.api.manual_import_api import ManualImportApi
+    from sonarr_api.api.media_cover_api import MediaCoverApi
+    from sonarr_api.api.media_management_config_api import MediaManagementConfigApi
+    from sonarr_api.api.metadata_api import MetadataApi
+    from sonarr_api.api.missing_api import MissingApi
+    from sonarr_api.api.naming_config_api import NamingConfigApi
+    from sonarr_api.api.notification_api import NotificationApi
+    from sonarr_api.api.parse_api import ParseApi
+    from sonarr_api.api.ping_api import PingApi
+    from sonarr_api.api.quality_definition_api import QualityDefinitionApi
+    from sonarr_api.api.quality_profile_api import QualityProfileApi
+    from sonarr_api.api.quality_profile_schema_api import QualityProfileSchemaApi
+    from sonarr_api.api.queue_api import QueueApi
+    from sonarr_api.api.queue_action_api import QueueActionApi
+    from sonarr_api.api.queue_details_api import QueueDetailsApi
+    from sonarr_api.api.queue_status_api import QueueStatusApi
+    from sonarr_api.api.release_api import ReleaseApi
+    from sonarr_api.api.release_profile_api import ReleaseProfileApi
+    from sonarr_api.api.release_push_api import ReleasePushApi
+    from sonarr_api.api.remote_path_mapping_api import RemotePathMappingApi
+    from sonarr_api.api.rename_episode_api import RenameEpisodeApi
+    from sonarr_api.api.root_folder_api import RootFolderApi
+    from sonarr_api.api.season_pass_api import SeasonPassApi
+    from sonarr_api.api.series_api import SeriesApi
+    from sonarr_api.api.series_editor_api import SeriesEditorApi
+    from sonarr_api.api.series_folder_api import SeriesFolderApi
+    from sonarr_api.api.series_import_api import SeriesImportApi
+    from sonarr_api.api.series_lookup_api import SeriesLookupApi
+    from sonarr_api.api.static_resource_api import StaticResourceApi
+    from sonarr_api.api.system_api import SystemApi
+    from sonarr_api.api.tag_api import TagApi
+    from sonarr_api.api.tag_details_api import TagDetailsApi
+    from sonarr_api.api.task_api import TaskApi
+    from sonarr_api.api.ui_config_api import UiConfigApi
+    from sonarr_api.api.update_api import UpdateApi
+    from sonarr_api.api.update_log_file_api import UpdateLogFileApi
@@ -12,7 +12,8 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
+from sonarr_api.build_options import validate_call
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
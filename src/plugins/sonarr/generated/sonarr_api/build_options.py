@@ -0,0 +1,19 @@
+# coding: utf-8
+
+"""
+    Options controlling when the generated models and API methods build their validators.
+"""  # noqa: E501
+
+import os
+
+import pydantic
+
+# Build each model's and API method's pydantic-core validator on first use
+# instead of at import time, so short-lived processes only pay for what they
+# actually use. Set SONARR_API_EAGER_BUILD=1 to build them all on import.
+DEFER_BUILD = os.environ.get("SONARR_API_EAGER_BUILD", "").lower() not in ("1", "true", "yes")
+
+
+def validate_call(func):
+    """`pydantic.validate_call` honoring DEFER_BUILD."""
+    return pydantic.validate_call(func, config=pydantic.ConfigDict(defer_build=DEFER_BUILD))
@@ -12,141 +12,303 @@
     Do not edit the class manually.
 """  # noqa: E501
 
-# import models into model package
-from sonarr_api.models.add_series_options import AddSeriesOptions
-from sonarr_api.models.alternate_title_resource import AlternateTitleResource
-from sonarr_api.models.apply_tags import ApplyTags
-from sonarr_api.models.authentication_required_type import AuthenticationRequiredType
-from sonarr_api.models.authentication_type import AuthenticationType
-from sonarr_api.models.auto_tagging_resource import AutoTaggingResource
-from sonarr_api.models.auto_tagging_specification_schema import AutoTaggingSpecificationSchema
-from sonarr_api.models.backup_resource import BackupResource
-from sonarr_api.models.backup_type import BackupType
-from sonarr_api.models.blocklist_bulk_resource import BlocklistBulkResource
-from sonarr_api.models.blocklist_resource import BlocklistResource
-from sonarr_api.models.blocklist_resource_paging_resource import BlocklistResourcePagingResource
-from sonarr_api.models.certificate_validation_type import CertificateValidationType
-from sonarr_api.models.command import Command
-from sonarr_api.models.command_priority import CommandPriority
-from sonarr_api.models.command_resource import CommandResource
-from sonarr_api.models.command_result import CommandResult
-from sonarr_api.models.command_status import CommandStatus
-from sonarr_api.models.command_trigger import CommandTrigger
-from sonarr_api.models.custom_filter_resource import CustomFilterResource
-from sonarr_api.models.custom_format_bulk_resource import CustomFormatBulkResource
-from sonarr_api.models.custom_format_resource import CustomFormatResource
-from sonarr_api.models.custom_format_specification_schema import CustomFormatSpecificationSchema
-from sonarr_api.models.database_type import DatabaseType
-from sonarr_api.models.delay_profile_resource import DelayProfileResource
-from sonarr_api.models.disk_space_resource import DiskSpaceResource
-from sonarr_api.models.download_client_bulk_resource import DownloadClientBulkResource
-from sonarr_api.models.download_client_config_resource import DownloadClientConfigResource
-from sonarr_api.models.download_client_resource import DownloadClientResource
-from sonarr_api.models.download_protocol import DownloadProtocol
-from sonarr_api.models.episode_file_list_resource import EpisodeFileListResource
-from sonarr_api.models.episode_file_resource import EpisodeFileResource
-from sonarr_api.models.episode_history_event_type import EpisodeHistoryEventType
-from sonarr_api.models.episode_resource import EpisodeResource
-from sonarr_api.models.episode_resource_paging_resource import EpisodeResourcePagingResource
-from sonarr_api.models.episode_title_required_type import EpisodeTitleRequiredType
-from sonarr_api.models.episodes_monitored_resource import EpisodesMonitoredResource
-from sonarr_api.models.file_date_type import FileDateType
-from sonarr_api.models.health_check_result import HealthCheckResult
-from sonarr_api.models.health_resource import HealthResource
-from sonarr_api.models.history_resource import HistoryResource
-from sonarr_api.models.history_resource_paging_resource import HistoryResourcePagingResource
-from sonarr_api.models.host_config_resource import HostConfigResource
-from sonarr_api.models.http_uri import HttpUri
-from sonarr_api.models.import_list_bulk_resource import ImportListBulkResource
-from sonarr_api.models.import_list_config_resource import ImportListConfigResource
-from sonarr_api.models.import_list_exclusion_bulk_resource import ImportListExclusionBulkResource
-from sonarr_api.models.import_list_exclusion_resource import ImportListExclusionResource
-from sonarr_api.models.import_list_exclusion_resource_paging_resource import ImportListExclusionResourcePagingResource
-from sonarr_api.models.import_list_resource import ImportListResource
-from sonarr_api.models.import_list_type import ImportListType
-from sonarr_api.models.import_rejection_resource import ImportRejectionResource
-from sonarr_api.models.indexer_bulk_resource import IndexerBulkResource
-from sonarr_api.models.indexer_config_resource import IndexerConfigResource
-from sonarr_api.models.indexer_flag_resource import IndexerFlagResource
-from sonarr_api.models.indexer_resource import IndexerResource
-from sonarr_api.models.language import Language
-from sonarr_api.models.language_profile_item_resource import LanguageProfileItemResource
-from sonarr_api.models.language_profile_resource import LanguageProfileResource
-from sonarr_api.models.language_resource import LanguageResource
-from sonarr_api.models.list_sync_level_type import ListSyncLevelType
-from sonarr_api.models.localization_language_resource import LocalizationLanguageResource
-from sonarr_api.models.localization_resource import LocalizationResource
-from sonarr_api.models.log_file_resource import LogFileResource
-from sonarr_api.models.log_resource import LogResource
-from sonarr_api.models.log_resource_paging_resource import LogResourcePagingResource
-from sonarr_api.models.manual_import_reprocess_resource import ManualImportReprocessResource
-from sonarr_api.models.manual_import_resource import ManualImportResource
-from sonarr_api.models.media_cover import MediaCover
-from sonarr_api.models.media_cover_types import MediaCoverTypes
-from sonarr_api.models.media_info_resource import MediaInfoResource
-from sonarr_api.models.media_management_config_resource import MediaManagementConfigResource
-from sonarr_api.models.metadata_resource import MetadataResource
-from sonarr_api.models.model_field import ModelField
-from sonarr_api.models.monitor_types import MonitorTypes
-from sonarr_api.models.monitoring_options import MonitoringOptions
-from sonarr_api.models.naming_config_resource import NamingConfigResource
-from sonarr_api.models.new_item_monitor_types import NewItemMonitorTypes
-from sonarr_api.models.notification_resource import NotificationResource
-from sonarr_api.models.parse_resource import ParseResource
-from sonarr_api.models.parsed_episode_info import ParsedEpisodeInfo
-from sonarr_api.models.ping_resource import PingResource
-from sonarr_api.models.privacy_level import PrivacyLevel
-from sonarr_api.models.profile_format_item_resource import ProfileFormatItemResource
-from sonarr_api.models.proper_download_types import ProperDownloadTypes
-from sonarr_api.models.provider_message import ProviderMessage
-from sonarr_api.models.provider_message_type import ProviderMessageType
-from sonarr_api.models.proxy_type import ProxyType
-from sonarr_api.models.quality import Quality
-from sonarr_api.models.quality_definition_limits_resource import QualityDefinitionLimitsResource
-from sonarr_api.models.quality_definition_resource import QualityDefinitionResource
-from sonarr_api.models.quality_model import QualityModel
-from sonarr_api.models.quality_profile_quality_item_resource import QualityProfileQualityItemResource
-from sonarr_api.models.quality_profile_resource import QualityProfileResource
-from sonarr_api.models.quality_source import QualitySource
-from sonarr_api.models.queue_bulk_resource import QueueBulkResource
-from sonarr_api.models.queue_resource import QueueResource
-from sonarr_api.models.queue_resource_paging_resource import QueueResourcePagingResource
-from sonarr_api.models.queue_status import QueueStatus
-from sonarr_api.models.queue_status_resource import QueueStatusResource
-from sonarr_api.models.ratings import Ratings
-from sonarr_api.models.rejection_type import RejectionType
-from sonarr_api.models.release_episode_resource import ReleaseEpisodeResource
-from sonarr_api.models.release_profile_resource import ReleaseProfileResource
-from sonarr_api.models.release_resource import ReleaseResource
-from sonarr_api.models.release_type import ReleaseType
-from sonarr_api.models.remote_path_mapping_resource import RemotePathMappingResource
-from sonarr_api.models.rename_episode_resource import RenameEpisodeResource
-from sonarr_api.models.rescan_after_refresh_type import RescanAfterRefreshType
-from sonarr_api.models.revision import Revision
-from sonarr_api.models.root_folder_resource import RootFolderResource
-from sonarr_api.models.runtime_mode import RuntimeMode
-from sonarr_api.models.season_pass_resource import SeasonPassResource
-from sonarr_api.models.season_pass_series_resource import SeasonPassSeriesResource
-from sonarr_api.models.season_resource import SeasonResource
-from sonarr_api.models.season_statistics_resource import SeasonStatisticsResource
-from sonarr_api.models.select_option import SelectOption
-from sonarr_api.models.series_editor_resource import SeriesEditorResource
-from sonarr_api.models.series_resource import SeriesResource
-from sonarr_api.models.series_statistics_resource import SeriesStatisticsResource
-from sonarr_api.models.series_status_type import SeriesStatusType
-from sonarr_api.models.series_title_info import SeriesTitleInfo
-from sonarr_api.models.series_types import SeriesTypes
-from sonarr_api.models.sort_direction import SortDirection
-from sonarr_api.models.system_resource import SystemResource
-from sonarr_api.models.tag_details_resource import TagDetailsResource
-from sonarr_api.models.tag_resource import TagResource
-from sonarr_api.models.task_resource import TaskResource
-from sonarr_api.models.tracked_download_state import TrackedDownloadState
-from sonarr_api.models.tracked_download_status import TrackedDownloadStatus
-from sonarr_api.models.tracked_download_status_message import TrackedDownloadStatusMessage
-from sonarr_api.models.ui_config_resource import UiConfigResource
-from sonarr_api.models.unmapped_folder import UnmappedFolder
-from sonarr_api.models.update_changes import UpdateChanges
-from sonarr_api.models.update_mechanism import UpdateMechanism
-from sonarr_api.models.update_resource import UpdateResource
+import importlib
+from typing import TYPE_CHECKING
 
+# Exports are imported on first access (PEP 562), so importing the package only
+# loads the API classes and models that are actually used
+_LAZY_IMPORTS = {
+    "AddSeriesOptions": "sonarr_api.models.add_series_options",
+    "AlternateTitleResource": "sonarr_api.models.alternate_title_resource",
+    "ApplyTags": "sonarr_api.models.apply_tags",
+    "AuthenticationRequiredType": "sonarr_api.models.authentication_required_type",
+    "AuthenticationType": "sonarr_api.models.authentication_type",
+    "AutoTaggingResource": "sonarr_api.models.auto_tagging_resource",
+    "AutoTaggingSpecificationSchema": "sonarr_api.models.auto_tagging_specification_schema",
+    "BackupResource": "sonarr_api.models.backup_resource",
+    "BackupType": "sonarr_api.models.backup_type",
+    "BlocklistBulkResource": "sonarr_api.models.blocklist_bulk_resource",
+    "BlocklistResource": "sonarr_api.models.blocklist_resource",
+    "BlocklistResourcePagingResource": "sonarr_api.models.blocklist_resource_paging_resource",
+    "CertificateValidationType": "sonarr_api.models.certificate_validation_type",
+    "Command": "sonarr_api.models.command",
+    "CommandPriority": "sonarr_api.models.command_priority",
+    "CommandResource": "sonarr_api.models.command_resource",
+    "CommandResult": "sonarr_api.models.command_result",
+    "CommandStatus": "sonarr_api.models.command_status",
+    "CommandTrigger": "sonarr_api.models.command_trigger",
+    "CustomFilterResource": "sonarr_api.models.custom_filter_resource",
+    "CustomFormatBulkResource": "sonarr_api.models.custom_format_bulk_resource",
+    "CustomFormatResource": "sonarr_api.models.custom_format_resource",
+    "CustomFormatSpecificationSchema": "sonarr_api.models.custom_format_specification_schema",
+    "DatabaseType": "sonarr_api.models.database_type",
+    "DelayProfileResource": "sonarr_api.models.delay_profile_resource",
+    "DiskSpaceResource": "sonarr_api.models.disk_space_resource",
+    "DownloadClientBulkResource": "sonarr_api.models.download_client_bulk_resource",
+    "DownloadClientConfigResource": "sonarr_api.models.download_client_config_resource",
+    "DownloadClientResource": "sonarr_api.models.download_client_resource",
+    "DownloadProtocol": "sonarr_api.models.download_protocol",
+    "EpisodeFileListResource": "sonarr_api.models.episode_file_list_resource",
+    "EpisodeFileResource": "sonarr_api.models.episode_file_resource",
+    "EpisodeHistoryEventType": "sonarr_api.models.episode_history_event_type",
+    "EpisodeResource": "sonarr_api.models.episode_resource",
+    "EpisodeResourcePagingResource": "sonarr_api.models.episode_resource_paging_resource",
+    "EpisodeTitleRequiredType": "sonarr_api.models.episode_title_required_type",
+    "EpisodesMonitoredResource": "sonarr_api.models.episodes_monitored_resource",
+    "FileDateType": "sonarr_api.models.file_date_type",
+    "HealthCheckResult": "sonarr_api.models.health_check_result",
+    "HealthResource": "sonarr_api.models.health_resource",
+    "HistoryResource": "sonarr_api.models.history_resource",
+    "HistoryResourcePagingResource": "sonarr_api.models.history_resource_paging_resource",
+    "HostConfigResource": "sonarr_api.models.host_config_resource",
+    "HttpUri": "sonarr_api.models.http_uri",
+    "ImportListBulkResource": "sonarr_api.models.import_list_bulk_resource",
+    "ImportListConfigResource": "sonarr_api.models.import_list_config_resource",
+    "ImportListExclusionBulkResource": "sonarr_api.models.import_list_exclusion_bulk_resource",
+    "ImportListExclusionResource": "sonarr_api.models.import_list_exclusion_resource",
+    "ImportListExclusionResourcePagingResource": "sonarr_api.models.import_list_exclusion_resource_paging_resource",
+    "ImportListResource": "sonarr_api.models.import_list_resource",
+    "ImportListType": "sonarr_api.models.import_list_type",
+    "ImportRejectionResource": "sonarr_api.models.import_rejection_resource",
+    "IndexerBulkResource": "sonarr_api.models.indexer_bulk_resource",
+    "IndexerConfigResource": "sonarr_api.models.indexer_config_resource",
+    "IndexerFlagResource": "sonarr_api.models.indexer_flag_resource",
+    "IndexerResource": "sonarr_api.models.indexer_resource",
+    "Language": "sonarr_api.models.language",
+    "LanguageProfileItemResource": "sonarr_api.models.language_profile_item_resource",
+    "LanguageProfileResource": "sonarr_api.models.language_profile_resource",
+    "LanguageResource": "sonarr_api.models.language_resource",
+    "ListSyncLevelType": "sonarr_api.models.list_sync_level_type",
+    "LocalizationLanguageResource": "sonarr_api.models.localization_language_resource",
+    "LocalizationResource": "sonarr_api.models.localization_resource",
+    "LogFileResource": "sonarr_api.models.log_file_resource",
+    "LogResource": "sonarr_api.models.log_resource",
+    "LogResourcePagingResource": "sonarr_api.models.log_resource_paging_resource",
+    "ManualImportReprocessResource": "sonarr_api.models.manual_import_reprocess_resource",
+    "ManualImportResource": "sonarr_api.models.manual_import_resource",
+    "MediaCover": "sonarr_api.models.media_cover",
+    "MediaCoverTypes": "sonarr_api.models.media_cover_types",
+    "MediaInfoResource": "sonarr_api.models.media_info_resource",
+    "MediaManagementConfigResource": "sonarr_api.models.media_management_config_resource",
+    "MetadataResource": "sonarr_api.models.metadata_resource",
+    "ModelField": "sonarr_api.models.model_field",
+    "MonitorTypes": "sonarr_api.models.monitor_types",
+    "MonitoringOptions": "sonarr_api.models.monitoring_options",
+    "NamingConfigResource": "sonarr_api.models.naming_config_resource",
+    "NewItemMonitorTypes": "sonarr_api.models.new_item_monitor_types",
+    "NotificationResource": "sonarr_api.models.notification_resource",
+    "ParseResource": "sonarr_api.models.parse_resource",
+    "ParsedEpisodeInfo": "sonarr_api.models.parsed_episode_info",
+    "PingResource": "sonarr_api.models.ping_resource",
+    "PrivacyLevel": "sonarr_api.models.privacy_level",
+    "ProfileFormatItemResource": "sonarr_api.models.profile_format_item_resource",
+    "ProperDownloadTypes": "sonarr_api.models.proper_download_types",
+    "ProviderMessage": "sonarr_api.models.provider_message",
+    "ProviderMessageType": "sonarr_api.models.provider_message_type",
+    "ProxyType": "sonarr_api.models.proxy_type",
+    "Quality": "sonarr_api.models.quality",
+    "QualityDefinitionLimitsResource": "sonarr_api.models.quality_definition_limits_resource",
+    "QualityDefinitionResource": "sonarr_api.models.quality_definition_resource",
+    "QualityModel": "sonarr_api.models.quality_model",
+    "QualityProfileQualityItemResource": "sonarr_api.models.quality_profile_quality_item_resource",
+    "QualityProfileResource": "sonarr_api.models.quality_profile_resource",
+    "QualitySource": "sonarr_api.models.quality_source",
+    "QueueBulkResource": "sonarr_api.models.queue_bulk_resource",
+    "QueueResource": "sonarr_api.models.queue_resource",
+    "QueueResourcePagingResource": "sonarr_api.models.queue_resource_paging_resource",
+    "QueueStatus": "sonarr_api.models.queue_status",
+    "QueueStatusResource": "sonarr_api.models.queue_status_resource",
+    "Ratings": "sonarr_api.models.ratings",
+    "RejectionType": "sonarr_api.models.rejection_type",
+    "ReleaseEpisodeResource": "sonarr_api.models.release_episode_resource",
+    "ReleaseProfileResource": "sonarr_api.models.release_profile_resource",
+    "ReleaseResource": "sonarr_api.models.release_resource",
+    "ReleaseType": "sonarr_api.models.release_type",
+    "RemotePathMappingResource": "sonarr_api.models.remote_path_mapping_resource",
+    "RenameEpisodeResource": "sonarr_api.models.rename_episode_resource",
+    "RescanAfterRefreshType": "sonarr_api.models.rescan_after_refresh_type",
+    "Revision": "sonarr_api.models.revision",
+    "RootFolderResource": "sonarr_api.models.root_folder_resource",
+    "RuntimeMode": "sonarr_api.models.runtime_mode",
+    "SeasonPassResource": "sonarr_api.models.season_pass_resource",
+    "SeasonPassSeriesResource": "sonarr_api.models.season_pass_series_resource",
+    "SeasonResource": "sonarr_api.models.season_resource",
+    "SeasonStatisticsResource": "sonarr_api.models.season_statistics_resource",
+    "SelectOption": "sonarr_api.models.select_option",
+    "SeriesEditorResource": "sonarr_api.models.series_editor_resource",
+    "SeriesResource": "sonarr_api.models.series_resource",
+    "SeriesStatisticsResource": "sonarr_api.models.series_statistics_resource",
+    "SeriesStatusType": "sonarr_api.models.series_status_type",
+    "SeriesTitleInfo": "sonarr_api.models.series_title_info",
+    "SeriesTypes": "sonarr_api.models.series_types",
+    "SortDirection": "sonarr_api.models.sort_direction",
+    "SystemResource": "sonarr_api.models.system_resource",
+    "TagDetailsResource": "sonarr_api.models.tag_details_resource",
+    "TagResource": "sonarr_api.models.tag_resource",
+    "TaskResource": "sonarr_api.models.task_resource",
+    "TrackedDownloadState": "sonarr_api.models.tracked_download_state",
+    "TrackedDownloadStatus": "sonarr_api.models.tracked_download_status",
+    "TrackedDownloadStatusMessage": "sonarr_api.models.tracked_download_status_message",
+    "UiConfigResource": "sonarr_api.models.ui_config_resource",
+    "UnmappedFolder": "sonarr_api.models.unmapped_folder",
+    "UpdateChanges": "sonarr_api.models.update_changes",
+    "UpdateMechanism": "sonarr_api.models.update_mechanism",
+    "UpdateResource": "sonarr_api.models.update_resource",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+_SUBMODULES = set()
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        if name in _SUBMODULES:
+            return importlib.import_module(f"{__name__}.{name}")
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if TYPE_CHECKING:
+    from sonarr_api.models.add_series_options import AddSeriesOptions
+    from sonarr_api.models.alternate_title_resource import AlternateTitleResource
+    from sonarr_api.models.apply_tags import ApplyTags
+    from sonarr_api.models.authentication_required_type import AuthenticationRequiredType
+    from sonarr_api.models.authentication_type import AuthenticationType
+    from sonarr_api.models.auto_tagging_resource import AutoTaggingResource
+    from sonarr_api.models.auto_tagging_specification_schema import AutoTaggingSpecificationSchema
+    from sonarr_api.models.backup_resource import BackupResource
+    from sonarr_api.models.backup_type import BackupType
+    from sonarr_api.models.blocklist_bulk_resource import BlocklistBulkResource
+    from sonarr_api.models.blocklist_resource import BlocklistResource
+    from sonarr_api.models.blocklist_resource_paging_resource import BlocklistResourcePagingResource
+    from sonarr_api.models.certificate_validation_type import CertificateValidationType
+    from sonarr_api.models.command import Command
+    from sonarr_api.models.command_priority import CommandPriority
+    from sonarr_api.models.command_resource import CommandResource
+    from sonarr_api.models.command_result import CommandResult
+    from sonarr_api.models.command_status import CommandStatus
+    from sonarr_api.models.command_trigger import CommandTrigger
+    from sonarr_api.models.custom_filter_resource import CustomFilterResource
+    from sonarr_api.models.custom_format_bulk_resource import CustomFormatBulkResource
+    from sonarr_api.models.custom_format_resource import CustomFormatResource
+    from sonarr_api.models.custom_format_specification_schema import CustomFormatSpecificationSchema
+    from sonarr_api.models.database_type import DatabaseType
+    from sonarr_api.models.delay_profile_resource import DelayProfileResource
+    from sonarr_api.models.disk_space_resource import DiskSpaceResource
+    from sonarr_api.models.download_client_bulk_resource import DownloadClientBulkResource
+    from sonarr_api.models.download_client_config_resource import DownloadClientConfigResource
+    from sonarr_api.models.download_client_resource import DownloadClientResource
+    from sonarr_api.models.download_protocol import DownloadProtocol
+    from sonarr_api.models.episode_file_list_resource import EpisodeFileListResource
+    from sonarr_api.models.episode_file_resource import EpisodeFileResource
+    from sonarr_api.models.episode_history_event_type import EpisodeHistoryEventType
+    from sonarr_api.models.episode_resource import EpisodeResource
+    from sonarr_api.models.episode_resource_paging_resource import EpisodeResourcePagingResource
+    from sonarr_api.models.episode_title_required_type import EpisodeTitleRequiredType
+    from sonarr_api.models.episodes_monitored_resource import EpisodesMonitoredResource
+    from sonarr_api.models.file_date_type import FileDateType
+    from sonarr_api.models.health_check_result import HealthCheckResult
+    from sonarr_api.models.health_resource import HealthResource
+    from sonarr_api.models.history_resource import HistoryResource
+    from sonarr_api.models.history_resource_paging_resource import HistoryResourcePagingResource
+    from sonarr_api.models.host_config_resource import HostConfigResource
+    from sonarr_api.models.http_uri import HttpUri
+    from sonarr_api.models.import_list_bulk_resource import ImportListBulkResource
+    from sonarr_api.models.import_list_config_resource import ImportListConfigResource
+    from sonarr_api.models.import_list_exclusion_bulk_resource import ImportListExclusionBulkResource
+    from sonarr_api.models.import_list_exclusion_resource import ImportListExclusionResource
+    from sonarr_api.models.import_list_exclusion_resource_paging_resource import ImportListExclusionResourcePagingResource
+    from sonarr_api.models.import_list_resource import ImportListResource
+    from sonarr_api.models.import_list_type import ImportListType
+    from sonarr_api.models.import_rejection_resource import ImportRejectionResource
+    from sonarr_api.models.indexer_bulk_resource import IndexerBulkResource
+    from sonarr_api.models.indexer_config_resource import IndexerConfigResource
+    from sonarr_api.models.indexer_flag_resource import IndexerFlagResource
+    from sonarr_api.models.indexer_resource import IndexerResource
+    from sonarr_api.models.language import Language
+    from sonarr_api.models.language_profile_item_resource import LanguageProfileItemResource
+    from sonarr_api.models.language_profile_resource import LanguageProfileResource
+    from sonarr_api.models.language_resource import LanguageResource
+    from sonarr_api.models.list_sync_level_type import ListSyncLevelType
+    from sonarr_api.models.localization_language_resource import LocalizationLanguageResource
+    from sonarr_api.models.localization_resource import LocalizationResource
+    from sonarr_api.models.log_file_resource import LogFileResource
+    from sonarr_api.models.log_resource import LogResource
+    from sonarr_api.models.log_resource_paging_resource import LogResourcePagingResource
+    from sonarr_api.models.manual_import_reprocess_resource import ManualImportReprocessResource
+    from sonarr_api.models.manual_import_resource import ManualImportResource
+    from sonarr_api.models.media_cover import MediaCover
+    from sonarr_api.models.media_cover_types import MediaCoverTypes
+    from sonarr_api.models.media_info_resource import MediaInfoResource
+    from sonarr_api.models.media_management_config_resource import MediaManagementConfigResource
+    from sonarr_api.models.metadata_resource import MetadataResource
+    from sonarr_api.models.model_field import ModelField
+    from sonarr_api.models.monitor_types import MonitorTypes
+    from sonarr_api.models.monitoring_options import MonitoringOptions
+    from sonarr_api.models.naming_config_resource import NamingConfigResource
+    from sonarr_api.models.new_item_monitor_types import NewItemMonitorTypes
+    from sonarr_api.models.notification_resource import NotificationResource
+    from sonarr_api.models.parse_resource import ParseResource
+    from sonarr_api.models.parsed_episode_info import ParsedEpisodeInfo
+    from sonarr_api.models.ping_resource import PingResource
+    from sonarr_api.models.privacy_level import PrivacyLevel
+    from sonarr_api.models.profile_format_item_resource import ProfileFormatItemResource
+    from sonarr_api.models.proper_download_types import ProperDownloadTypes
+    from sonarr_api.models.provider_message import ProviderMessage
+    from sonarr_api.models.provider_message_type import ProviderMessageType
+    from sonarr_api.models.proxy_type import ProxyType
+    from sonarr_api.models.quality import Quality
+    from sonarr_api.models.quality_definition_limits_resource import QualityDefinitionLimitsResource
+    from sonarr_api.models.quality_definition_resource import QualityDefinitionResource
+    from sonarr_api.models.quality_model import QualityModel
+    from sonarr_api.models.quality_profile_quality_item_resource import QualityProfileQualityItemResource
+    from sonarr_api.models.quality_profile_resource import QualityProfileResource
+    from sonarr_api.models.quality_source import QualitySource
+    from sonarr_api.models.queue_bulk_resource import QueueBulkResource
+    from sonarr_api.models.queue_resource import QueueResource
+    from sonarr_api.models.queue_resource_paging_resource import QueueResourcePagingResource
+    from sonarr_api.models.queue_status import QueueStatus
+    from sonarr_api.models.queue_status_resource import QueueStatusResource
+    from sonarr_api.models.ratings import Ratings
+    from sonarr_api.models.rejection_type import RejectionType
+    from sonarr_api.models.release_episode_resource import ReleaseEpisodeResource
+    from sonarr_api.models.release_profile_resource import ReleaseProfileResource
+    from sonarr_api.models.release_resource import ReleaseResource
+    from sonarr_api.models.release_type import ReleaseType
+    from sonarr_api.models.remote_path_mapping_resource import RemotePathMappingResource
+    from sonarr_api.models.rename_episode_resource import RenameEpisodeResource
+    from sonarr_api.models.rescan_after_refresh_type import RescanAfterRefreshType
+    from sonarr_api.models.revision import Revision
+    from sonarr_api.models.root_folder_resource import RootFolderResource
+    from sonarr_api.models.runtime_mode import RuntimeMode
+    from sonarr_api.models.season_pass_resource import SeasonPassResource
+    from sonarr_api.models.season_pass_series_resource import SeasonPassSeriesResource
+    from sonarr_api.models.season_resource import SeasonResource
+    from sonarr_api.models.season_statistics_resource import SeasonStatisticsResource
+    from sonarr_api.models.select_option import SelectOption
+    from sonarr_api.models.series_editor_resource import SeriesEditorResource
+    from sonarr_api.models.series_resource import SeriesResource
+    from sonarr_api.models.series_statistics_resource import SeriesStatisticsResource
+    from sonarr_api.models.series_status_type import SeriesStatusType
+    from sonarr_api.models.series_title_info import SeriesTitleInfo
+    from sonarr_api.models.series_types import SeriesTypes
+    from sonarr_api.models.sort_direction import SortDirection
+    from sonarr_api.models.system_resource import SystemResource
+    from sonarr_api.models.tag_details_resource import TagDetailsResource
+    from sonarr_api.models.tag_resource import TagResource
+    from sonarr_api.models.task_resource import TaskResource
+    from sonarr_api.models.tracked_download_state import TrackedDownloadState
+    from sonarr_api.models.tracked_download_status import TrackedDownloadStatus
+    from sonarr_api.models.tracked_download_status_message import TrackedDownloadStatusMessage
+    from sonarr_api.models.ui_config_resource import UiConfigResource
+    from sonarr_api.models.unmapped_folder import UnmappedFolder
+    from sonarr_api.models.update_changes import UpdateChanges
+    from sonarr_api.models.update_mechanism import UpdateMechanism
+    from sonarr_api.models.update_resource import UpdateResource
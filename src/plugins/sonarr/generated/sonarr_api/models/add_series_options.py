@@ -18,6 +18,7 @@ import re  # noqa: F401
 import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool
+from sonarr_api.build_options import DEFER_BUILD
 from typing import Any, ClassVar, Dict, List, Optional
 from sonarr_api.models.monitor_types import MonitorTypes
 from typing import Optional, Set
@@ -38,6 +39,7 @@ class AddSeriesOptions(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=DEFER_BUILD,
     )
 
 
@@ -18,6 +18,7 @@ import re  # noqa: F401
 import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
+from sonarr_api.build_options import DEFER_BUILD
 from typing import Any, ClassVar, Dict, List, Optional
 from typing import Optional, Set
 from typing_extensions import Self
@@ -37,6 +38,7 @@ class AlternateTitleResource(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=DEFER_BUILD,
     )
 
 
@@ -18,6 +18,7 @@ import re  # noqa: F401
 import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
+from sonarr_api.build_options import DEFER_BUILD
 from typing import Any, ClassVar, Dict, List, Optional
 from sonarr_api.models.model_field import ModelField
 from typing import Optional, Set
@@ -40,6 +41,7 @@ class AutoTaggingSpecificationSchema(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=DEFER_BUILD,
     )
 
 
@@ -19,6 +19,7 @@ import json
 
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict, StrictInt, StrictStr
+from sonarr_api.build_options import DEFER_BUILD
 from typing import Any, ClassVar, Dict, List, Optional
 from sonarr_api.models.backup_type import BackupType
 from typing import Optional, Set
@@ -40,6 +41,7 @@ class BackupResource(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=DEFER_BUILD,
     )
 
 
@@ -19,6 +19,7 @@ import json
 
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
+from sonarr_api.build_options import DEFER_BUILD
 from typing import Any, ClassVar, Dict, List, Optional
 from sonarr_api.models.custom_format_resource import CustomFormatResource
 from sonarr_api.models.download_protocol import DownloadProtocol
@@ -50,6 +51,7 @@ class BlocklistResource(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=DEFER_BUILD,
     )
 
 
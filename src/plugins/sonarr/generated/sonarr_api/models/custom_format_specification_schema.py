@@ -18,6 +18,7 @@ import re  # noqa: F401
 import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
+from sonarr_api.build_options import DEFER_BUILD
 from typing import Any, ClassVar, Dict, List, Optional
 from sonarr_api.models.model_field import ModelField
 from typing import Optional, Set
@@ -42,6 +43,7 @@ class CustomFormatSpecificationSchema(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=DEFER_BUILD,
     )
 
 
@@ -146,5 +148,6 @@ class CustomFormatSpecificationSchema(BaseModel):
         return _obj
 
 # TODO: Rewrite to not use raise_errors
-CustomFormatSpecificationSchema.model_rebuild(raise_errors=False)
+if not DEFER_BUILD:
+    CustomFormatSpecificationSchema.model_rebuild(raise_errors=False)
 
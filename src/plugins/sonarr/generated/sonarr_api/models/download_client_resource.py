@@ -18,6 +18,7 @@ import re  # noqa: F401
 import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
+from sonarr_api.build_options import DEFER_BUILD
 from typing import Any, ClassVar, Dict, List, Optional
 from sonarr_api.models.download_protocol import DownloadProtocol
 from sonarr_api.models.model_field import ModelField
@@ -50,6 +51,7 @@ class DownloadClientResource(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=DEFER_BUILD,
     )
 
 
@@ -173,5 +175,6 @@ class DownloadClientResource(BaseModel):
         return _obj
 
 # TODO: Rewrite to not use raise_errors
-DownloadClientResource.model_rebuild(raise_errors=False)
+if not DEFER_BUILD:
+    DownloadClientResource.model_rebuild(raise_errors=False)
 
@@ -18,6 +18,7 @@ import re  # noqa: F401
 import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
+from sonarr_api.build_options import DEFER_BUILD
 from typing import Any, ClassVar, Dict, List, Optional
 from sonarr_api.models.import_list_type import ImportListType
 from sonarr_api.models.model_field import ModelField
@@ -59,6 +60,7 @@ class ImportListResource(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=DEFER_BUILD,
     )
 
 
@@ -193,5 +195,6 @@ class ImportListResource(BaseModel):
         return _obj
 
 # TODO: Rewrite to not use raise_errors
-ImportListResource.model_rebuild(raise_errors=False)
+if not DEFER_BUILD:
+    ImportListResource.model_rebuild(raise_errors=False)
 
@@ -18,6 +18,7 @@ import re  # noqa: F401
 import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
+from sonarr_api.build_options import DEFER_BUILD
 from typing import Any, ClassVar, Dict, List, Optional
 from sonarr_api.models.download_protocol import DownloadProtocol
 from sonarr_api.models.model_field import ModelField
@@ -54,6 +55,7 @@ class IndexerResource(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=DEFER_BUILD,
     )
 
 
@@ -181,5 +183,6 @@ class IndexerResource(BaseModel):
         return _obj
 
 # TODO: Rewrite to not use raise_errors
-IndexerResource.model_rebuild(raise_errors=False)
+if not DEFER_BUILD:
+    IndexerResource.model_rebuild(raise_errors=False)
 
@@ -18,6 +18,7 @@ import re  # noqa: F401
 import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
+from sonarr_api.build_options import DEFER_BUILD
 from typing import Any, ClassVar, Dict, List, Optional
 from sonarr_api.models.model_field import ModelField
 from sonarr_api.models.provider_message import ProviderMessage
@@ -45,6 +46,7 @@ class MetadataResource(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=DEFER_BUILD,
     )
 
 
@@ -164,5 +166,6 @@ class MetadataResource(BaseModel):
         return _obj
 
 # TODO: Rewrite to not use raise_errors
-MetadataResource.model_rebuild(raise_errors=False)
+if not DEFER_BUILD:
+    MetadataResource.model_rebuild(raise_errors=False)
 
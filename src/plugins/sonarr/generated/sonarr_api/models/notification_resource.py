@@ -18,6 +18,7 @@ import re  # noqa: F401
 import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
+from sonarr_api.build_options import DEFER_BUILD
 from typing import Any, ClassVar, Dict, List, Optional
 from sonarr_api.models.model_field import ModelField
 from sonarr_api.models.provider_message import ProviderMessage
@@ -73,6 +74,7 @@ class NotificationResource(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=DEFER_BUILD,
     )
 
 
@@ -230,5 +232,6 @@ class NotificationResource(BaseModel):
         return _obj
 
 # TODO: Rewrite to not use raise_errors
-NotificationResource.model_rebuild(raise_errors=False)
+if not DEFER_BUILD:
+    NotificationResource.model_rebuild(raise_errors=False)
 
@@ -18,6 +18,7 @@ import re  # noqa: F401
 import json
 
 from pydantic import BaseModel, ConfigDict, StrictBool, StrictInt, StrictStr
+from sonarr_api.build_options import DEFER_BUILD
 from typing import Any, ClassVar, Dict, List, Optional
 from sonarr_api.models.quality import Quality
 from typing import Optional, Set
@@ -38,6 +39,7 @@ class QualityProfileQualityItemResource(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=DEFER_BUILD,
     )
 
 
@@ -114,5 +116,6 @@ class QualityProfileQualityItemResource(BaseModel):
         return _obj
 
 # TODO: Rewrite to not use raise_errors
-QualityProfileQualityItemResource.model_rebuild(raise_errors=False)
+if not DEFER_BUILD:
+    QualityProfileQualityItemResource.model_rebuild(raise_errors=False)
 
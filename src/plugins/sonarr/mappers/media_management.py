@@ -67,6 +67,30 @@ class MediaManagementConfigMapper(
             "extra_file_extensions": api_model.extra_file_extensions,
         }
 
+    def from_api_dict(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Convert raw JSON to dict for comparison."""
+        return {
+            "id": data.get("id"),
+            "auto_unmonitor_previously_downloaded_episodes": data.get(
+                "autoUnmonitorPreviouslyDownloadedEpisodes"
+            ),
+            "recycle_bin": data.get("recycleBin"),
+            "recycle_bin_cleanup_days": data.get("recycleBinCleanupDays"),
+            "download_propers_and_repacks": data.get("downloadPropersAndRepacks"),
+            "create_empty_series_folders": data.get("createEmptySeriesFolders"),
+            "delete_empty_folders": data.get("deleteEmptyFolders"),
+            "file_date": data.get("fileDate"),
+            "rescan_after_refresh": data.get("rescanAfterRefresh"),
+            "set_permissions_linux": data.get("setPermissionsLinux"),
+            "chmod_folder": data.get("chmodFolder"),
+            "chown_group": data.get("chownGroup"),
+            "skip_free_space_check_when_importing": data.get("skipFreeSpaceCheckWhenImporting"),
+            "minimum_free_space_when_importing": data.get("minimumFreeSpaceWhenImporting"),
+            "copy_using_hardlinks": data.get("copyUsingHardlinks"),
+            "import_extra_files": data.get("importExtraFiles"),
+            "extra_file_extensions": data.get("extraFileExtensions"),
+        }
+
     def get_match_key(self, item: dict[str, Any] | MediaManagementConfigResource) -> str:
         """Media management config is a singleton, so always return a constant key."""
         return "media_management_config"
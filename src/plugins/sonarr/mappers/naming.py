@@ -49,6 +49,21 @@ class NamingConfigMapper(ResourceMapper[NamingConfigResource, SonarrNamingConfig
             "multi_episode_style": api_model.multi_episode_style,
         }
 
+    def from_api_dict(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Convert raw JSON to dict for comparison."""
+        return {
+            "id": data.get("id"),
+            "rename_episodes": data.get("renameEpisodes"),
+            "replace_illegal_characters": data.get("replaceIllegalCharacters"),
+            "standard_episode_format": data.get("standardEpisodeFormat"),
+            "daily_episode_format": data.get("dailyEpisodeFormat"),
+            "anime_episode_format": data.get("animeEpisodeFormat"),
+            "series_folder_format": data.get("seriesFolderFormat"),
+            "season_folder_format": data.get("seasonFolderFormat"),
+            "specials_folder_format": data.get("specialsFolderFormat"),
+            "multi_episode_style": data.get("multiEpisodeStyle"),
+        }
+
     def get_match_key(self, item: dict[str, Any] | NamingConfigResource) -> str:
         """Naming config is a singleton, so always return a constant key."""
         return "naming_config"
@@ -1,20 +1,26 @@
 """Sonarr plugin implementation for Configarr."""
 
-from typing import Any
+from dataclasses import replace
+from typing import Any, Optional
 
 from pydantic import BaseModel
+from sonarr_api.models.custom_format_bulk_resource import CustomFormatBulkResource
 from sonarr_api.models.custom_format_resource import CustomFormatResource
 from sonarr_api.models.custom_format_specification_schema import CustomFormatSpecificationSchema
 from sonarr_api.models.delay_profile_resource import DelayProfileResource
+from sonarr_api.models.download_client_bulk_resource import DownloadClientBulkResource
 from sonarr_api.models.download_client_resource import DownloadClientResource
+from sonarr_api.models.indexer_bulk_resource import IndexerBulkResource
 from sonarr_api.models.indexer_resource import IndexerResource
+from sonarr_api.models.media_management_config_resource import MediaManagementConfigResource
+from sonarr_api.models.naming_config_resource import NamingConfigResource
 from sonarr_api.models.profile_format_item_resource import ProfileFormatItemResource
 from sonarr_api.models.quality_definition_resource import QualityDefinitionResource
 from sonarr_api.models.quality_profile_resource import QualityProfileResource
 from sonarr_api.models.tag_resource import TagResource
 
 from src.plugins.base import ArrClient, ArrPlugin, ResourceDefinition
-from src.plugins.sonarr.client import SonarrClient
+from src.plugins.sonarr.client import SonarrClient, read_body
 from src.plugins.sonarr.mappers.media_management import MediaManagementConfigMapper
 from src.plugins.sonarr.mappers.naming import NamingConfigMapper
 from src.plugins.sonarr.schema import SonarrInstanceConfig
@@ -25,6 +31,7 @@ from src.shared.mappers.indexers import IndexerMapper
 from src.shared.mappers.quality_definitions import QualityDefinitionMapper
 from src.shared.mappers.quality_profiles import QualityProfileMapper
 from src.shared.mappers.tags import TagMapper
+from src.shared.schemas import ConnectionConfig
 
 
 class SonarrPlugin(ArrPlugin):
@@ -42,8 +49,10 @@ class SonarrPlugin(ArrPlugin):
     def config_key(self) -> str:
         return "sonarr"
 
-    def get_client(self, base_url: str, api_key: str) -> ArrClient:
-        return SonarrClient(base_url=base_url, api_key=api_key)
+    def get_client(
+        self, base_url: str, api_key: str, connection: Optional[ConnectionConfig] = None
+    ) -> ArrClient:
+        return SonarrClient(base_url=base_url, api_key=api_key, connection=connection)
 
     def get_instance_schema(self) -> type[BaseModel]:
         return SonarrInstanceConfig
@@ -51,183 +60,246 @@ class SonarrPlugin(ArrPlugin):
     def get_resource_definitions(
         self, client: SonarrClient, instance_config: SonarrInstanceConfig
     ) -> list[ResourceDefinition]:
+        """Build the list of resources to reconcile for Sonarr (the instance's configured ones)."""
+        return [
+            definition
+            for definition in self.get_all_resource_definitions(client)
+            if getattr(instance_config, definition.name, None)
+        ]
+
+    def get_all_resource_definitions(self, client: SonarrClient) -> list[ResourceDefinition]:
         """
-        Build ordered list of resources to reconcile for Sonarr.
+        Build the definitions of every resource type Sonarr supports.
         
-        Resources are ordered by dependency: tags first, then resources that depend on tags, etc.
+        Dependencies are declared per resource: quality profiles need custom formats,
+        and delay profiles, indexers and download clients need tags. Everything else
+        is independent and may be reconciled concurrently.
         """
         definitions = []
 
         # 1. Tags (no dependencies)
-        if instance_config.tags:
-            tag_mapper = TagMapper(TagResource)
-            definitions.append(
-                ResourceDefinition(
-                    name="tags",
-                    order=1,
-                    mapper=tag_mapper,
-                    list_fn=lambda: client.tags.api_v3_tag_get(),
-                    create_fn=lambda model: client.tags.api_v3_tag_post(tag_resource=model),
-                    update_fn=lambda id, model: client.tags.api_v3_tag_id_put(
-                        id=id, tag_resource=model
-                    ),
-                    delete_fn=lambda id: client.tags.api_v3_tag_id_delete(id=id),
-                )
+        tag_mapper = TagMapper(TagResource)
+        definitions.append(
+            ResourceDefinition(
+                name="tags",
+                models=(TagResource,),
+                mapper=tag_mapper,
+                list_fn=lambda: client.tags.api_v3_tag_get(),
+                list_body_fn=lambda: read_body(
+                    client.tags.api_v3_tag_get_without_preload_content()
+                ),
+                create_fn=lambda model: client.tags.api_v3_tag_post(tag_resource=model),
+                update_fn=lambda id, model: client.tags.api_v3_tag_id_put(
+                    id=id, tag_resource=model
+                ),
+                delete_fn=lambda id: client.tags.api_v3_tag_id_delete(id=id),
             )
+        )
 
         # 2. Custom Formats (no dependencies)
-        if instance_config.custom_formats:
-            cf_mapper = CustomFormatMapper(CustomFormatResource, CustomFormatSpecificationSchema)
-            definitions.append(
-                ResourceDefinition(
-                    name="custom_formats",
-                    order=2,
-                    mapper=cf_mapper,
-                    list_fn=lambda: client.custom_formats.api_v3_customformat_get(),
-                    create_fn=lambda model: client.custom_formats.api_v3_customformat_post(
-                        custom_format_resource=model
-                    ),
-                    update_fn=lambda id, model: client.custom_formats.api_v3_customformat_id_put(
-                        id=id, custom_format_resource=model
-                    ),
-                    delete_fn=lambda id: client.custom_formats.api_v3_customformat_id_delete(id=id),
-                )
+        cf_mapper = CustomFormatMapper(CustomFormatResource, CustomFormatSpecificationSchema)
+        definitions.append(
+            ResourceDefinition(
+                name="custom_formats",
+                models=(
+                    CustomFormatResource,
+                    CustomFormatSpecificationSchema,
+                    CustomFormatBulkResource,
+                ),
+                mapper=cf_mapper,
+                list_fn=lambda: client.custom_formats.api_v3_customformat_get(),
+                list_body_fn=lambda: read_body(
+                    client.custom_formats.api_v3_customformat_get_without_preload_content()
+                ),
+                create_fn=lambda model: client.custom_formats.api_v3_customformat_post(
+                    custom_format_resource=model
+                ),
+                update_fn=lambda id, model: client.custom_formats.api_v3_customformat_id_put(
+                    id=id, custom_format_resource=model
+                ),
+                delete_fn=lambda id: client.custom_formats.api_v3_customformat_id_delete(id=id),
+                bulk_delete_fn=lambda ids: client.custom_formats.api_v3_customformat_bulk_delete(
+                    custom_format_bulk_resource=CustomFormatBulkResource(ids=ids)
+                ),
             )
+        )
 
         # 3. Quality Definitions (no dependencies, but updates only)
-        if instance_config.quality_definitions:
-            qd_mapper = QualityDefinitionMapper(QualityDefinitionResource)
-            definitions.append(
-                ResourceDefinition(
-                    name="quality_definitions",
-                    order=3,
-                    mapper=qd_mapper,
-                    list_fn=lambda: client.quality_definitions.api_v3_qualitydefinition_get(),
-                    create_fn=lambda model: None,  # No create for quality definitions
-                    update_fn=lambda id, model: client.quality_definitions.api_v3_qualitydefinition_id_put(
+        qd_mapper = QualityDefinitionMapper(QualityDefinitionResource)
+
+        def quality_definitions_body() -> bytes:
+            api = client.quality_definitions
+            return read_body(api.api_v3_qualitydefinition_get_without_preload_content())
+
+        definitions.append(
+            ResourceDefinition(
+                name="quality_definitions",
+                models=(QualityDefinitionResource,),
+                mapper=qd_mapper,
+                list_fn=lambda: client.quality_definitions.api_v3_qualitydefinition_get(),
+                list_body_fn=quality_definitions_body,
+                create_fn=lambda model: None,  # No create for quality definitions
+                update_fn=lambda id, model: (
+                    client.quality_definitions.api_v3_qualitydefinition_id_put(
                         id=id, quality_definition_resource=model
-                    ),
-                    delete_fn=None,  # No delete for quality definitions
-                )
+                    )
+                ),
+                delete_fn=None,  # No delete for quality definitions
+                bulk_update_fn=lambda models: (
+                    client.quality_definitions.api_v3_qualitydefinition_update_put(
+                        quality_definition_resource=models
+                    )
+                ),
             )
+        )
 
         # 4. Quality Profiles (depends on custom formats)
-        if instance_config.quality_profiles:
-            qp_mapper = QualityProfileMapper(QualityProfileResource, ProfileFormatItemResource)
-            definitions.append(
-                ResourceDefinition(
-                    name="quality_profiles",
-                    order=4,
-                    mapper=qp_mapper,
-                    list_fn=lambda: client.quality_profiles.api_v3_qualityprofile_get(),
-                    create_fn=lambda model: client.quality_profiles.api_v3_qualityprofile_post(
-                        quality_profile_resource=model
-                    ),
-                    update_fn=lambda id, model: client.quality_profiles.api_v3_qualityprofile_id_put(
-                        id=id, quality_profile_resource=model
-                    ),
-                    delete_fn=lambda id: client.quality_profiles.api_v3_qualityprofile_id_delete(
-                        id=id
-                    ),
-                )
+        qp_mapper = QualityProfileMapper(QualityProfileResource, ProfileFormatItemResource)
+        definitions.append(
+            ResourceDefinition(
+                name="quality_profiles",
+                models=(QualityProfileResource, ProfileFormatItemResource),
+                depends_on=("custom_formats",),
+                mapper=qp_mapper,
+                list_fn=lambda: client.quality_profiles.api_v3_qualityprofile_get(),
+                list_body_fn=lambda: read_body(
+                    client.quality_profiles.api_v3_qualityprofile_get_without_preload_content()
+                ),
+                create_fn=lambda model: client.quality_profiles.api_v3_qualityprofile_post(
+                    quality_profile_resource=model
+                ),
+                update_fn=lambda id, model: client.quality_profiles.api_v3_qualityprofile_id_put(
+                    id=id, quality_profile_resource=model
+                ),
+                delete_fn=lambda id: client.quality_profiles.api_v3_qualityprofile_id_delete(
+                    id=id
+                ),
             )
+        )
 
         # 5. Delay Profiles (depends on tags)
-        if instance_config.delay_profiles:
-            dp_mapper = DelayProfileMapper(DelayProfileResource)
-            definitions.append(
-                ResourceDefinition(
-                    name="delay_profiles",
-                    order=5,
-                    mapper=dp_mapper,
-                    list_fn=lambda: client.delay_profiles.api_v3_delayprofile_get(),
-                    create_fn=lambda model: client.delay_profiles.api_v3_delayprofile_post(
-                        delay_profile_resource=model
-                    ),
-                    update_fn=lambda id, model: client.delay_profiles.api_v3_delayprofile_id_put(
-                        id=id, delay_profile_resource=model
-                    ),
-                    delete_fn=lambda id: client.delay_profiles.api_v3_delayprofile_id_delete(id=id),
-                )
+        dp_mapper = DelayProfileMapper(DelayProfileResource)
+        definitions.append(
+            ResourceDefinition(
+                name="delay_profiles",
+                models=(DelayProfileResource,),
+                depends_on=("tags",),
+                mapper=dp_mapper,
+                list_fn=lambda: client.delay_profiles.api_v3_delayprofile_get(),
+                list_body_fn=lambda: read_body(
+                    client.delay_profiles.api_v3_delayprofile_get_without_preload_content()
+                ),
+                create_fn=lambda model: client.delay_profiles.api_v3_delayprofile_post(
+                    delay_profile_resource=model
+                ),
+                update_fn=lambda id, model: client.delay_profiles.api_v3_delayprofile_id_put(
+                    id=id, delay_profile_resource=model
+                ),
+                delete_fn=lambda id: client.delay_profiles.api_v3_delayprofile_id_delete(id=id),
             )
+        )
 
         # 6. Indexers (depends on tags)
-        if instance_config.indexers:
-            indexer_mapper = IndexerMapper(IndexerResource)
-            definitions.append(
-                ResourceDefinition(
-                    name="indexers",
-                    order=6,
-                    mapper=indexer_mapper,
-                    list_fn=lambda: client.indexers.api_v3_indexer_get(),
-                    create_fn=lambda model: client.indexers.api_v3_indexer_post(
-                        indexer_resource=model
-                    ),
-                    update_fn=lambda id, model: client.indexers.api_v3_indexer_id_put(
-                        id=id, indexer_resource=model
-                    ),
-                    delete_fn=lambda id: client.indexers.api_v3_indexer_id_delete(id=id),
-                )
+        indexer_mapper = IndexerMapper(IndexerResource)
+        definitions.append(
+            ResourceDefinition(
+                name="indexers",
+                models=(IndexerResource, IndexerBulkResource),
+                depends_on=("tags",),
+                mapper=indexer_mapper,
+                list_fn=lambda: client.indexers.api_v3_indexer_get(),
+                list_body_fn=lambda: read_body(
+                    client.indexers.api_v3_indexer_get_without_preload_content()
+                ),
+                create_fn=lambda model: client.indexers.api_v3_indexer_post(
+                    indexer_resource=model
+                ),
+                update_fn=lambda id, model: client.indexers.api_v3_indexer_id_put(
+                    id=id, indexer_resource=model
+                ),
+                delete_fn=lambda id: client.indexers.api_v3_indexer_id_delete(id=id),
+                bulk_delete_fn=lambda ids: client.indexers.api_v3_indexer_bulk_delete(
+                    indexer_bulk_resource=IndexerBulkResource(ids=ids)
+                ),
             )
+        )
 
         # 7. Download Clients (depends on tags)
-        if instance_config.download_clients:
-            dc_mapper = DownloadClientMapper(DownloadClientResource)
-            definitions.append(
-                ResourceDefinition(
-                    name="download_clients",
-                    order=7,
-                    mapper=dc_mapper,
-                    list_fn=lambda: client.download_clients.api_v3_downloadclient_get(),
-                    create_fn=lambda model: client.download_clients.api_v3_downloadclient_post(
-                        download_client_resource=model
-                    ),
-                    update_fn=lambda id, model: client.download_clients.api_v3_downloadclient_id_put(
-                        id=id, download_client_resource=model
-                    ),
-                    delete_fn=lambda id: client.download_clients.api_v3_downloadclient_id_delete(
-                        id=id
-                    ),
-                )
+        dc_mapper = DownloadClientMapper(DownloadClientResource)
+        definitions.append(
+            ResourceDefinition(
+                name="download_clients",
+                models=(DownloadClientResource, DownloadClientBulkResource),
+                depends_on=("tags",),
+                mapper=dc_mapper,
+                list_fn=lambda: client.download_clients.api_v3_downloadclient_get(),
+                list_body_fn=lambda: read_body(
+                    client.download_clients.api_v3_downloadclient_get_without_preload_content()
+                ),
+                create_fn=lambda model: client.download_clients.api_v3_downloadclient_post(
+                    download_client_resource=model
+                ),
+                update_fn=lambda id, model: client.download_clients.api_v3_downloadclient_id_put(
+                    id=id, download_client_resource=model
+                ),
+                delete_fn=lambda id: client.download_clients.api_v3_downloadclient_id_delete(
+                    id=id
+                ),
+                bulk_delete_fn=lambda ids: (
+                    client.download_clients.api_v3_downloadclient_bulk_delete(
+                        download_client_bulk_resource=DownloadClientBulkResource(ids=ids)
+                    )
+                ),
             )
+        )
 
         # 8. Naming Config (singleton)
-        if instance_config.naming:
-            naming_mapper = NamingConfigMapper()
-            definitions.append(
-                ResourceDefinition(
-                    name="naming",
-                    order=8,
-                    mapper=naming_mapper,
-                    list_fn=lambda: [client.naming_config.get_naming_config()],
-                    create_fn=lambda model: None,  # Singleton - no create
-                    update_fn=lambda id, model: client.naming_config.update_naming_config(
-                        id=id, naming_config_resource=model
-                    ),
-                    delete_fn=None,  # Singleton - no delete
-                    is_singleton=True,
-                )
+        naming_mapper = NamingConfigMapper()
+        definitions.append(
+            ResourceDefinition(
+                name="naming",
+                models=(NamingConfigResource,),
+                mapper=naming_mapper,
+                list_fn=lambda: [client.naming_config.get_naming_config()],
+                create_fn=lambda model: None,  # Singleton - no create
+                update_fn=lambda id, model: client.naming_config.update_naming_config(
+                    id=id, naming_config_resource=model
+                ),
+                delete_fn=None,  # Singleton - no delete
+                is_singleton=True,
             )
+        )
 
         # 9. Media Management Config (singleton)
-        if instance_config.media_management:
-            mm_mapper = MediaManagementConfigMapper()
-            definitions.append(
-                ResourceDefinition(
-                    name="media_management",
-                    order=9,
-                    mapper=mm_mapper,
-                    list_fn=lambda: [
-                        client.media_management_config.api_v3_config_mediamanagement_get()
-                    ],
-                    create_fn=lambda model: None,  # Singleton - no create
-                    update_fn=lambda id, model: client.media_management_config.api_v3_config_mediamanagement_id_put(
+        mm_mapper = MediaManagementConfigMapper()
+
+        def media_management_body() -> bytes:
+            api = client.media_management_config
+            return read_body(api.api_v3_config_mediamanagement_get_without_preload_content())
+
+        definitions.append(
+            ResourceDefinition(
+                name="media_management",
+                models=(MediaManagementConfigResource,),
+                mapper=mm_mapper,
+                list_fn=lambda: [
+                    client.media_management_config.api_v3_config_mediamanagement_get()
+                ],
+                list_body_fn=media_management_body,
+                create_fn=lambda model: None,  # Singleton - no create
+                update_fn=lambda id, model: (
+                    client.media_management_config.api_v3_config_mediamanagement_id_put(
                         id=id, media_management_config_resource=model
-                    ),
-                    delete_fn=None,  # Singleton - no delete
-                    is_singleton=True,
-                )
+                    )
+                ),
+                delete_fn=None,  # Singleton - no delete
+                is_singleton=True,
             )
+        )
+
+        if not client.supports_bulk:
+            # Bulk delete endpoints were added in Sonarr v4; v3 falls back to per-item calls
+            definitions = [replace(definition, bulk_delete_fn=None) for definition in definitions]
 
         return definitions
 
@@ -5,6 +5,7 @@ from typing import Optional
 from pydantic import BaseModel, Field, field_validator
 
 from src.shared.schemas import (
+    ConnectionConfig,
     CustomFormatsConfig,
     DelayProfilesConfig,
     DownloadClientsConfig,
@@ -60,6 +61,9 @@ class SonarrInstanceConfig(BaseModel):
     api_key: Optional[str] = Field(
         None, description="API key (can use ${ENV_VAR} or load from env)"
     )
+    connection: ConnectionConfig = Field(
+        default_factory=ConnectionConfig, description="Request timeouts and sync deadline"
+    )
 
     # Resource sections
     custom_formats: Optional[CustomFormatsConfig] = None
@@ -0,0 +1,193 @@
+"""HTTP transport for the generated Sonarr client, backed by the shared connection pools."""
+
+import json
+import socket
+import time
+from typing import Optional
+
+import urllib3
+from sonarr_api import Configuration
+from sonarr_api.rest import RESTClientObject
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import ConnectTimeoutError, HTTPError, MaxRetryError, NewConnectionError
+
+from src.core.deadline import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    current_deadline,
+    request_timeout,
+)
+from src.core.pool import get_pool_registry
+from src.core.profiling import record_http_call, recording
+from src.core.resilience import (
+    IDEMPOTENT_METHODS,
+    CircuitBreaker,
+    RetryPolicy,
+    parse_retry_after,
+    retries_enabled,
+)
+from src.core.throttle import HostThrottle
+from src.utils.logger import get_logger
+
+logger = get_logger("transport")
+
+# Keep idle pooled connections alive at the TCP level as well
+KEEPALIVE_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+]
+
+# Errors raised before a request reached the server, so sending it again is always safe
+CONNECT_ERRORS = (ConnectTimeoutError, NewConnectionError)
+
+# urllib3 only follows redirects; failed requests are retried by PooledRESTClientObject
+NO_RETRIES = urllib3.Retry(total=None, connect=0, read=0, status=0, other=0, redirect=5)
+
+
+class PooledRESTClientObject(RESTClientObject):
+    """
+    REST client that borrows its urllib3 pool manager from the process-wide registry.
+
+    Only the pool manager is shared, so all clients talking to the same host
+    reuse its open connections. Requests made without an explicit
+    `_request_timeout` get the client's default timeout, and every timeout is
+    clamped to the current deadline (requests started after it fail at once).
+
+    Transient failures are retried according to the retry policy, and requests
+    to a host whose circuit breaker is open fail without being sent. Each
+    attempt waits for the host's throttle (rate limit and adaptive concurrency
+    limit), which learns from its latency and outcome.
+    """
+
+    def __init__(
+        self,
+        configuration: Configuration,
+        timeout: Optional[float | tuple[float, float]] = (
+            DEFAULT_CONNECT_TIMEOUT,
+            DEFAULT_READ_TIMEOUT,
+        ),
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        throttle: Optional[HostThrottle] = None,
+    ) -> None:
+        self.timeout = timeout
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.throttle = throttle or HostThrottle()
+        settings = (
+            configuration.verify_ssl,
+            configuration.ssl_ca_cert,
+            configuration.cert_file,
+            configuration.key_file,
+            configuration.proxy,
+        )
+
+        def create_pool_manager(maxsize: int):
+            configuration.connection_pool_maxsize = maxsize
+            configuration.retries = NO_RETRIES
+            if configuration.socket_options is None:
+                configuration.socket_options = KEEPALIVE_SOCKET_OPTIONS
+            return RESTClientObject(configuration).pool_manager
+
+        self.pool_manager = get_pool_registry().get(
+            configuration.host, create_pool_manager, settings=settings
+        )
+
+    def request(
+        self, method, url, headers=None, body=None, post_params=None, _request_timeout=None
+    ):
+        """Perform a request, retrying transient failures while the deadline allows."""
+        timeout = self.timeout if _request_timeout is None else _request_timeout
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        retry = 0
+        while True:
+            clamped_timeout = request_timeout(timeout)
+            trial = self.circuit_breaker.before_request() if self.circuit_breaker else False
+            start = time.perf_counter()
+            try:
+                with self.throttle.request() as outcome:
+                    response = super().request(
+                        method,
+                        url,
+                        headers=headers,
+                        body=body,
+                        post_params=post_params,
+                        _request_timeout=clamped_timeout,
+                    )
+                    outcome.failed = response.status == 429 or response.status >= 500
+            except HTTPError as e:
+                self._record(method, url, body, start)
+                if self.circuit_breaker:
+                    self.circuit_breaker.record_failure()
+                error = e.reason if isinstance(e, MaxRetryError) and e.reason else e
+                # Requests that never reached the server are safe to send again
+                retryable = idempotent or isinstance(error, CONNECT_ERRORS)
+                delay = self._retry_delay(retry + 1) if retryable else None
+                if delay is None:
+                    raise
+                reason = type(error).__name__
+            else:
+                self._record(method, url, body, start, response)
+                if self.circuit_breaker:
+                    if response.status >= 500:
+                        self.circuit_breaker.record_failure()
+                    else:
+                        self.circuit_breaker.record_success()
+                if (
+                    not idempotent
+                    or self.retry_policy is None
+                    or response.status not in self.retry_policy.statuses
+                ):
+                    return response
+                retry_after = parse_retry_after(response.getheader("Retry-After"))
+                delay = self._retry_delay(retry + 1, retry_after)
+                if delay is None:
+                    return response
+                # Return the connection to the pool before waiting
+                response.response.drain_conn()
+                response.response.release_conn()
+                reason = f"HTTP {response.status}"
+            finally:
+                # A trial ended by any other error must not keep the circuit open for good
+                if trial:
+                    self.circuit_breaker.release_trial()
+
+            retry += 1
+            logger.debug(
+                f"{method} {url} failed ({reason}); retry {retry}/{self.retry_policy.attempts} "
+                f"in {delay:.2f}s"
+            )
+            time.sleep(delay)
+
+    @staticmethod
+    def _record(method, url, body, start: float, response=None) -> None:
+        """Record a request attempt with the active profiler or tracer, if any."""
+        if not recording():
+            return
+        # Read the body now (urllib3 caches it for the caller) to time and size it
+        response_bytes = len(response.read() or b"") if response is not None else 0
+        if body is None:
+            request_bytes = 0
+        elif isinstance(body, (str, bytes)):
+            request_bytes = len(body)
+        else:
+            request_bytes = len(json.dumps(body))
+        record_http_call(
+            method,
+            url,
+            response.status if response is not None else 0,
+            start,
+            request_bytes,
+            response_bytes,
+        )
+
+    def _retry_delay(self, retry: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """Get the delay before a retry, or None if the request must not be retried."""
+        policy = self.retry_policy
+        if policy is None or retry > policy.attempts or not retries_enabled():
+            return None
+        delay = policy.delay(retry, retry_after)
+        # Do not wait for a retry that could not finish before the deadline
+        deadline = current_deadline()
+        if deadline is not None and deadline.remaining() <= delay:
+            return None
+        return delay
@@ -1,7 +1,9 @@
 """Base class for resource mappers."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
+from typing import Any, ClassVar, Generic, TypeVar
+
+from src.utils.canonical import canonicalize, digest
 
 # Type variables for API models and YAML definitions
 TApiModel = TypeVar("TApiModel")
@@ -16,6 +18,9 @@ class ResourceMapper(ABC, Generic[TApiModel, TYamlDef]):
     have its own mapper that extends this class.
     """
 
+    # Fields holding lists whose order carries no meaning (compared as multisets)
+    unordered_fields: ClassVar[frozenset[str]] = frozenset()
+
     @abstractmethod
     def to_api_model(self, yaml_def: TYamlDef, **context) -> TApiModel:
         """
@@ -45,6 +50,28 @@ class ResourceMapper(ABC, Generic[TApiModel, TYamlDef]):
         """
         pass
 
+    @abstractmethod
+    def from_api_dict(self, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Convert a raw JSON resource (as returned by the server) to a dictionary.
+
+        Must produce the same representation as `from_api_model` for the same
+        resource. Used by list endpoints that skip API model construction.
+
+        Args:
+            data: Decoded JSON object (camelCase keys)
+
+        Returns:
+            Dictionary representation
+        """
+        pass
+
+    def from_api_item(self, item: dict[str, Any] | TApiModel) -> dict[str, Any]:
+        """Convert a server resource, either a raw JSON dict or an API model, to a dictionary."""
+        if isinstance(item, dict):
+            return self.from_api_dict(item)
+        return self.from_api_model(item)
+
     @abstractmethod
     def get_match_key(self, item: dict[str, Any] | TApiModel) -> str:
         """
@@ -60,11 +87,46 @@ class ResourceMapper(ABC, Generic[TApiModel, TYamlDef]):
         """
         pass
 
-    def needs_update(
+    def canonical(self, item: dict[str, Any], ignore_fields: list[str] = None) -> tuple:
+        """
+        Get the canonical form of a mapped item, as used for comparison.
+
+        Fields listed in `unordered_fields` are compared as multisets, and private
+        bookkeeping keys (prefixed with "_") are ignored.
+
+        Args:
+            item: Mapped item (from `from_api_model`)
+            ignore_fields: Fields to leave out (default: 'id')
+
+        Returns:
+            Hashable canonical representation of the item
+        """
+        ignore_fields = ignore_fields or ["id"]
+        return tuple(
+            sorted(
+                (key, canonicalize(value, key in self.unordered_fields))
+                for key, value in item.items()
+                if key not in ignore_fields and not key.startswith("_")
+            )
+        )
+
+    def digest(self, item: dict[str, Any]) -> str:
+        """
+        Get a digest of a mapped item's canonical form.
+
+        Items with equal digests never need an update, so a diff only has to
+        descend into field-level comparison when digests differ.
+        """
+        return digest(self.canonical(item))
+
+    def diff_fields(
         self, current: dict[str, Any], desired: dict[str, Any], ignore_fields: list[str] = None
-    ) -> bool:
+    ) -> list[str]:
         """
-        Compare current and desired state to determine if an update is needed.
+        List the fields whose desired value differs from the current one.
+
+        Nested dicts only compare the keys present in the desired value, so
+        server-side extras (e.g. additional implementation fields) are ignored.
 
         Args:
             current: Current state (from server)
@@ -72,49 +134,67 @@ class ResourceMapper(ABC, Generic[TApiModel, TYamlDef]):
             ignore_fields: Fields to ignore in comparison (e.g., 'id', 'updated_at')
 
         Returns:
-            True if update is needed
+            Names of differing fields, in desired-dict order
         """
         ignore_fields = ignore_fields or ["id"]
+        changed = []
 
         for key, desired_value in desired.items():
-            if key in ignore_fields:
+            if key in ignore_fields or key.startswith("_"):
                 continue
 
             current_value = current.get(key)
+            unordered = key in self.unordered_fields
 
             # Handle nested comparisons
             if isinstance(desired_value, dict) and isinstance(current_value, dict):
                 if self._dict_differs(current_value, desired_value, ignore_fields):
-                    return True
-            elif isinstance(desired_value, list) and isinstance(current_value, list):
-                if self._list_differs(current_value, desired_value):
-                    return True
-            elif current_value != desired_value:
-                return True
+                    changed.append(key)
+            elif canonicalize(current_value, unordered) != canonicalize(desired_value, unordered):
+                changed.append(key)
 
-        return False
+        return changed
+
+    def needs_update(
+        self, current: dict[str, Any], desired: dict[str, Any], ignore_fields: list[str] = None
+    ) -> bool:
+        """
+        Compare current and desired state to determine if an update is needed.
+
+        Args:
+            current: Current state (from server)
+            desired: Desired state (from YAML)
+            ignore_fields: Fields to ignore in comparison (e.g., 'id', 'updated_at')
+
+        Returns:
+            True if update is needed
+        """
+        return bool(self.diff_fields(current, desired, ignore_fields))
 
     def _dict_differs(
         self, current: dict, desired: dict, ignore_fields: list[str] = None
     ) -> bool:
-        """Check if two dicts differ."""
+        """Check if any desired key of a nested dict differs from the current value."""
         ignore_fields = ignore_fields or []
         for key, val in desired.items():
             if key in ignore_fields:
                 continue
-            if key not in current or current[key] != val:
+            if key not in current or canonicalize(current[key]) != canonicalize(val):
                 return True
         return False
 
-    def _list_differs(self, current: list, desired: list) -> bool:
-        """Check if two lists differ (order-independent for lists of dicts)."""
-        if len(current) != len(desired):
-            return True
-
-        # For simple lists (strings, numbers)
-        if current and not isinstance(current[0], (dict, list)):
-            return sorted(current) != sorted(desired)
-
-        # For lists of dicts, compare as sets
-        # This is a simplified comparison; override if needed
-        return current != desired
+    @staticmethod
+    def fields_to_api(fields: dict[str, Any]) -> list[dict[str, Any]]:
+        """Convert a YAML `fields` mapping into the API's list of name/value fields."""
+        return [{"name": name, "value": value} for name, value in (fields or {}).items()]
+
+    @staticmethod
+    def fields_from_api(fields: list[Any] | None) -> dict[str, Any]:
+        """Convert the API's list of name/value fields into a name -> value mapping."""
+        result = {}
+        for field in fields or []:
+            if isinstance(field, dict):
+                result[field.get("name")] = field.get("value")
+            else:
+                result[field.name] = field.value
+        return result
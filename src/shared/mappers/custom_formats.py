@@ -20,6 +20,9 @@ class CustomFormatMapper(
     Parameterized by API model types to support both Sonarr and Radarr.
     """
 
+    # Specification order has no meaning to the server
+    unordered_fields = frozenset({"specifications"})
+
     def __init__(
         self,
         format_model_class: type[TCustomFormatModel],
@@ -43,7 +46,7 @@ class CustomFormatMapper(
                 implementation=spec.implementation,
                 negate=spec.negate,
                 required=spec.required,
-                fields=spec.fields,
+                fields=self.fields_to_api(spec.fields),
             )
             for spec in yaml_def.specifications
         ]
@@ -66,12 +69,30 @@ class CustomFormatMapper(
                     "implementation": spec.implementation,
                     "negate": spec.negate,
                     "required": spec.required,
-                    "fields": spec.fields,
+                    "fields": self.fields_from_api(spec.fields),
                 }
                 for spec in (api_model.specifications or [])
             ],
         }
 
+    def from_api_dict(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Convert raw JSON to dict for comparison."""
+        return {
+            "id": data.get("id"),
+            "name": data.get("name"),
+            "include_custom_format_when_renaming": data.get("includeCustomFormatWhenRenaming"),
+            "specifications": [
+                {
+                    "name": spec.get("name"),
+                    "implementation": spec.get("implementation"),
+                    "negate": spec.get("negate"),
+                    "required": spec.get("required"),
+                    "fields": self.fields_from_api(spec.get("fields")),
+                }
+                for spec in (data.get("specifications") or [])
+            ],
+        }
+
     def get_match_key(self, item: dict[str, Any] | TCustomFormatModel) -> str:
         """Get the name field for matching."""
         if isinstance(item, dict):
@@ -70,6 +70,18 @@ class DelayProfileMapper(
             "order": api_model.order,
         }
 
+    def from_api_dict(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Convert raw JSON to dict for comparison."""
+        return {
+            "id": data.get("id"),
+            "preferred_protocol": data.get("preferredProtocol"),
+            "usenet_delay": data.get("usenetDelay"),
+            "torrent_delay": data.get("torrentDelay"),
+            "bypass_if_highest_quality": data.get("bypassIfHighestQuality"),
+            "tags": data.get("tags") or [],
+            "order": data.get("order"),
+        }
+
     def get_match_key(self, item: dict[str, Any] | TDelayProfileModel) -> str:
         """
         Delay profiles don't have names, so we match by tag combination.
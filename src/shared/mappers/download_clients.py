@@ -47,7 +47,7 @@ class DownloadClientMapper(
             remove_completed_downloads=yaml_def.remove_completed_downloads,
             remove_failed_downloads=yaml_def.remove_failed_downloads,
             tags=tag_ids,
-            fields=yaml_def.fields,
+            fields=self.fields_to_api(yaml_def.fields),
         )
 
     def from_api_model(self, api_model: TDownloadClientModel) -> dict[str, Any]:
@@ -61,7 +61,21 @@ class DownloadClientMapper(
             "remove_completed_downloads": api_model.remove_completed_downloads,
             "remove_failed_downloads": api_model.remove_failed_downloads,
             "tags": api_model.tags or [],
-            "fields": api_model.fields,
+            "fields": self.fields_from_api(api_model.fields),
+        }
+
+    def from_api_dict(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Convert raw JSON to dict for comparison."""
+        return {
+            "id": data.get("id"),
+            "name": data.get("name"),
+            "implementation": data.get("implementation"),
+            "enable": data.get("enable"),
+            "priority": data.get("priority"),
+            "remove_completed_downloads": data.get("removeCompletedDownloads"),
+            "remove_failed_downloads": data.get("removeFailedDownloads"),
+            "tags": data.get("tags") or [],
+            "fields": self.fields_from_api(data.get("fields")),
         }
 
     def get_match_key(self, item: dict[str, Any] | TDownloadClientModel) -> str:
@@ -46,7 +46,7 @@ class IndexerMapper(ResourceMapper[TIndexerModel, IndexerDef], Generic[TIndexerM
             priority=yaml_def.priority,
             download_client_id=yaml_def.download_client_id,
             tags=tag_ids,
-            fields=yaml_def.fields,
+            fields=self.fields_to_api(yaml_def.fields),
         )
 
     def from_api_model(self, api_model: TIndexerModel) -> dict[str, Any]:
@@ -61,7 +61,22 @@ class IndexerMapper(ResourceMapper[TIndexerModel, IndexerDef], Generic[TIndexerM
             "priority": api_model.priority,
             "download_client_id": api_model.download_client_id,
             "tags": api_model.tags or [],
-            "fields": api_model.fields,
+            "fields": self.fields_from_api(api_model.fields),
+        }
+
+    def from_api_dict(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Convert raw JSON to dict for comparison."""
+        return {
+            "id": data.get("id"),
+            "name": data.get("name"),
+            "implementation": data.get("implementation"),
+            "enable_rss": data.get("enableRss"),
+            "enable_automatic_search": data.get("enableAutomaticSearch"),
+            "enable_interactive_search": data.get("enableInteractiveSearch"),
+            "priority": data.get("priority"),
+            "download_client_id": data.get("downloadClientId"),
+            "tags": data.get("tags") or [],
+            "fields": self.fields_from_api(data.get("fields")),
         }
 
     def get_match_key(self, item: dict[str, Any] | TIndexerModel) -> str:
@@ -66,6 +66,17 @@ class QualityDefinitionMapper(
             "weight": api_model.weight,
         }
 
+    def from_api_dict(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Convert raw JSON to dict for comparison."""
+        return {
+            "id": data.get("id"),
+            "title": data.get("title"),
+            "min_size": data.get("minSize"),
+            "max_size": data.get("maxSize"),
+            "preferred_size": data.get("preferredSize"),
+            "weight": data.get("weight"),
+        }
+
     def get_match_key(self, item: dict[str, Any] | TQualityDefinitionModel) -> str:
         """Get the title field for matching."""
         if isinstance(item, dict):
@@ -20,6 +20,9 @@ class QualityProfileMapper(
     Parameterized by API model types to support both Sonarr and Radarr.
     """
 
+    # Format scores are keyed by format ID; their order carries no meaning
+    unordered_fields = frozenset({"format_items"})
+
     def __init__(
         self,
         profile_model_class: type[TQualityProfileModel],
@@ -81,6 +84,23 @@ class QualityProfileMapper(
             ],
         }
 
+    def from_api_dict(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Convert raw JSON to dict for comparison."""
+        return {
+            "id": data.get("id"),
+            "name": data.get("name"),
+            "upgrade_allowed": data.get("upgradeAllowed"),
+            "cutoff": data.get("cutoff"),
+            "items": data.get("items"),
+            "min_format_score": data.get("minFormatScore"),
+            "cutoff_format_score": data.get("cutoffFormatScore"),
+            "min_upgrade_format_score": data.get("minUpgradeFormatScore"),
+            "format_items": [
+                {"format": item.get("format"), "score": item.get("score")}
+                for item in (data.get("formatItems") or [])
+            ],
+        }
+
     def get_match_key(self, item: dict[str, Any] | TQualityProfileModel) -> str:
         """Get the name field for matching."""
         if isinstance(item, dict):
@@ -40,6 +40,13 @@ class TagMapper(ResourceMapper[TTagModel, str], Generic[TTagModel]):
             "label": api_model.label,
         }
 
+    def from_api_dict(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Convert raw JSON to dict for comparison."""
+        return {
+            "id": data.get("id"),
+            "label": data.get("label"),
+        }
+
     def get_match_key(self, item: dict[str, Any] | TTagModel) -> str:
         """Get the label field for matching."""
         if isinstance(item, dict):
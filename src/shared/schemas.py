@@ -4,6 +4,8 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
+from src.core.deadline import DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT
+
 
 # ============================================================================
 # Custom Formats
@@ -32,6 +34,7 @@ class CustomFormatsConfig(BaseModel):
     """Custom formats section configuration."""
 
     delete_unmanaged: bool = False
+    concurrency: int = Field(default=1, ge=1)  # Max parallel API writes for this section
     definitions: list[CustomFormatDef] = Field(default_factory=list)
 
 
@@ -59,6 +62,7 @@ class QualityProfilesConfig(BaseModel):
     """Quality profiles section configuration."""
 
     delete_unmanaged: bool = False
+    concurrency: int = Field(default=1, ge=1)  # Max parallel API writes for this section
     definitions: list[QualityProfileDef] = Field(default_factory=list)
 
 
@@ -79,6 +83,7 @@ class QualityDefinitionDef(BaseModel):
 class QualityDefinitionsConfig(BaseModel):
     """Quality definitions section configuration."""
 
+    concurrency: int = Field(default=1, ge=1)  # Max parallel API writes for this section
     definitions: list[QualityDefinitionDef] = Field(default_factory=list)
 
 
@@ -91,6 +96,7 @@ class TagsConfig(BaseModel):
     """Tags section configuration."""
 
     delete_unmanaged: bool = False
+    concurrency: int = Field(default=1, ge=1)  # Max parallel API writes for this section
     definitions: list[str] = Field(default_factory=list)  # Simple list of tag names
 
 
@@ -114,6 +120,7 @@ class DelayProfilesConfig(BaseModel):
     """Delay profiles section configuration."""
 
     delete_unmanaged: bool = False
+    concurrency: int = Field(default=1, ge=1)  # Max parallel API writes for this section
     definitions: list[DelayProfileDef] = Field(default_factory=list)
 
 
@@ -140,6 +147,7 @@ class IndexersConfig(BaseModel):
     """Indexers section configuration."""
 
     delete_unmanaged: bool = False
+    concurrency: int = Field(default=1, ge=1)  # Max parallel API writes for this section
     definitions: list[IndexerDef] = Field(default_factory=list)
 
 
@@ -165,4 +173,26 @@ class DownloadClientsConfig(BaseModel):
     """Download clients section configuration."""
 
     delete_unmanaged: bool = False
+    concurrency: int = Field(default=1, ge=1)  # Max parallel API writes for this section
     definitions: list[DownloadClientDef] = Field(default_factory=list)
+
+
+# ============================================================================
+# Connection
+# ============================================================================
+
+
+class ConnectionConfig(BaseModel):
+    """HTTP connection settings of an instance."""
+
+    connect_timeout: float = Field(default=DEFAULT_CONNECT_TIMEOUT, gt=0)  # Seconds to connect
+    read_timeout: float = Field(default=DEFAULT_READ_TIMEOUT, gt=0)  # Seconds to wait for an answer
+    deadline: Optional[float] = Field(default=None, gt=0)  # Max seconds for the whole instance sync
+    retries: int = Field(default=3, ge=0)  # Retries of a failed request (0 disables them)
+    retry_backoff: float = Field(default=0.5, ge=0)  # Seconds before the first retry (doubles)
+    circuit_breaker_threshold: int = Field(default=5, ge=1)  # Consecutive failures pausing a host
+    circuit_breaker_reset: float = Field(default=30.0, gt=0)  # Seconds a host stays paused
+    rate_limit: Optional[float] = Field(default=None, gt=0)  # Max requests per second to the host
+    rate_burst: int = Field(default=5, ge=1)  # Requests sent at once before rate limiting applies
+    adaptive_concurrency: bool = True  # Adapt in-flight requests to the host's latency
+    max_concurrency: int = Field(default=8, ge=1)  # Upper bound of in-flight requests to the host
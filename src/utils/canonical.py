@@ -0,0 +1,60 @@
+"""Canonical, order-insensitive representations of resource data for fast comparison."""
+
+import hashlib
+from enum import Enum
+from typing import Any
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def canonicalize(value: Any, unordered: bool = False) -> Any:
+    """
+    Convert a value into a hashable canonical form.
+
+    - dicts become tuples of (key, value) pairs sorted by key; keys whose value is
+      None are dropped, so a null field and a missing one compare equal (raw server
+      JSON carries nulls that serialized API models omit)
+    - enum members become their values
+    - lists of scalars are sorted (their order never matters for comparison)
+    - lists of containers keep their order unless `unordered` is set, in which
+      case they are compared as multisets
+    - API model objects are converted through their `to_dict()`
+
+    Args:
+        value: Value to canonicalize
+        unordered: Treat a list of containers as unordered
+
+    Returns:
+        Nested tuples/scalars; two values are equivalent iff their canonical forms are equal
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, _SCALARS):
+        return value
+    if isinstance(value, dict):
+        return tuple(
+            sorted((str(key), canonicalize(val)) for key, val in value.items() if val is not None)
+        )
+    if isinstance(value, (list, tuple)):
+        items = [canonicalize(item) for item in value]
+        if unordered or all(isinstance(item, _SCALARS) for item in items):
+            items.sort(key=repr)
+        return ("__list__", tuple(items))
+    if hasattr(value, "to_dict"):
+        return canonicalize(value.to_dict())
+    return repr(value)
+
+
+def digest(canonical: Any) -> str:
+    """
+    Hash a canonical form produced by `canonicalize()`.
+
+    Equal digests imply equal canonical forms (barring hash collisions).
+
+    Args:
+        canonical: Canonical form to hash
+
+    Returns:
+        Hex-encoded 128-bit BLAKE2b digest
+    """
+    return hashlib.blake2b(repr(canonical).encode("utf-8"), digest_size=16).hexdigest()
@@ -3,7 +3,7 @@
 import os
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from dotenv import load_dotenv
 
@@ -15,27 +15,103 @@ def load_environment() -> None:
         load_dotenv(env_file)
 
 
-def interpolate_env_vars(value: str) -> str:
+# Matches ${VAR_NAME} or $VAR_NAME
+ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)")
+
+
+def _is_plain(value: Any) -> bool:
+    """Whether a config value cannot contain an env var reference (no call needed)."""
+    cls = type(value)
+    return (cls is str and "$" not in value) or cls in (int, float, bool, type(None))
+
+
+def env_var_reference(value: Any) -> Optional[str]:
     """
-    Replace ${VAR_NAME} or $VAR_NAME patterns in a string with environment variable values.
+    Get the name of the env var a config value consists of, or None.
 
     Args:
-        value: String potentially containing env var references
+        value: Config value as written (e.g., "${SONARR_API_KEY}" or "$SONARR_API_KEY")
 
     Returns:
-        String with all env vars resolved
+        Name of the referenced env var, or None if the value is anything else
+    """
+    match = ENV_VAR_PATTERN.fullmatch(value) if isinstance(value, str) else None
+    return (match.group(1) or match.group(2)) if match else None
 
-    Raises:
-        ValueError: If a referenced env var doesn't exist
+
+class EnvInterpolator:
     """
-    if not isinstance(value, str):
-        return value
+    Interpolates env var references throughout a loaded config in a single pass.
 
-    # Pattern matches ${VAR_NAME} or $VAR_NAME
-    pattern = r"\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)"
+    Only strings containing a `$` are scanned, and each distinct string is
+    interpolated once. Containers without any reference are returned as they
+    are instead of being copied, and containers appearing several times (e.g.,
+    a file included by many instances) are processed once. The result may
+    therefore share structures with the input; neither must be modified.
 
-    def replacer(match):
+    The names of all referenced env vars are collected in `referenced`.
+    """
+
+    def __init__(self):
+        self.referenced: set[str] = set()
+        self._strings: dict[str, str] = {}
+        self._containers: dict[int, Any] = {}
+
+    def interpolate(self, obj: Any) -> Any:
+        """
+        Replace env var references in every string value of a config object.
+
+        Args:
+            obj: Config object (dict, list, str, or primitive)
+
+        Returns:
+            Config object with all env vars resolved
+
+        Raises:
+            ValueError: If a referenced env var doesn't exist
+        """
+        if isinstance(obj, str):
+            if "$" not in obj:
+                return obj
+            result = self._strings.get(obj)
+            if result is None:
+                result = self._strings[obj] = ENV_VAR_PATTERN.sub(self._replace, obj)
+            return result
+        if not isinstance(obj, (dict, list)):
+            return obj
+
+        # Keep the input alive with its result, so its id cannot be reused during the pass
+        cached = self._containers.get(id(obj))
+        if cached is not None:
+            return cached[1]
+
+        if isinstance(obj, dict):
+            result = obj
+            for key, value in obj.items():
+                if _is_plain(value):
+                    continue
+                new_value = self.interpolate(value)
+                if new_value is not value:
+                    if result is obj:
+                        result = dict(obj)
+                    result[key] = new_value
+        else:
+            result = obj
+            for index, item in enumerate(obj):
+                if _is_plain(item):
+                    continue
+                new_item = self.interpolate(item)
+                if new_item is not item:
+                    if result is obj:
+                        result = list(obj)
+                    result[index] = new_item
+        self._containers[id(obj)] = (obj, result)
+        return result
+
+    def _replace(self, match: re.Match) -> str:
+        """Resolve one env var reference."""
         var_name = match.group(1) or match.group(2)
+        self.referenced.add(var_name)
         env_value = os.getenv(var_name)
         if env_value is None:
             raise ValueError(
@@ -43,8 +119,6 @@ def interpolate_env_vars(value: str) -> str:
             )
         return env_value
 
-    return re.sub(pattern, replacer, value)
-
 
 def get_env_var(key: str, default: Optional[str] = None, required: bool = False) -> Optional[str]:
     """
@@ -67,6 +141,11 @@ def get_env_var(key: str, default: Optional[str] = None, required: bool = False)
     return value
 
 
+def instance_env_var(prefix: str, instance_name: str, setting: str) -> str:
+    """Get the name of the env var of an instance setting (e.g., SONARR_MAIN_API_KEY)."""
+    return f"{prefix}_{instance_name.upper().replace('-', '_')}_{setting}"
+
+
 def get_instance_config(prefix: str, instance_name: str) -> dict[str, str]:
     """
     Get configuration for a specific instance from environment variables.
@@ -85,11 +164,7 @@ def get_instance_config(prefix: str, instance_name: str) -> dict[str, str]:
     Raises:
         ValueError: If required variables are missing
     """
-    instance_upper = instance_name.upper().replace("-", "_")
-    url_key = f"{prefix}_{instance_upper}_URL"
-    api_key_key = f"{prefix}_{instance_upper}_API_KEY"
-
-    base_url = get_env_var(url_key, required=True)
-    api_key = get_env_var(api_key_key, required=True)
+    base_url = get_env_var(instance_env_var(prefix, instance_name, "URL"), required=True)
+    api_key = get_env_var(instance_env_var(prefix, instance_name, "API_KEY"), required=True)
 
     return {"base_url": base_url, "api_key": api_key}
@@ -2,7 +2,16 @@
 
 import logging
 import sys
-from typing import Optional
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# Records captured by the innermost active `buffered_logs()` block (None = emit directly)
+_log_buffer: ContextVar[Optional[list[logging.LogRecord]]] = ContextVar(
+    "adm_log_buffer", default=None
+)
+_flush_lock = threading.Lock()
 
 
 class ColoredFormatter(logging.Formatter):
@@ -34,6 +43,17 @@ class ColoredFormatter(logging.Formatter):
         return formatted
 
 
+class BufferingFilter(logging.Filter):
+    """Divert records into the active log buffer instead of emitting them immediately."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        buffer = _log_buffer.get()
+        if buffer is None:
+            return True
+        buffer.append(record)
+        return False
+
+
 def setup_logger(name: str = "adm", level: str = "INFO", verbose: bool = False) -> logging.Logger:
     """
     Configure and return a logger instance.
@@ -66,6 +86,7 @@ def setup_logger(name: str = "adm", level: str = "INFO", verbose: bool = False)
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     console_handler.setFormatter(formatter)
+    console_handler.addFilter(BufferingFilter())
 
     logger.addHandler(console_handler)
 
@@ -88,3 +109,67 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     if name:
         return logging.getLogger(f"adm.{name}")
     return logging.getLogger("adm")
+
+
+@contextmanager
+def captured_logs() -> Iterator[list[logging.LogRecord]]:
+    """
+    Capture log records emitted in the current context without emitting them.
+
+    The caller decides when to write the records out via `flush_records()`, which
+    lets concurrent tasks be reported in a deterministic order.
+
+    Yields:
+        The list collecting the captured records
+    """
+    records: list[logging.LogRecord] = []
+    token = _log_buffer.set(records)
+    try:
+        yield records
+    finally:
+        _log_buffer.reset(token)
+
+
+@contextmanager
+def buffered_logs(name: str = "adm") -> Iterator[list[logging.LogRecord]]:
+    """
+    Capture log records emitted in the current context and write them out as one block.
+
+    Used when several instances sync concurrently so each instance's output stays
+    contiguous. Buffers nest: an inner block is appended to the enclosing buffer
+    instead of being emitted.
+
+    Args:
+        name: Logger whose handlers receive the buffered records on flush
+
+    Yields:
+        The list collecting the buffered records
+    """
+    records: list[logging.LogRecord] = []
+    try:
+        with captured_logs() as records:
+            yield records
+    finally:
+        flush_records(records, name)
+
+
+def flush_records(records: list[logging.LogRecord], name: str = "adm") -> None:
+    """
+    Emit previously buffered log records without interleaving with other flushes.
+
+    If a log buffer is active in the current context, the records are appended to
+    it instead, so they are emitted together with the enclosing block.
+
+    Args:
+        records: Buffered log records
+        name: Logger whose handlers should emit the records
+    """
+    parent = _log_buffer.get()
+    if parent is not None:
+        parent.extend(records)
+        return
+
+    logger = logging.getLogger(name)
+    with _flush_lock:
+        for record in records:
+            logger.handle(record)
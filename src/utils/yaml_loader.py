@@ -1,30 +1,167 @@
 """Custom YAML loader with support for !include directive."""
 
-import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import yaml
 
-from src.utils.env import interpolate_env_vars
+from src.utils.env import EnvInterpolator
 
 
-class IncludeLoader(yaml.SafeLoader):
-    """YAML loader with !include tag support."""
+class IncludeCycleError(ValueError):
+    """Raised when a YAML file includes itself, directly or through other files."""
 
-    def __init__(self, stream):
-        """Initialize loader with the file path for resolving relative includes."""
+
+class IncludeGraph:
+    """
+    Include dependencies between the files of a config, recorded while loading it.
+
+    All paths are resolved. Features reacting to config changes (watch mode,
+    the config cache) can ask which files a config consists of and which
+    files are affected by a change to one of them.
+    """
+
+    def __init__(self):
+        self._edges: dict[Path, list[Path]] = {}
+
+    def add_file(self, path: Path) -> None:
+        """Add a file (e.g., the root config) without any includes yet."""
+        self._edges.setdefault(path, [])
+
+    def add(self, parent: Path, child: Path) -> None:
+        """Record that `parent` includes `child`."""
+        children = self._edges.setdefault(parent, [])
+        if child not in children:
+            children.append(child)
+        self._edges.setdefault(child, [])
+
+    def files(self) -> list[Path]:
+        """Get every file of the config, in the order they were first seen."""
+        return list(self._edges)
+
+    def includes(self, path: Path) -> list[Path]:
+        """Get the files directly included by a file."""
+        return list(self._edges.get(path, []))
+
+    def dependents(self, path: Path) -> set[Path]:
+        """
+        Get the files that include a file, directly or through other files.
+
+        Args:
+            path: Resolved path of an included file
+
+        Returns:
+            Every file whose loaded content depends on `path`
+        """
+        parents: dict[Path, set[Path]] = {}
+        for parent, children in self._edges.items():
+            for child in children:
+                parents.setdefault(child, set()).add(parent)
+
+        found: set[Path] = set()
+        pending = [path]
+        while pending:
+            for parent in parents.get(pending.pop(), ()):
+                if parent not in found:
+                    found.add(parent)
+                    pending.append(parent)
+        return found
+
+    def find_cycle(self) -> Optional[list[Path]]:
+        """
+        Find an include cycle.
+
+        Returns:
+            Files forming a cycle, starting and ending with the same file, or
+            None if there is none
+        """
+        done: set[Path] = set()
+        stack: list[Path] = []
+
+        def visit(path: Path) -> Optional[list[Path]]:
+            if path in stack:
+                return stack[stack.index(path):] + [path]
+            if path in done:
+                return None
+            stack.append(path)
+            for child in self._edges.get(path, []):
+                cycle = visit(child)
+                if cycle:
+                    return cycle
+            stack.pop()
+            done.add(path)
+            return None
+
+        for path in self._edges:
+            cycle = visit(path)
+            if cycle:
+                return cycle
+        return None
+
+
+class _IncludeState:
+    """
+    State shared by the loaders of one config load.
+
+    Every included file is parsed once per load (keyed by resolved path and
+    modification time), and all references to it share the parsed data.
+    That data must be treated as read-only; env var interpolation copies
+    only the containers it changes.
+    """
+
+    def __init__(self, graph: IncludeGraph):
+        self.graph = graph
+        self.cache: dict[tuple[Path, int], Any] = {}
+        # Files currently being loaded, outermost first
+        self.stack: list[Path] = []
+
+
+class _IncludeLoaderMixin:
+    """!include support shared by the pure-Python and libyaml-based loaders."""
+
+    def __init__(self, stream, state: Optional[_IncludeState] = None):
+        """
+        Initialize loader with the file path for resolving relative includes.
+
+        Args:
+            stream: Open YAML file (or string)
+            state: Include cache and graph shared with the loaders of included files
+        """
+        self._path = Path(stream.name).resolve() if hasattr(stream, "name") else None
         self._root = Path(stream.name).parent if hasattr(stream, "name") else Path.cwd()
+        self._state = state or _IncludeState(IncludeGraph())
         super().__init__(stream)
 
 
-def include_constructor(loader: IncludeLoader, node: yaml.Node) -> Any:
+class PyIncludeLoader(_IncludeLoaderMixin, yaml.SafeLoader):
+    """YAML loader with !include tag support, built on the pure-Python parser."""
+
+
+if yaml.__with_libyaml__:
+
+    class CIncludeLoader(_IncludeLoaderMixin, yaml.CSafeLoader):
+        """YAML loader with !include tag support, built on the libyaml parser."""
+
+    # Same constructors and resolver as the pure-Python loader; only parsing is
+    # done in C, which is several times faster on large configs
+    IncludeLoader = CIncludeLoader
+else:
+    CIncludeLoader = None
+    IncludeLoader = PyIncludeLoader
+
+
+def include_constructor(loader: _IncludeLoaderMixin, node: yaml.Node) -> Any:
     """
     Handle !include tag in YAML files.
 
     Supports:
     - !include path/to/file.yaml  (loads and merges the file)
     - Relative paths are resolved from the parent YAML file's directory
+    - A file included several times is parsed once per load
+
+    Raises:
+        FileNotFoundError: If the included file doesn't exist
+        IncludeCycleError: If the file (indirectly) includes itself
     """
     include_path = loader.construct_scalar(node)
 
@@ -34,20 +171,60 @@ def include_constructor(loader: IncludeLoader, node: yaml.Node) -> Any:
     if not full_path.exists():
         raise FileNotFoundError(f"Included file not found: {full_path}")
 
-    with open(full_path, "r") as include_file:
-        return yaml.load(include_file, IncludeLoader)
+    state = loader._state
+    resolved = full_path.resolve()
+    if resolved in state.stack:
+        chain = state.stack[state.stack.index(resolved):] + [resolved]
+        raise IncludeCycleError(f"Include cycle: {' -> '.join(str(path) for path in chain)}")
+    if loader._path is not None:
+        state.graph.add(loader._path, resolved)
+    else:
+        state.graph.add_file(resolved)
+
+    key = (resolved, full_path.stat().st_mtime_ns)
+    if key not in state.cache:
+        state.stack.append(resolved)
+        try:
+            with open(full_path, "r") as include_file:
+                include_loader = type(loader)(include_file, state)
+                try:
+                    state.cache[key] = include_loader.get_single_data()
+                finally:
+                    include_loader.dispose()
+        finally:
+            state.stack.pop()
+    return state.cache[key]
 
 
 # Register the !include constructor
-IncludeLoader.add_constructor("!include", include_constructor)
+PyIncludeLoader.add_constructor("!include", include_constructor)
+if CIncludeLoader is not None:
+    CIncludeLoader.add_constructor("!include", include_constructor)
 
 
-def load_yaml_config(config_path: Path | str) -> dict:
+def load_yaml_config(
+    config_path: Path | str,
+    included_files: Optional[list[Path]] = None,
+    include_graph: Optional[IncludeGraph] = None,
+    loader_class: Optional[type] = None,
+    env_vars: Optional[set[str]] = None,
+    interpolate: bool = True,
+) -> dict:
     """
     Load a YAML config file with !include support and env var interpolation.
 
+    Parsing uses libyaml when PyYAML was built with it, and the pure-Python
+    parser otherwise.
+
     Args:
         config_path: Path to the YAML config file
+        included_files: List to which the (resolved) path of every included file
+            is appended, once per file
+        include_graph: Empty graph in which the include dependencies are recorded
+        loader_class: Loader to use instead of the fastest available one (e.g.,
+            PyIncludeLoader)
+        env_vars: Set to which the name of every referenced env var is added
+        interpolate: Resolve env var references (False keeps them as written)
 
     Returns:
         Parsed config dictionary
@@ -55,6 +232,7 @@ def load_yaml_config(config_path: Path | str) -> dict:
     Raises:
         FileNotFoundError: If config file doesn't exist
         yaml.YAMLError: If YAML parsing fails
+        IncludeCycleError: If files include each other in a cycle
         ValueError: If referenced env vars don't exist
     """
     config_path = Path(config_path)
@@ -62,31 +240,32 @@ def load_yaml_config(config_path: Path | str) -> dict:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path, "r") as f:
-        raw_config = yaml.load(f, IncludeLoader)
+    graph = include_graph if include_graph is not None else IncludeGraph()
+    root = config_path.resolve()
+    graph.add_file(root)
+    state = _IncludeState(graph)
+    state.stack.append(root)
 
-    # Recursively interpolate env vars in the loaded config
-    return _interpolate_recursive(raw_config)
+    with open(config_path, "r") as f:
+        loader = (loader_class or IncludeLoader)(f, state)
+        try:
+            raw_config = loader.get_single_data()
+        finally:
+            loader.dispose()
 
+    if included_files is not None:
+        included_files.extend(path for path in graph.files() if path != root)
 
-def _interpolate_recursive(obj: Any) -> Any:
-    """
-    Recursively traverse a config object and interpolate env vars in all strings.
+    if not interpolate:
+        return raw_config
 
-    Args:
-        obj: Config object (dict, list, str, or primitive)
-
-    Returns:
-        Config object with all env vars interpolated
-    """
-    if isinstance(obj, dict):
-        return {key: _interpolate_recursive(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [_interpolate_recursive(item) for item in obj]
-    elif isinstance(obj, str):
-        return interpolate_env_vars(obj)
-    else:
-        return obj
+    # Interpolate env vars throughout the loaded config
+    interpolator = EnvInterpolator()
+    try:
+        return interpolator.interpolate(raw_config)
+    finally:
+        if env_vars is not None:
+            env_vars.update(interpolator.referenced)
 
 
 def save_yaml_config(config: dict, output_path: Path | str) -> None:
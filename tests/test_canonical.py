@@ -0,0 +1,99 @@
+"""Canonical forms and digests used to skip unchanged resources without a field-by-field diff."""
+
+from enum import Enum
+
+from src.core.diff import compute_diff
+from src.shared.mappers.custom_formats import CustomFormatMapper
+from src.utils.canonical import canonicalize, digest
+
+
+class Protocol(Enum):
+    USENET = "usenet"
+
+
+class ApiModel:
+    """Object exposing `to_dict()` like the generated API models."""
+
+    def __init__(self, **values):
+        self.values = values
+
+    def to_dict(self):
+        return dict(self.values)
+
+
+def _equivalent(a, b, unordered: bool = False) -> bool:
+    return digest(canonicalize(a, unordered)) == digest(canonicalize(b, unordered))
+
+
+def test_dict_key_order_does_not_matter():
+    assert _equivalent({"a": 1, "b": {"c": 2, "d": 3}}, {"b": {"d": 3, "c": 2}, "a": 1})
+
+
+def test_null_and_missing_fields_are_equivalent():
+    assert _equivalent({"name": "x", "infoLink": None}, {"name": "x"})
+    assert not _equivalent({"name": "x", "value": 0}, {"name": "x"})
+
+
+def test_scalar_lists_are_unordered():
+    assert _equivalent({"tags": [3, 1, 2]}, {"tags": [1, 2, 3]})
+    assert not _equivalent({"tags": [1, 1, 2]}, {"tags": [1, 2]})
+
+
+def test_lists_of_containers_keep_their_order_unless_unordered():
+    first, second = {"name": "a"}, {"name": "b"}
+
+    assert not _equivalent([first, second], [second, first])
+    assert _equivalent([first, second], [second, first], unordered=True)
+    assert not _equivalent([first, first], [first, second], unordered=True)
+
+
+def test_lists_and_tuples_are_equivalent():
+    assert _equivalent({"items": [1, 2]}, {"items": (2, 1)})
+
+
+def test_enums_and_models_compare_by_value():
+    assert _equivalent({"protocol": Protocol.USENET}, {"protocol": "usenet"})
+    assert _equivalent(ApiModel(name="x", id=None), {"name": "x"})
+
+
+def test_types_are_not_conflated():
+    assert not _equivalent({"value": "1"}, {"value": 1})
+    assert not _equivalent({"items": []}, {"items": {}})
+    assert not _equivalent({"a": [1]}, {"a": 1})
+
+
+def test_digest_is_stable_and_fixed_length():
+    value = canonicalize({"name": "x", "tags": [2, 1]})
+
+    assert digest(value) == digest(canonicalize({"tags": [1, 2], "name": "x"}))
+    assert len(digest(value)) == 32
+
+
+def test_mapper_digest_ignores_id_and_private_keys_and_honors_unordered_fields():
+    mapper = CustomFormatMapper(None, None)
+    spec_a = {"name": "x265", "implementation": "ReleaseTitleSpecification", "fields": {"v": "x"}}
+    spec_b = {"name": "Not 2160p", "implementation": "ResolutionSpecification", "fields": {"v": 4}}
+    current = {"id": 12, "name": "x265 (HD)", "specifications": [spec_a, spec_b]}
+    desired = {"name": "x265 (HD)", "specifications": [spec_b, spec_a], "_source": "yaml"}
+
+    assert mapper.digest(current) == mapper.digest(desired)
+    assert mapper.diff_fields(current, desired) == []
+
+
+def test_equal_digests_skip_the_field_diff():
+    compared = []
+
+    def diff_fields(current, desired):
+        compared.append(current["name"])
+        return ["value"] if current["value"] != desired["value"] else []
+
+    changeset = compute_diff(
+        current=[{"name": "same", "value": 1}, {"name": "changed", "value": 1}],
+        desired=[{"name": "same", "value": 1}, {"name": "changed", "value": 2}],
+        match_key_fn=lambda item: item["name"],
+        digest_fn=lambda item: digest(canonicalize(item)),
+        diff_fields_fn=diff_fields,
+    )
+
+    assert compared == ["changed"]
+    assert changeset.changed_fields == {"changed": ["value"]}
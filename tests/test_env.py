@@ -0,0 +1,106 @@
+"""Single-pass env var interpolation of loaded configs."""
+
+import pytest
+
+from src.utils import env
+from src.utils.env import EnvInterpolator, env_var_reference
+
+
+@pytest.fixture(autouse=True)
+def _environment(monkeypatch):
+    monkeypatch.setenv("SONARR_URL", "http://sonarr:8989")
+    monkeypatch.setenv("SONARR_API_KEY", "secret")
+
+
+def test_references_are_resolved_in_nested_values():
+    config = {
+        "instances": [{"base_url": "${SONARR_URL}/", "api_key": "$SONARR_API_KEY", "port": 1}],
+        "note": "costs $5",
+    }
+
+    assert EnvInterpolator().interpolate(config) == {
+        "instances": [{"base_url": "http://sonarr:8989/", "api_key": "secret", "port": 1}],
+        "note": "costs $5",
+    }
+
+
+def test_referenced_variables_are_collected():
+    interpolator = EnvInterpolator()
+
+    interpolator.interpolate({"a": "${SONARR_URL}", "b": ["$SONARR_API_KEY", "$SONARR_URL"]})
+
+    assert interpolator.referenced == {"SONARR_URL", "SONARR_API_KEY"}
+
+
+def test_missing_variable_is_reported_and_still_collected():
+    interpolator = EnvInterpolator()
+
+    with pytest.raises(ValueError, match="'MISSING' referenced in config but not found"):
+        interpolator.interpolate({"api_key": "${MISSING}"})
+    assert interpolator.referenced == {"MISSING"}
+
+
+def test_containers_without_references_are_not_copied():
+    tags = ["anime", "kids"]
+    config = {"tags": tags, "naming": {"rename": True, "format": "{Series Title}"}}
+
+    result = EnvInterpolator().interpolate(config)
+
+    assert result is config
+    assert result["tags"] is tags
+
+
+def test_only_changed_containers_are_copied_and_the_input_is_untouched():
+    unchanged = {"definitions": ["anime"]}
+    config = {"instance": {"api_key": "$SONARR_API_KEY", "tags": unchanged}, "other": [1, 2]}
+
+    result = EnvInterpolator().interpolate(config)
+
+    assert config["instance"]["api_key"] == "$SONARR_API_KEY"
+    assert result is not config and result["instance"] is not config["instance"]
+    assert result["instance"]["tags"] is unchanged
+    assert result["other"] is config["other"]
+
+
+def test_shared_containers_are_interpolated_once_and_stay_shared():
+    shared = {"api_key": "$SONARR_API_KEY", "tags": ["$SONARR_URL"]}
+    config = {"main": shared, "anime": shared, "all": [shared, shared]}
+
+    result = EnvInterpolator().interpolate(config)
+
+    assert result["main"] == {"api_key": "secret", "tags": ["http://sonarr:8989"]}
+    assert result["anime"] is result["main"]
+    assert all(item is result["main"] for item in result["all"])
+
+
+def test_each_distinct_string_is_resolved_once(monkeypatch):
+    lookups = []
+
+    def getenv(name, default=None):
+        lookups.append(name)
+        return {"SONARR_API_KEY": "secret"}.get(name, default)
+
+    monkeypatch.setattr(env.os, "getenv", getenv)
+    config = {str(n): {"api_key": "$SONARR_API_KEY"} for n in range(5)}
+
+    result = EnvInterpolator().interpolate(config)
+
+    assert [instance["api_key"] for instance in result.values()] == ["secret"] * 5
+    assert lookups == ["SONARR_API_KEY"]
+
+
+def test_every_interpolator_reads_the_current_environment(monkeypatch):
+    config = {"api_key": "$SONARR_API_KEY"}
+    assert EnvInterpolator().interpolate(config) == {"api_key": "secret"}
+
+    monkeypatch.setenv("SONARR_API_KEY", "rotated")
+
+    assert EnvInterpolator().interpolate(config) == {"api_key": "rotated"}
+
+
+def test_whole_value_references_are_recognized():
+    assert env_var_reference("${SONARR_API_KEY}") == "SONARR_API_KEY"
+    assert env_var_reference("$SONARR_API_KEY") == "SONARR_API_KEY"
+    assert env_var_reference("${SONARR_URL}/api") is None
+    assert env_var_reference("secret") is None
+    assert env_var_reference(None) is None
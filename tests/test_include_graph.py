@@ -0,0 +1,92 @@
+"""Include dependencies recorded while loading a config, and the cycles among them."""
+
+from pathlib import Path
+
+import pytest
+
+from src.utils.yaml_loader import IncludeCycleError, IncludeGraph, load_yaml_config
+
+ROOT, SHARED, TAGS, NAMING = (
+    Path(f"/config/{name}.yaml") for name in ("root", "shared", "tags", "naming")
+)
+
+
+def _graph(*edges: tuple[Path, Path]) -> IncludeGraph:
+    graph = IncludeGraph()
+    graph.add_file(ROOT)
+    for parent, child in edges:
+        graph.add(parent, child)
+    return graph
+
+
+def test_files_and_includes_keep_their_order():
+    graph = _graph((ROOT, SHARED), (ROOT, NAMING), (SHARED, TAGS), (ROOT, SHARED))
+
+    assert graph.files() == [ROOT, SHARED, NAMING, TAGS]
+    assert graph.includes(ROOT) == [SHARED, NAMING]
+    assert graph.includes(TAGS) == []
+    assert graph.includes(Path("/elsewhere.yaml")) == []
+
+
+def test_dependents_are_found_transitively():
+    graph = _graph((ROOT, SHARED), (ROOT, NAMING), (SHARED, TAGS), (NAMING, TAGS))
+
+    assert graph.dependents(TAGS) == {SHARED, NAMING, ROOT}
+    assert graph.dependents(NAMING) == {ROOT}
+    assert graph.dependents(ROOT) == set()
+
+
+def test_acyclic_graph_has_no_cycle():
+    # Diamond: TAGS is reached twice, but not through itself
+    graph = _graph((ROOT, SHARED), (ROOT, NAMING), (SHARED, TAGS), (NAMING, TAGS))
+
+    assert graph.find_cycle() is None
+    assert IncludeGraph().find_cycle() is None
+
+
+def test_cycle_starts_and_ends_with_the_same_file():
+    graph = _graph((ROOT, SHARED), (SHARED, TAGS), (TAGS, NAMING), (NAMING, SHARED))
+
+    assert graph.find_cycle() == [SHARED, TAGS, NAMING, SHARED]
+
+
+def test_self_include_is_a_cycle():
+    assert _graph((ROOT, SHARED), (SHARED, SHARED)).find_cycle() == [SHARED, SHARED]
+
+
+def test_dependents_terminate_on_cycles():
+    graph = _graph((ROOT, SHARED), (SHARED, TAGS), (TAGS, SHARED))
+
+    assert graph.dependents(TAGS) == {ROOT, SHARED, TAGS}
+
+
+def test_loading_records_the_include_graph(tmp_path):
+    (tmp_path / "shared").mkdir()
+    (tmp_path / "shared" / "tags.yaml").write_text("- anime\n")
+    (tmp_path / "shared" / "sonarr.yaml").write_text("tags: !include tags.yaml\n")
+    (tmp_path / "config.yaml").write_text(
+        "main: !include shared/sonarr.yaml\nanime: !include shared/sonarr.yaml\n"
+    )
+    graph = IncludeGraph()
+    included: list[Path] = []
+
+    config = load_yaml_config(tmp_path / "config.yaml", included, graph)
+
+    root, sonarr, tags = (
+        (tmp_path / name).resolve()
+        for name in ("config.yaml", "shared/sonarr.yaml", "shared/tags.yaml")
+    )
+    assert config == {"main": {"tags": ["anime"]}, "anime": {"tags": ["anime"]}}
+    assert graph.files() == [root, sonarr, tags]
+    assert included == [sonarr, tags]
+    assert graph.dependents(tags) == {sonarr, root}
+    assert graph.find_cycle() is None
+
+
+def test_loading_an_include_cycle_fails(tmp_path):
+    (tmp_path / "a.yaml").write_text("b: !include b.yaml\n")
+    (tmp_path / "b.yaml").write_text("a: !include a.yaml\n")
+    (tmp_path / "config.yaml").write_text("a: !include a.yaml\n")
+
+    with pytest.raises(IncludeCycleError, match="a.yaml -> .*b.yaml -> .*a.yaml"):
+        load_yaml_config(tmp_path / "config.yaml")
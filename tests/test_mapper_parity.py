@@ -0,0 +1,310 @@
+"""Parity of `from_api_dict` (raw JSON) and `from_api_model` (API models) for every mapper."""
+
+import copy
+
+import pytest
+from sonarr_api.models.custom_format_resource import CustomFormatResource
+from sonarr_api.models.custom_format_specification_schema import CustomFormatSpecificationSchema
+from sonarr_api.models.delay_profile_resource import DelayProfileResource
+from sonarr_api.models.download_client_resource import DownloadClientResource
+from sonarr_api.models.indexer_resource import IndexerResource
+from sonarr_api.models.media_management_config_resource import MediaManagementConfigResource
+from sonarr_api.models.naming_config_resource import NamingConfigResource
+from sonarr_api.models.profile_format_item_resource import ProfileFormatItemResource
+from sonarr_api.models.quality_definition_resource import QualityDefinitionResource
+from sonarr_api.models.quality_profile_resource import QualityProfileResource
+from sonarr_api.models.tag_resource import TagResource
+
+from src.plugins.sonarr.mappers.media_management import MediaManagementConfigMapper
+from src.plugins.sonarr.mappers.naming import NamingConfigMapper
+from src.shared.mappers.custom_formats import CustomFormatMapper
+from src.shared.mappers.delay_profiles import DelayProfileMapper
+from src.shared.mappers.download_clients import DownloadClientMapper
+from src.shared.mappers.indexers import IndexerMapper
+from src.shared.mappers.quality_definitions import QualityDefinitionMapper
+from src.shared.mappers.quality_profiles import QualityProfileMapper
+from src.shared.mappers.tags import TagMapper
+
+
+def _field(order, name, value, **extra):
+    """A provider field as Sonarr serializes it (nulls included)."""
+    return {
+        "order": order,
+        "name": name,
+        "label": name.title(),
+        "unit": None,
+        "helpText": None,
+        "value": value,
+        "type": "textbox",
+        "advanced": False,
+        "privacy": "normal",
+        "isFloat": False,
+        **extra,
+    }
+
+
+# Responses as returned by Sonarr v4 list endpoints, including nulls and enum values
+FIXTURES = {
+    "tags": (TagMapper(TagResource), TagResource, {"id": 3, "label": "anime"}),
+    "custom_formats": (
+        CustomFormatMapper(CustomFormatResource, CustomFormatSpecificationSchema),
+        CustomFormatResource,
+        {
+            "id": 12,
+            "name": "x265 (HD)",
+            "includeCustomFormatWhenRenaming": False,
+            "specifications": [
+                {
+                    "id": 0,
+                    "name": "x265",
+                    "implementation": "ReleaseTitleSpecification",
+                    "implementationName": "Release Title",
+                    "infoLink": None,
+                    "negate": False,
+                    "required": True,
+                    "fields": [_field(0, "value", r"[xh][ ._-]?265|\bHEVC(\b|\d)")],
+                    "presets": [],
+                },
+                {
+                    "id": 1,
+                    "name": "Not 2160p",
+                    "implementation": "ResolutionSpecification",
+                    "implementationName": "Resolution",
+                    "infoLink": None,
+                    "negate": True,
+                    "required": True,
+                    "fields": [_field(0, "value", 2160, type="select", selectOptions=None)],
+                    "presets": [],
+                },
+            ],
+        },
+    ),
+    "quality_definitions": (
+        QualityDefinitionMapper(QualityDefinitionResource),
+        QualityDefinitionResource,
+        {
+            "id": 4,
+            "quality": {"id": 4, "name": "HDTV-720p", "source": "television", "resolution": 720},
+            "title": "HDTV-720p",
+            "weight": 7,
+            "minSize": 10.0,
+            "maxSize": None,
+            "preferredSize": 95.5,
+        },
+    ),
+    "quality_profiles": (
+        QualityProfileMapper(QualityProfileResource, ProfileFormatItemResource),
+        QualityProfileResource,
+        {
+            "id": 6,
+            "name": "WEB-1080p",
+            "upgradeAllowed": True,
+            "cutoff": 1003,
+            "items": [
+                {
+                    "quality": {
+                        "id": 1,
+                        "name": "SDTV",
+                        "source": "television",
+                        "resolution": 480,
+                    },
+                    "items": [],
+                    "allowed": False,
+                },
+                {
+                    "id": 1003,
+                    "name": "WEB 1080p",
+                    "items": [
+                        {
+                            "quality": {
+                                "id": 3,
+                                "name": "WEBDL-1080p",
+                                "source": "web",
+                                "resolution": 1080,
+                            },
+                            "items": [],
+                            "allowed": True,
+                        },
+                        {
+                            "quality": {
+                                "id": 15,
+                                "name": "WEBRip-1080p",
+                                "source": "webRip",
+                                "resolution": 1080,
+                            },
+                            "items": [],
+                            "allowed": True,
+                        },
+                    ],
+                    "allowed": True,
+                },
+            ],
+            "minFormatScore": 0,
+            "cutoffFormatScore": 10000,
+            "minUpgradeFormatScore": 1,
+            "formatItems": [
+                {"format": 12, "name": "x265 (HD)", "score": -10000},
+                {"format": 13, "name": "Repack/Proper", "score": 5},
+            ],
+        },
+    ),
+    "delay_profiles": (
+        DelayProfileMapper(DelayProfileResource),
+        DelayProfileResource,
+        {
+            "id": 2,
+            "enableUsenet": True,
+            "enableTorrent": True,
+            "preferredProtocol": "usenet",
+            "usenetDelay": 0,
+            "torrentDelay": 120,
+            "bypassIfHighestQuality": True,
+            "bypassIfAboveCustomFormatScore": False,
+            "minimumCustomFormatScore": 0,
+            "order": 1,
+            "tags": [3, 1],
+        },
+    ),
+    "indexers": (
+        IndexerMapper(IndexerResource),
+        IndexerResource,
+        {
+            "id": 1,
+            "name": "NZBgeek",
+            "fields": [
+                _field(0, "baseUrl", "https://api.nzbgeek.info"),
+                _field(1, "apiPath", "/api"),
+                _field(2, "apiKey", "********", privacy="apiKey"),
+                _field(3, "categories", [5030, 5040], type="select"),
+                _field(4, "additionalParameters", None),
+            ],
+            "implementationName": "Newznab",
+            "implementation": "Newznab",
+            "configContract": "NewznabSettings",
+            "infoLink": "https://wiki.servarr.com/sonarr/supported#newznab",
+            "tags": [],
+            "presets": [],
+            "enableRss": True,
+            "enableAutomaticSearch": True,
+            "enableInteractiveSearch": False,
+            "supportsRss": True,
+            "supportsSearch": True,
+            "protocol": "usenet",
+            "priority": 25,
+            "seasonSearchMaximumSingleEpisodeAge": 0,
+            "downloadClientId": 0,
+        },
+    ),
+    "download_clients": (
+        DownloadClientMapper(DownloadClientResource),
+        DownloadClientResource,
+        {
+            "id": 1,
+            "name": "qBittorrent",
+            "fields": [
+                _field(0, "host", "qbittorrent"),
+                _field(1, "port", 8080),
+                _field(2, "useSsl", False, type="checkbox"),
+                _field(3, "password", "********", privacy="password"),
+                _field(4, "recentTvPriority", 0, type="select"),
+            ],
+            "implementationName": "qBittorrent",
+            "implementation": "QBittorrent",
+            "configContract": "QBittorrentSettings",
+            "infoLink": None,
+            "tags": [1],
+            "presets": [],
+            "enable": True,
+            "protocol": "torrent",
+            "priority": 1,
+            "removeCompletedDownloads": True,
+            "removeFailedDownloads": True,
+        },
+    ),
+    "naming": (
+        NamingConfigMapper(),
+        NamingConfigResource,
+        {
+            "id": 1,
+            "renameEpisodes": True,
+            "replaceIllegalCharacters": True,
+            "colonReplacementFormat": 4,
+            "customColonReplacementFormat": None,
+            "multiEpisodeStyle": 5,
+            "standardEpisodeFormat": "{Series Title} - S{season:00}E{episode:00} - {Episode Title}",
+            "dailyEpisodeFormat": "{Series Title} - {Air-Date} - {Episode Title}",
+            "animeEpisodeFormat": "{Series Title} - S{season:00}E{episode:00} - {absolute:000}",
+            "seriesFolderFormat": "{Series TitleYear}",
+            "seasonFolderFormat": "Season {season:00}",
+            "specialsFolderFormat": "Specials",
+        },
+    ),
+    "media_management": (
+        MediaManagementConfigMapper(),
+        MediaManagementConfigResource,
+        {
+            "id": 1,
+            "autoUnmonitorPreviouslyDownloadedEpisodes": False,
+            "recycleBin": "",
+            "recycleBinCleanupDays": 7,
+            "downloadPropersAndRepacks": "doNotPrefer",
+            "createEmptySeriesFolders": False,
+            "deleteEmptyFolders": True,
+            "fileDate": "none",
+            "rescanAfterRefresh": "always",
+            "setPermissionsLinux": False,
+            "chmodFolder": "755",
+            "chownGroup": None,
+            "episodeTitleRequired": "always",
+            "skipFreeSpaceCheckWhenImporting": False,
+            "minimumFreeSpaceWhenImporting": 100,
+            "copyUsingHardlinks": True,
+            "useScriptImport": False,
+            "scriptImportPath": None,
+            "importExtraFiles": True,
+            "extraFileExtensions": "srt,nfo",
+            "enableMediaInfo": True,
+        },
+    ),
+}
+
+
+def _mapped_forms(name):
+    """Map one fixture through the raw JSON path, the API model path and a patched dict."""
+    mapper, model_class, data = FIXTURES[name]
+    model = model_class.from_dict(copy.deepcopy(data))
+    # Objects returned by write calls are patched into raw snapshot lists in this form
+    patched = model.model_dump(mode="json", by_alias=True, exclude_none=True)
+    return (
+        mapper,
+        mapper.from_api_dict(copy.deepcopy(data)),
+        mapper.from_api_model(model),
+        mapper.from_api_dict(patched),
+    )
+
+
+@pytest.mark.parametrize("name", sorted(FIXTURES))
+def test_raw_and_model_paths_have_equal_digests(name):
+    mapper, from_dict, from_model, from_patched = _mapped_forms(name)
+
+    assert mapper.digest(from_dict) == mapper.digest(from_model)
+    assert mapper.digest(from_patched) == mapper.digest(from_model)
+
+
+@pytest.mark.parametrize("name", sorted(FIXTURES))
+def test_raw_and_model_paths_have_no_field_differences(name):
+    mapper, from_dict, from_model, from_patched = _mapped_forms(name)
+
+    assert mapper.diff_fields(from_dict, from_model) == []
+    assert mapper.diff_fields(from_model, from_dict) == []
+    assert mapper.diff_fields(from_patched, from_model) == []
+
+
+@pytest.mark.parametrize("name", sorted(FIXTURES))
+def test_raw_and_model_paths_report_the_same_changes(name):
+    mapper, from_dict, from_model, _ = _mapped_forms(name)
+    # Change every field, as a desired state differing from the server would
+    desired = {key: ("changed", value) for key, value in from_model.items()}
+
+    assert mapper.diff_fields(from_dict, desired) == mapper.diff_fields(from_model, desired)
+    assert mapper.diff_fields(from_dict, desired) == [key for key in desired if key != "id"]
@@ -0,0 +1,191 @@
+"""Plans survive being written to disk and rebuild the ChangeSet they were computed from."""
+
+from types import SimpleNamespace
+
+import pytest
+from sonarr_api.models.tag_resource import TagResource
+
+from src.core import sync
+from src.core.diff import ChangeSet
+from src.core.plan import (
+    PLAN_VERSION,
+    InstancePlan,
+    Plan,
+    ResourcePlan,
+    connect_planned,
+    find_api_key_env_vars,
+)
+from src.core.preflight import ServerInfo
+from src.core.reconciler import DesiredItem, Reconciler
+from src.core.sync import get_instance_deadline
+from src.shared.mappers.tags import TagMapper
+from src.shared.schemas import ConnectionConfig
+
+MAPPER = TagMapper(TagResource)
+
+# Tags on the server, as the raw JSON of their list endpoint
+SERVER = [{"id": 1, "label": "anime"}, {"id": 2, "label": "old"}, {"id": 3, "label": "kids"}]
+
+
+def _desired(label: str, id: int | None = None) -> DesiredItem:
+    model = TagResource(label=label, id=id)
+    return DesiredItem(label, model, MAPPER.from_api_model(model))
+
+
+def _changeset() -> ChangeSet[DesiredItem]:
+    """Creates "tv", updates "kids" and deletes "old"."""
+    return ChangeSet(
+        to_create=[_desired("tv")],
+        to_update=[(MAPPER.from_api_dict(SERVER[2]), _desired("kids", 3))],
+        to_delete=[MAPPER.from_api_dict(SERVER[1])],
+        changed_fields={"kids": ["label"]},
+    )
+
+
+def _round_trip(plan: Plan, tmp_path) -> Plan:
+    path = tmp_path / "plan.json"
+    plan.save(path)
+    return Plan.load(path)
+
+
+def _resource_plan(plan: Plan, name: str) -> ResourcePlan:
+    return plan.instances[0].resource(name)
+
+
+def _definition(name: str, depends_on=()) -> SimpleNamespace:
+    return SimpleNamespace(name=name, depends_on=depends_on, mapper=MAPPER)
+
+
+def test_saved_plan_loads_back_equal(tmp_path):
+    instance_plan = InstancePlan("sonarr", "main", "http://sonarr:8989", "SONARR_MAIN_API_KEY")
+    instance_plan.add_resource(_definition("tags"), "fingerprint", "desired", 4, _changeset())
+    plan = Plan(config_path="config/sonarr.yaml", instances=[instance_plan])
+
+    loaded = _round_trip(plan, tmp_path)
+
+    assert loaded == plan
+    assert loaded.version == PLAN_VERSION
+    assert loaded.instances[0].resource("tags").concurrency == 4
+
+
+def test_connection_settings_survive_the_round_trip(tmp_path, monkeypatch):
+    connection = ConnectionConfig(read_timeout=5, deadline=30, rate_limit=2, max_concurrency=2)
+    instance_plan = InstancePlan("sonarr", "main", "http://sonarr:8989", "SONARR_MAIN_API_KEY")
+    instance_plan.connection = connection
+
+    loaded = _round_trip(Plan("c", instances=[instance_plan]), tmp_path).instances[0]
+
+    assert loaded.connection == connection
+    assert get_instance_deadline(loaded, 600) == 30
+    assert get_instance_deadline(InstancePlan("sonarr", "main"), 600) == 600
+
+    # apply connects with the planned settings, not the defaults
+    clients = []
+    plugin = SimpleNamespace(
+        name="sonarr", get_client=lambda **kwargs: clients.append(kwargs) or kwargs
+    )
+    monkeypatch.setenv("SONARR_MAIN_API_KEY", "key")
+    monkeypatch.setattr(sync, "probe", lambda client, timeout: ServerInfo(None, None, 0.0, {}))
+    connect_planned(plugin, loaded, timeout=1)
+
+    assert clients[0]["connection"] == connection
+
+
+def test_changeset_is_rebuilt_from_a_loaded_plan(tmp_path):
+    resource_plan = ResourcePlan(name="tags", fingerprint="f", desired_hash="d")
+    resource_plan.record(_changeset(), MAPPER)
+    instance_plan = InstancePlan("sonarr", "main", resources=[resource_plan])
+
+    loaded = _resource_plan(_round_trip(Plan("c", instances=[instance_plan]), tmp_path), "tags")
+    changeset = loaded.to_changeset(MAPPER, SERVER)
+
+    assert [item.model for item in changeset.to_create] == [TagResource(label="tv")]
+    assert [(current["id"], item.model.id) for current, item in changeset.to_update] == [(3, 3)]
+    assert [current["label"] for current in changeset.to_delete] == ["old"]
+    assert changeset.changed_fields == {"kids": ["label"]}
+    assert changeset.summary() == _changeset().summary()
+
+
+def test_plan_of_a_dry_run_applies_the_same_writes(tmp_path):
+    writes = []
+    reconciler = Reconciler(
+        resource_name="tags",
+        mapper=MAPPER,
+        list_fn=lambda: SERVER,
+        create_fn=lambda model: writes.append(("create", model.label)),
+        update_fn=lambda id, model: writes.append(("update", id)),
+        delete_fn=lambda id: writes.append(("delete", id)),
+    )
+    computed = reconciler.reconcile(["anime", "tv"], delete_unmanaged=True, dry_run=True)
+    resource_plan = ResourcePlan(name="tags", fingerprint="f", desired_hash="d")
+    resource_plan.record(computed, MAPPER)
+
+    instance_plan = InstancePlan("sonarr", "main", resources=[resource_plan])
+
+    loaded = _resource_plan(_round_trip(Plan("c", instances=[instance_plan]), tmp_path), "tags")
+    reconciler.apply(loaded.to_changeset(MAPPER, SERVER))
+
+    assert writes == [("create", "tv"), ("delete", 2), ("delete", 3)]
+
+
+def test_planned_resource_deleted_since_is_reported():
+    resource_plan = ResourcePlan(name="tags", fingerprint="f", desired_hash="d")
+    resource_plan.record(_changeset(), MAPPER)
+
+    with pytest.raises(ValueError, match="old \\(ID: 2\\) no longer exists"):
+        resource_plan.to_changeset(MAPPER, [SERVER[0], SERVER[2]])
+
+
+def test_sections_without_changes_are_left_out():
+    instance_plan = InstancePlan("sonarr", "main")
+    empty = ChangeSet(to_create=[], to_update=[], to_delete=[])
+
+    instance_plan.add_resource(_definition("tags"), "f", "d", 1, empty)
+    instance_plan.add_resource(_definition("naming"), "f", "d", 1, None)
+
+    assert instance_plan.resources == []
+    assert not Plan("c", instances=[instance_plan])
+
+
+def test_dependents_of_id_changing_sections_are_deferred():
+    instance_plan = InstancePlan("sonarr", "main")
+    creates = ChangeSet(to_create=[_desired("tv")], to_update=[], to_delete=[])
+    empty = ChangeSet(to_create=[], to_update=[], to_delete=[])
+
+    instance_plan.add_resource(_definition("tags"), "f", "d", 1, creates)
+    instance_plan.add_resource(_definition("indexers", ("tags",)), "f", "d", 1, empty)
+    instance_plan.add_resource(_definition("naming"), "f", "d", 1, empty)
+
+    assert [(rp.name, rp.deferred) for rp in instance_plan.resources] == [
+        ("tags", False),
+        ("indexers", True),
+    ]
+    assert instance_plan.resource("indexers").depends_on == ["tags"]
+
+
+def test_api_keys_are_read_from_the_referenced_variable(tmp_path, monkeypatch, caplog):
+    # Another variable holding the same value must not be mistaken for the key's source
+    monkeypatch.setenv("AAA_SAME_VALUE", "secret-key")
+    monkeypatch.setenv("SONARR_KEY", "secret-key")
+    config = tmp_path / "config.yaml"
+    config.write_text(
+        "sonarr:\n"
+        "  - {name: main, api_key: '${SONARR_KEY}'}\n"
+        "  - {name: anime-4k}\n"
+        "  - {name: inline, api_key: secret-key}\n"
+    )
+
+    assert find_api_key_env_vars(config) == {
+        ("sonarr", "main"): "SONARR_KEY",
+        ("sonarr", "anime-4k"): "SONARR_ANIME_4K_API_KEY",
+        ("sonarr", "inline"): "SONARR_INLINE_API_KEY",
+    }
+    assert "sonarr/inline is written in the config" in caplog.text
+
+
+def test_unsupported_plan_version_is_rejected(tmp_path):
+    path = tmp_path / "plan.json"
+    path.write_text('{"version": 0, "config_path": "c", "instances": []}')
+
+    with pytest.raises(ValueError, match="Unsupported plan file format"):
+        Plan.load(path)
@@ -0,0 +1,211 @@
+"""Bulk batching, fallbacks and deadline handling of the reconciler."""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import pytest
+
+from src.core.deadline import DeadlineExceeded, deadline
+from src.core.reconciler import Reconciler
+from src.shared.mappers.base import ResourceMapper
+
+
+@dataclass
+class Item:
+    """Stand-in for a generated API model."""
+
+    name: str
+    value: int
+    id: Optional[int] = None
+
+
+class ItemMapper(ResourceMapper[Item, dict]):
+    def to_api_model(self, yaml_def: dict, **context) -> Item:
+        return Item(yaml_def["name"], yaml_def["value"])
+
+    def from_api_model(self, api_model: Item) -> dict[str, Any]:
+        return {"id": api_model.id, "name": api_model.name, "value": api_model.value}
+
+    def from_api_dict(self, data: dict[str, Any]) -> dict[str, Any]:
+        return {"id": data.get("id"), "name": data["name"], "value": data["value"]}
+
+    def get_match_key(self, item) -> str:
+        return item["name"] if isinstance(item, dict) else item.name
+
+
+class FakeServer:
+    """Records every write; calls named in `failing` raise."""
+
+    def __init__(self, items: list[dict[str, Any]], failing: tuple[str, ...] = ()):
+        self.items = items
+        self.failing = failing
+        self.calls: list[tuple[str, Any]] = []
+
+    def _call(self, kind: str, argument: Any) -> None:
+        self.calls.append((kind, argument))
+        if kind in self.failing:
+            raise RuntimeError(f"{kind} failed")
+
+    def reconciler(self, bulk: bool = True, **kwargs) -> Reconciler:
+        return Reconciler(
+            resource_name="items",
+            mapper=ItemMapper(),
+            list_fn=lambda: list(self.items),
+            create_fn=lambda model: self._call("create", model.name),
+            update_fn=lambda id, model: self._call("update", (id, model.id)),
+            delete_fn=lambda id: self._call("delete", id),
+            bulk_update_fn=(
+                (lambda models: self._call("bulk_update", [m.id for m in models])) if bulk else None
+            ),
+            bulk_delete_fn=(lambda ids: self._call("bulk_delete", ids)) if bulk else None,
+            **kwargs,
+        )
+
+    def kinds(self) -> list[str]:
+        return [kind for kind, _ in self.calls]
+
+
+def _server(count: int, **kwargs) -> FakeServer:
+    items = [{"id": i, "name": f"item{i}", "value": 0} for i in range(1, count + 1)]
+    return FakeServer(items, **kwargs)
+
+
+def _changed(count: int) -> list[dict]:
+    return [{"name": f"item{i}", "value": 1} for i in range(1, count + 1)]
+
+
+def test_updates_are_batched_into_chunks():
+    server = _server(5)
+
+    reconciler = server.reconciler(bulk_chunk_size=2)
+    reconciler.reconcile(_changed(5))
+
+    assert server.calls == [
+        ("bulk_update", [1, 2]),
+        ("bulk_update", [3, 4]),
+        ("bulk_update", [5]),
+    ]
+    assert reconciler.errors == []
+
+
+def test_single_update_uses_the_item_endpoint():
+    server = _server(1)
+
+    server.reconciler().reconcile(_changed(1))
+
+    assert server.calls == [("update", (1, 1))]
+
+
+def test_unmanaged_items_are_deleted_in_bulk():
+    server = _server(4)
+
+    server.reconciler(bulk_chunk_size=3).reconcile([], delete_unmanaged=True)
+
+    assert server.calls == [("bulk_delete", [1, 2, 3]), ("bulk_delete", [4])]
+
+
+def test_without_bulk_endpoints_every_item_is_written_separately():
+    server = _server(3)
+
+    server.reconciler(bulk=False).reconcile(_changed(2), delete_unmanaged=True)
+
+    assert server.kinds() == ["update", "update", "delete"]
+
+
+def test_failed_bulk_update_falls_back_to_item_updates():
+    server = _server(3, failing=("bulk_update",))
+
+    reconciler = server.reconciler()
+    reconciler.reconcile(_changed(3))
+
+    assert server.kinds() == ["bulk_update", "update", "update", "update"]
+    assert reconciler.errors == []
+
+
+def test_failed_bulk_delete_falls_back_and_collects_item_errors():
+    server = _server(2, failing=("bulk_delete", "delete"))
+
+    reconciler = server.reconciler()
+    reconciler.reconcile([], delete_unmanaged=True)
+
+    assert server.kinds() == ["bulk_delete", "delete", "delete"]
+    assert [error.split(":")[0] for error in reconciler.errors] == ["Delete item1", "Delete item2"]
+
+
+def test_creates_run_before_updates_and_deletes():
+    server = _server(3)
+
+    server.reconciler().reconcile(
+        [{"name": "item1", "value": 1}, {"name": "item2", "value": 1}, {"name": "new", "value": 1}],
+        delete_unmanaged=True,
+    )
+
+    assert server.calls == [("create", "new"), ("bulk_update", [1, 2]), ("delete", 3)]
+
+
+def test_dry_run_writes_nothing():
+    server = _server(3)
+
+    changeset = server.reconciler().reconcile(_changed(2), delete_unmanaged=True, dry_run=True)
+
+    assert server.calls == []
+    assert changeset.summary() == "2 to update, 1 to delete"
+
+
+def test_expired_deadline_stops_before_fetching():
+    server = _server(1)
+    fetched = []
+    reconciler = server.reconciler()
+    reconciler.list_fn = lambda: fetched.append(True) or []
+
+    with deadline(0, "run"), pytest.raises(DeadlineExceeded, match="run deadline exceeded"):
+        reconciler.reconcile(_changed(1))
+    assert fetched == []
+    assert server.calls == []
+
+
+def test_deadline_passing_during_apply_skips_remaining_operations():
+    server = _server(0)
+    reconciler = server.reconciler(bulk=False)
+    desired = [{"name": f"new{i}", "value": 1} for i in range(3)]
+    changeset = reconciler.reconcile(desired, dry_run=True)
+
+    def slow_create(model):
+        server.calls.append(("create", model.name))
+        time.sleep(0.1)
+
+    reconciler.create_fn = slow_create
+    with deadline(0.05, "instance 'main'"):
+        reconciler.apply(changeset)
+
+    assert server.calls == [("create", "new0")]
+    assert reconciler.errors == ["Skipped 2 operation(s): instance 'main' deadline exceeded"]
+
+
+def test_bulk_call_cut_short_by_the_deadline_is_not_retried_per_item():
+    server = _server(2)
+    reconciler = server.reconciler()
+
+    def bulk_update(models):
+        server.calls.append(("bulk_update", [m.id for m in models]))
+        raise DeadlineExceeded("run deadline exceeded")
+
+    reconciler.bulk_update_fn = bulk_update
+    reconciler.reconcile(_changed(2))
+
+    assert server.kinds() == ["bulk_update"]
+    assert reconciler.errors == [
+        "Update item1: run deadline exceeded",
+        "Update item2: run deadline exceeded",
+    ]
+
+
+def test_concurrent_writes_apply_every_operation():
+    server = _server(0)
+
+    reconciler = server.reconciler(max_workers=4)
+    reconciler.reconcile([{"name": f"new{i}", "value": 1} for i in range(8)])
+
+    assert sorted(name for _, name in server.calls) == [f"new{i}" for i in range(8)]
+    assert reconciler.errors == []
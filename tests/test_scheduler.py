@@ -0,0 +1,131 @@
+"""Dependency ordering, cycle detection and failure propagation of the scheduler."""
+
+import contextvars
+import threading
+import time
+
+import pytest
+
+from src.core.scheduler import DependencyScheduler, topological_order
+
+# The dependencies of the Sonarr resource types
+GRAPH = {
+    "tags": [],
+    "custom_formats": [],
+    "quality_definitions": [],
+    "quality_profiles": ["custom_formats"],
+    "delay_profiles": ["tags"],
+    "indexers": ["tags"],
+    "download_clients": ["tags"],
+    "naming": [],
+}
+
+
+def test_every_node_comes_after_its_dependencies():
+    order = topological_order(GRAPH)
+
+    assert sorted(order) == sorted(GRAPH)
+    for name, deps in GRAPH.items():
+        assert all(order.index(dep) < order.index(name) for dep in deps)
+
+
+def test_ties_are_broken_by_insertion_order():
+    assert topological_order({"b": [], "a": [], "c": ["b"]}) == ["b", "a", "c"]
+    assert topological_order(GRAPH) == topological_order(dict(GRAPH))
+
+
+def test_dependencies_outside_the_graph_are_ignored():
+    assert topological_order({"indexers": ["tags"], "naming": []}) == ["indexers", "naming"]
+
+
+def test_cycle_is_reported_with_its_members():
+    graph = {"a": ["c"], "b": ["a"], "c": ["b"], "d": []}
+
+    with pytest.raises(ValueError, match="cycle detected between: a, b, c"):
+        topological_order(graph)
+    with pytest.raises(ValueError):
+        DependencyScheduler().run(graph, lambda name: True)
+
+
+def test_self_dependency_is_a_cycle():
+    with pytest.raises(ValueError, match="between: a"):
+        topological_order({"a": ["a"]})
+
+
+def test_tasks_start_only_after_their_dependencies_finished():
+    finished: list[str] = []
+    lock = threading.Lock()
+
+    def task(name: str) -> bool:
+        with lock:
+            assert all(dep in finished for dep in GRAPH[name]), name
+        time.sleep(0.01)
+        with lock:
+            finished.append(name)
+        return True
+
+    results = DependencyScheduler().run(GRAPH, task)
+
+    assert results == {name: True for name in topological_order(GRAPH)}
+    assert list(results) == topological_order(GRAPH)
+
+
+def test_independent_tasks_run_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def task(name: str) -> bool:
+        barrier.wait()  # Times out unless all three run at once
+        return True
+
+    assert all(DependencyScheduler().run({"a": [], "b": [], "c": []}, task).values())
+
+
+def test_max_workers_bounds_concurrency():
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def task(name: str) -> bool:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return True
+
+    DependencyScheduler(max_workers=2).run({str(i): [] for i in range(6)}, task)
+
+    assert peak == 2
+
+
+def test_failure_skips_dependents_only():
+    ran: list[str] = []
+
+    def task(name: str) -> bool:
+        ran.append(name)
+        if name == "tags":
+            raise RuntimeError("boom")
+        return name != "custom_formats"
+
+    results = DependencyScheduler().run(GRAPH, task)
+
+    assert not results["tags"] and not results["custom_formats"]
+    for skipped in ("quality_profiles", "delay_profiles", "indexers", "download_clients"):
+        assert results[skipped] is False
+        assert skipped not in ran
+    assert results["quality_definitions"] and results["naming"]
+
+
+def test_tasks_run_in_a_copy_of_the_callers_context():
+    variable = contextvars.ContextVar("variable", default=None)
+    variable.set("caller")
+
+    seen = DependencyScheduler().run({"a": [], "b": ["a"]}, lambda name: variable.get() == "caller")
+
+    assert seen == {"a": True, "b": True}
+
+
+def test_empty_graph():
+    assert DependencyScheduler().run({}, lambda name: True) == {}
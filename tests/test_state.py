@@ -0,0 +1,163 @@
+"""Persistence of the incremental sync state and the hashes it is keyed on."""
+
+import threading
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+from pydantic import BaseModel
+from sonarr_api.models.tag_resource import TagResource
+
+from src.core.plan import InstancePlan
+from src.core.preflight import ServerInfo
+from src.core.state import StateStore, canonical_hash
+from src.core.sync import InstanceConnection, get_section_hash, sync_instance
+from src.plugins.base import ResourceDefinition
+from src.plugins.sonarr.schema import SonarrInstanceConfig
+from src.shared.mappers.tags import TagMapper
+
+
+def test_unknown_section_has_no_state(tmp_path):
+    with StateStore(tmp_path) as state:
+        assert state.get("sonarr", "main", "tags") is None
+
+
+def test_recorded_state_is_read_back(tmp_path):
+    with StateStore(tmp_path) as state:
+        state.record("sonarr", "main", "tags", "desired", "fingerprint")
+        recorded = state.get("sonarr", "main", "tags")
+
+    assert (recorded.desired_hash, recorded.server_fingerprint) == ("desired", "fingerprint")
+    assert recorded.synced_at > 0
+
+
+def test_sections_are_keyed_by_plugin_instance_and_section(tmp_path):
+    with StateStore(tmp_path) as state:
+        state.record("sonarr", "main", "tags", "a", "1")
+        state.record("sonarr", "4k", "tags", "b", "2")
+        state.record("sonarr", "main", "indexers", "c", "3")
+
+        assert state.get("sonarr", "main", "tags").desired_hash == "a"
+        assert state.get("sonarr", "4k", "tags").desired_hash == "b"
+        assert state.get("sonarr", "main", "indexers").desired_hash == "c"
+        assert state.get("radarr", "main", "tags") is None
+
+
+def test_recording_again_replaces_the_state(tmp_path):
+    with StateStore(tmp_path) as state:
+        state.record("sonarr", "main", "tags", "old", "old")
+        state.record("sonarr", "main", "tags", "new", "new")
+
+        assert state.get("sonarr", "main", "tags").desired_hash == "new"
+
+
+def test_state_persists_across_runs(tmp_path):
+    state_dir = tmp_path / "nested" / "state"
+    with StateStore(state_dir) as state:
+        state.record("sonarr", "main", "tags", "desired", "fingerprint")
+
+    with StateStore(state_dir) as state:
+        assert state.get("sonarr", "main", "tags").server_fingerprint == "fingerprint"
+
+
+def test_store_is_shared_between_threads(tmp_path):
+    with StateStore(tmp_path) as state:
+        threads = [
+            threading.Thread(
+                target=lambda n=n: state.record("sonarr", "main", f"section{n}", str(n), str(n))
+            )
+            for n in range(16)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for n in range(16):
+            assert state.get("sonarr", "main", f"section{n}").desired_hash == str(n)
+
+
+def test_canonical_hash_ignores_key_order():
+    assert canonical_hash({"a": 1, "b": [1, {"c": 2, "d": 3}]}) == canonical_hash(
+        {"b": [1, {"d": 3, "c": 2}], "a": 1}
+    )
+    assert canonical_hash([1, 2]) != canonical_hash([2, 1])
+    assert canonical_hash(None) != canonical_hash({})
+
+
+def _instance(**sections) -> SonarrInstanceConfig:
+    return SonarrInstanceConfig(
+        name="main", base_url="http://sonarr:8989", api_key="key", **sections
+    )
+
+
+def test_section_hash_ignores_tuning_knobs():
+    slow = _instance(tags={"definitions": ["anime"], "concurrency": 1})
+    fast = _instance(tags={"definitions": ["anime"], "concurrency": 8})
+
+    assert get_section_hash(slow, "tags") == get_section_hash(fast, "tags")
+
+
+def test_section_hash_follows_the_desired_state():
+    base = _instance(tags={"definitions": ["anime"]})
+
+    assert get_section_hash(base, "tags") != get_section_hash(
+        _instance(tags={"definitions": ["anime", "kids"]}), "tags"
+    )
+    assert get_section_hash(base, "tags") != get_section_hash(
+        _instance(tags={"definitions": ["anime"], "delete_unmanaged": True}), "tags"
+    )
+    assert get_section_hash(base, "naming") == get_section_hash(_instance(), "naming")
+
+
+class Section(BaseModel):
+    definitions: list[str]
+
+
+class Instance(BaseModel):
+    name: str = "main"
+    tags: Section
+    labels: Section
+
+
+def _sync(instance: Instance, server: dict[str, list], state: StateStore, **kwargs) -> bool:
+    """Sync `instance` against an in-memory server whose "labels" depend on its "tags"."""
+
+    def definition(name: str, depends_on=()) -> ResourceDefinition:
+        return ResourceDefinition(
+            name=name,
+            mapper=TagMapper(TagResource),
+            list_fn=lambda: [TagResource(**item) for item in server[name]],
+            create_fn=lambda model: server[name].append({"id": 99, "label": model.label}),
+            update_fn=lambda id, model: None,
+            depends_on=depends_on,
+        )
+
+    plugin = SimpleNamespace(
+        name="fake",
+        display_name="Fake",
+        get_resource_definitions=lambda client, config: [
+            definition("tags"),
+            definition("labels", ("tags",)),
+        ],
+    )
+    connection = InstanceConnection(
+        nullcontext(), "http://fake", "key", ServerInfo("Fake", "4.0", 0.0, {})
+    )
+    return sync_instance(plugin, instance, state=state, connection=connection, **kwargs)
+
+
+def test_dependents_of_planned_changes_are_not_skipped(tmp_path):
+    server = {"tags": [{"id": 1, "label": "anime"}], "labels": [{"id": 1, "label": "hd"}]}
+    labels = Section(definitions=["hd"])
+    with StateStore(tmp_path) as state:
+        assert _sync(Instance(tags=Section(definitions=["anime"]), labels=labels), server, state)
+
+        # Only tags changed, but creating a tag may alter the IDs labels map
+        plan = InstancePlan("fake", "main")
+        instance = Instance(tags=Section(definitions=["anime", "kids"]), labels=labels)
+        assert _sync(instance, server, state, dry_run=True, plan=plan)
+
+    assert [(rp.name, rp.deferred) for rp in plan.resources] == [
+        ("tags", False),
+        ("labels", True),
+    ]
@@ -0,0 +1,210 @@
+"""Per-host rate limiting and AIMD concurrency control."""
+
+import logging
+import threading
+import time
+
+import pytest
+
+from src.core import throttle
+from src.core.deadline import DeadlineExceeded, deadline
+from src.core.throttle import AdaptiveConcurrencyLimiter, ThrottleRegistry, TokenBucket
+
+
+class FakeClock:
+    """Stands in for `time` in the throttle module; requests take `latency` seconds."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.latency = 0.01
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(throttle, "time", clock)
+    return clock
+
+
+def _request(limiter: AdaptiveConcurrencyLimiter, clock: FakeClock, failed: bool = False) -> None:
+    with limiter.slot() as outcome:
+        clock.now += clock.latency
+        outcome.failed = failed
+
+
+def test_bucket_allows_a_burst_then_the_rate(clock):
+    bucket = TokenBucket(rate=10, burst=3)
+
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.now == 0
+
+    bucket.acquire()
+    assert clock.now == pytest.approx(0.1)
+
+
+def test_bucket_refills_up_to_the_burst(clock):
+    bucket = TokenBucket(rate=10, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    clock.now += 60
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.now == 60
+
+    bucket.acquire()
+    assert clock.now == pytest.approx(60.1)
+
+
+def test_bucket_wait_beyond_the_deadline_fails_fast():
+    bucket = TokenBucket(rate=0.1)
+    bucket.acquire()
+    start = time.monotonic()
+
+    with deadline(1, "run"), pytest.raises(DeadlineExceeded, match="run deadline exceeded"):
+        bucket.acquire()
+    assert time.monotonic() - start < 0.5
+
+
+def test_limiter_starts_at_the_maximum():
+    assert AdaptiveConcurrencyLimiter("http://sonarr", maximum=6).limit == 6
+    assert AdaptiveConcurrencyLimiter("http://sonarr", initial=2, maximum=6).limit == 2
+    assert AdaptiveConcurrencyLimiter("http://sonarr", initial=20, maximum=6).limit == 6
+
+
+def test_failure_decreases_the_limit_once_per_round(clock):
+    limiter = AdaptiveConcurrencyLimiter("http://sonarr", maximum=8)
+    for _ in range(7):
+        _request(limiter, clock)
+
+    _request(limiter, clock, failed=True)
+    assert limiter.limit == 5  # 8 * 0.7
+
+    for _ in range(4):
+        _request(limiter, clock, failed=True)
+    assert limiter.limit == 5
+
+
+def test_exception_in_the_slot_counts_as_failure(clock):
+    limiter = AdaptiveConcurrencyLimiter("http://sonarr", maximum=2)
+    _request(limiter, clock)
+
+    with pytest.raises(TimeoutError), limiter.slot():
+        raise TimeoutError
+
+    assert limiter.limit == 1
+
+
+def test_sustained_latency_rise_decreases_the_limit(clock):
+    limiter = AdaptiveConcurrencyLimiter("http://sonarr", maximum=8)
+    for _ in range(8):
+        _request(limiter, clock)
+    assert limiter.limit == 8
+
+    clock.latency = 0.5
+    for _ in range(16):
+        _request(limiter, clock)
+
+    assert limiter.limit < 8
+
+
+def test_small_latency_jitter_is_ignored(clock):
+    limiter = AdaptiveConcurrencyLimiter("http://sonarr", maximum=8)
+    clock.latency = 0.001
+    for _ in range(8):
+        _request(limiter, clock)
+
+    clock.latency = 0.01  # 10x slower, but only by 9 ms
+    for _ in range(32):
+        _request(limiter, clock)
+
+    assert limiter.limit == 8
+
+
+def test_limit_grows_back_additively(clock):
+    limiter = AdaptiveConcurrencyLimiter("http://sonarr", initial=2, maximum=4)
+
+    for _ in range(2):
+        _request(limiter, clock)
+    assert limiter.limit == 2  # 2.0 + 1/2 + 1/2.5 < 3
+
+    for _ in range(30):
+        _request(limiter, clock)
+    assert limiter.limit == 4
+
+
+def test_limit_never_drops_below_the_minimum(clock):
+    limiter = AdaptiveConcurrencyLimiter("http://sonarr", minimum=2, maximum=4)
+
+    for _ in range(50):
+        _request(limiter, clock, failed=True)
+
+    assert limiter.limit == 2
+
+
+def test_requests_beyond_the_limit_wait_for_a_slot():
+    limiter = AdaptiveConcurrencyLimiter("http://sonarr", maximum=1)
+    held = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with limiter.slot():
+            held.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    held.wait(5)
+    try:
+        with deadline(0.05, "run"), pytest.raises(DeadlineExceeded):
+            with limiter.slot():
+                pass
+    finally:
+        release.set()
+        holder.join()
+
+    with limiter.slot():
+        pass
+
+
+def test_registry_shares_one_throttle_per_host():
+    registry = ThrottleRegistry()
+
+    first = registry.get("http://sonarr:8989/api/v3/tag", rate_limit=5, max_concurrency=4)
+    second = registry.get("http://sonarr:8989/api/v3/indexer", rate_limit=5, max_concurrency=4)
+    other = registry.get("http://sonarr-4k:8989/api/v3/tag", rate_limit=5, max_concurrency=4)
+
+    assert first is second
+    assert other is not first
+    assert first.bucket.rate == 5
+    assert first.limiter.limit == 4
+
+
+def test_registry_without_limits_passes_requests_through():
+    host = ThrottleRegistry().get("http://sonarr:8989")
+
+    assert host.bucket is None and host.limiter is None
+    with host.request() as outcome:
+        assert not outcome.failed
+
+
+def test_registry_warns_once_about_differing_limits(caplog):
+    registry = ThrottleRegistry()
+    first = registry.get("http://sonarr:8989", max_concurrency=4)
+
+    with caplog.at_level(logging.WARNING, logger="adm.throttle"):
+        assert registry.get("http://sonarr:8989", max_concurrency=8) is first
+        registry.get("http://sonarr:8989", max_concurrency=8)
+        registry.get("http://sonarr:8989", max_concurrency=4)
+
+    warnings = [r.getMessage() for r in caplog.records if r.name == "adm.throttle"]
+    assert len(warnings) == 1
+    assert "http://sonarr:8989" in warnings[0] and "max_concurrency 4" in warnings[0]
+    assert first.limiter.limit == 4
@@ -0,0 +1,103 @@
+"""`warm_models` builds every generated model a resource type can send or receive."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+RESOURCE_TYPES = [
+    "tags",
+    "custom_formats",
+    "quality_definitions",
+    "quality_profiles",
+    "delay_profiles",
+    "indexers",
+    "download_clients",
+    "naming",
+    "media_management",
+]
+
+# Runs in a fresh interpreter, so no model was built by an earlier test or resource type
+_SCRIPT = """
+import json, sys
+from types import SimpleNamespace
+from typing import get_args
+
+from pydantic import BaseModel
+
+from src.plugins.base import warm_models
+from src.plugins.sonarr.plugin import SonarrPlugin
+
+definitions = SonarrPlugin().get_all_resource_definitions(SimpleNamespace(supports_bulk=True))
+definition = next(d for d in definitions if d.name == sys.argv[1])
+
+def models_in(annotation):
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        yield annotation
+    for arg in get_args(annotation):
+        yield from models_in(arg)
+
+reachable, pending = set(), list(definition.models)
+while pending:
+    model = pending.pop()
+    if model not in reachable:
+        reachable.add(model)
+        for field in model.model_fields.values():
+            pending.extend(models_in(field.annotation))
+
+deferred = [m.__name__ for m in definition.models if not m.__pydantic_complete__]
+warm_models([definition])
+print(json.dumps({
+    "deferred": deferred,
+    "reachable": sorted(m.__name__ for m in reachable),
+    "incomplete": sorted(m.__name__ for m in reachable if not m.__pydantic_complete__),
+}))
+"""
+
+
+def _warm_in_subprocess(resource_type: str) -> dict:
+    env = {key: value for key, value in os.environ.items() if key != "SONARR_API_EAGER_BUILD"}
+    result = subprocess.run(
+        [sys.executable, "-c", _SCRIPT, resource_type],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_resource_types_are_covered():
+    from types import SimpleNamespace
+
+    from src.plugins.sonarr.plugin import SonarrPlugin
+
+    definitions = SonarrPlugin().get_all_resource_definitions(SimpleNamespace(supports_bulk=True))
+    assert sorted(d.name for d in definitions) == sorted(RESOURCE_TYPES)
+    assert all(d.models for d in definitions)
+
+
+@pytest.mark.parametrize("resource_type", RESOURCE_TYPES)
+def test_warming_completes_every_reachable_model(resource_type):
+    result = _warm_in_subprocess(resource_type)
+
+    # Models are deferred at import, so warming is what builds them
+    assert result["deferred"]
+    assert result["reachable"]
+    assert result["incomplete"] == []
+
+
+def test_generated_sources_are_patched():
+    # postprocess.py must have nothing left to do on the committed sources
+    result = subprocess.run(
+        [sys.executable, str(ROOT / "src/plugins/sonarr/generated/postprocess.py"), "--check"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stdout